@@ -0,0 +1,77 @@
+"""
+benchmarks the startup cost of `triangle_cubature`, i.e. the wall time
+of importing the package and of integrating a single triangle in a
+fresh interpreter, as experienced by short-lived worker processes
+
+usage
+-----
+from the root of the repository, run e.g.
+
+    python benchmarks/benchmark_import.py --repeat 10 --output import.json
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+# each snippet prints the elapsed time (in seconds) and the
+# (heavy) third-party packages loaded as a side effect
+_PREAMBLE = 'import sys, time\nstart = time.perf_counter()\n'
+_EPILOGUE = (
+    'elapsed = time.perf_counter() - start\n'
+    'loaded = [name for name in ("numpy", "scipy", "p1afempy", "matplotlib")'
+    ' if name in sys.modules]\n'
+    'print(elapsed, *loaded)\n')
+SNIPPETS = {
+    'import numpy': 'import numpy\n',
+    'import triangle_cubature': 'import triangle_cubature\n',
+    'integrate one triangle': (
+        'import numpy as np\n'
+        'import triangle_cubature\n'
+        'triangle_cubature.integrate_on_triangle(\n'
+        '    f=lambda x: x[:, 0],\n'
+        '    triangle=np.array([[0., 0.], [1., 0.], [0., 1.]]),\n'
+        '    cubature_rule=triangle_cubature.CubatureRuleEnum.DAYTAYLOR)\n'),
+}
+
+
+def measure(snippet: str, repeat: int) -> dict:
+    """
+    runs the snippet `repeat` times in a fresh interpreter and
+    returns the best elapsed time and the loaded packages
+    """
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', _PREAMBLE + snippet + _EPILOGUE],
+            check=True, capture_output=True, text=True).stdout.split()
+        times.append(float(output[0]))
+    return {'wall_time': min(times), 'loaded_packages': output[1:]}
+
+
+def main(arguments: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='number of fresh interpreters per snippet, '
+             'the best time is reported (default: 5)')
+    parser.add_argument(
+        '--output', type=Path,
+        help='path to the JSON file the results are written to')
+    args = parser.parse_args(arguments)
+
+    results = {}
+    for name, snippet in SNIPPETS.items():
+        results[name] = measure(snippet=snippet, repeat=args.repeat)
+        print(f'{name:28s} {1e3 * results[name]["wall_time"]:10.2f} ms '
+              f'loaded: {", ".join(results[name]["loaded_packages"])}')
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,268 @@
+"""
+benchmarks the throughput of `integrate_on_mesh` and
+`integrate_on_triangle` for all rules in `CubatureRuleEnum`,
+meshes of increasing size and integrands of different cost
+
+usage
+-----
+from the root of the repository, run e.g.
+
+    python benchmarks/benchmark_integrate.py \\
+        --max-elements 1000000 --output results.json
+
+and compare against the results of a previous release using
+
+    python benchmarks/benchmark_integrate.py \\
+        --max-elements 1000000 --baseline results_old.json
+"""
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+import numpy as np
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+from importlib.metadata import version
+from p1afempy.io_helpers import read_mesh, read_boundary_condition
+from p1afempy.refinement import refineNVB
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.integrate import integrate_on_mesh
+from triangle_cubature.integrate import integrate_on_triangle
+from triangle_cubature.rule_factory import get_rule
+
+PATH_TO_MESH = Path(__file__).parents[1] / 'tests/data/simple_square_mesh'
+
+
+def cheap_integrand(coordinates: np.ndarray) -> np.ndarray:
+    return coordinates[:, 0] + coordinates[:, 1]
+
+
+def expensive_integrand(coordinates: np.ndarray) -> np.ndarray:
+    xs = coordinates[:, 0]
+    ys = coordinates[:, 1]
+    return np.sin(10. * xs) * np.exp(-ys**2) * np.sqrt(1. + xs * ys)
+
+
+INTEGRANDS: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    'cheap': cheap_integrand,
+    'expensive': expensive_integrand,
+}
+
+
+def get_meshes(
+        n_elements_targets: list[int],
+        max_elements: Optional[int] = None
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    returns meshes obtained by repeated uniform refinement of
+    `simple_square_mesh`, one per refinement level closest to
+    the targeted numbers of elements
+
+    notes
+    -----
+    - uniform refinement quadruples the number of elements, i.e. the
+      meshes have 2 * 4^k elements, e.g. 512, 8192, 131072, 2097152
+      and 8388608 for the targets 10^3, 10^4, ..., 10^7
+    - no mesh exceeds `max_elements` (if provided)
+    """
+    coordinates, elements = read_mesh(
+        path_to_coordinates=PATH_TO_MESH / 'coordinates.dat',
+        path_to_elements=PATH_TO_MESH / 'elements.dat')
+    boundaries = [read_boundary_condition(
+        path_to_boundary=PATH_TO_MESH / 'boundary.dat')]
+    meshes = []
+    for n_elements_target in sorted(n_elements_targets):
+        while True:
+            n_elements = elements.shape[0]
+            n_refined = 4 * n_elements
+            if max_elements is not None and n_refined > max_elements:
+                break
+            if (abs(n_refined - n_elements_target)
+                    >= abs(n_elements - n_elements_target)):
+                break
+            coordinates, elements, boundaries, _ = refineNVB(
+                coordinates=coordinates,
+                elements=elements,
+                marked_elements=np.arange(n_elements),
+                boundary_conditions=boundaries)
+        if meshes and meshes[-1][1].shape[0] == elements.shape[0]:
+            # the target is closest to the previous refinement level
+            continue
+        meshes.append((coordinates, elements))
+    return meshes
+
+
+def measure(function: Callable[[], object],
+            repeat: int) -> tuple[float, int]:
+    """
+    returns the best wall time out of `repeat` runs
+    and the peak memory (in bytes) traced during an additional run
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    function()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(times), peak_memory
+
+
+def run_benchmarks(n_elements_targets: list[int],
+                   max_elements: int,
+                   rules: list[CubatureRuleEnum],
+                   integrands: list[str],
+                   n_triangles: int,
+                   repeat: int) -> list[dict]:
+    results = []
+
+    def record(entry_point: str, rule: CubatureRuleEnum,
+               integrand: str, n_elements: int,
+               wall_time: float, peak_memory: int) -> None:
+        waip = get_rule(rule=rule).weights_and_integration_points
+        n_qp = waip.weights.shape[0]
+        result = {
+            'entry_point': entry_point,
+            'rule': rule.name,
+            'integrand': integrand,
+            'n_elements': n_elements,
+            'n_integration_points': n_qp * n_elements,
+            'wall_time': wall_time,
+            'elements_per_second': n_elements / wall_time,
+            'integration_points_per_second': n_qp * n_elements / wall_time,
+            'peak_memory': peak_memory,
+        }
+        results.append(result)
+        print(f'{entry_point:28s} {rule.name:15s} {integrand:10s} '
+              f'{n_elements:>10d} elements '
+              f'{result["elements_per_second"]:12.4g} elements/s '
+              f'{peak_memory / 2**20:10.2f} MiB')
+
+    meshes = get_meshes(
+        n_elements_targets=n_elements_targets, max_elements=max_elements)
+    for rule in rules:
+        for integrand in integrands:
+            f = INTEGRANDS[integrand]
+            for coordinates, elements in meshes:
+                for batched in [False, True]:
+                    wall_time, peak_memory = measure(
+                        lambda: integrate_on_mesh(
+                            f=f, coordinates=coordinates,
+                            elements=elements, cubature_rule=rule,
+                            batched=batched),
+                        repeat=repeat)
+                    record(
+                        entry_point=('integrate_on_mesh_batched'
+                                     if batched else 'integrate_on_mesh'),
+                        rule=rule, integrand=integrand,
+                        n_elements=elements.shape[0],
+                        wall_time=wall_time, peak_memory=peak_memory)
+
+            # single triangles, i.e. the per-call overhead
+            coordinates, elements = meshes[0]
+            triangles = coordinates[elements[:n_triangles]]
+
+            def integrate_triangle_by_triangle() -> None:
+                for triangle in triangles:
+                    integrate_on_triangle(
+                        f=f, triangle=triangle, cubature_rule=rule)
+
+            wall_time, peak_memory = measure(
+                integrate_triangle_by_triangle, repeat=repeat)
+            record(entry_point='integrate_on_triangle',
+                   rule=rule, integrand=integrand,
+                   n_elements=triangles.shape[0],
+                   wall_time=wall_time, peak_memory=peak_memory)
+    return results
+
+
+def get_metadata() -> dict:
+    return {
+        'triangle_cubature': version('triangle_cubature'),
+        'numpy': np.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def compare(results: list[dict], baseline: list[dict]) -> None:
+    """
+    prints the speedup of `results` with respect to `baseline`
+    for all benchmarks present in both
+    """
+    def key(result: dict) -> tuple:
+        return (result['entry_point'], result['rule'],
+                result['integrand'], result['n_elements'])
+
+    baseline_by_key = {key(result): result for result in baseline}
+    print('\nspeedup with respect to baseline (>1 is faster)')
+    for result in results:
+        reference = baseline_by_key.get(key(result))
+        if reference is None:
+            continue
+        speedup = reference['wall_time'] / result['wall_time']
+        memory_ratio = result['peak_memory'] / max(
+            reference['peak_memory'], 1)
+        print(f'{result["entry_point"]:28s} {result["rule"]:15s} '
+              f'{result["integrand"]:10s} {result["n_elements"]:>10d} '
+              f'speedup {speedup:6.2f} memory ratio {memory_ratio:6.2f}')
+
+
+def main(arguments: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument(
+        '--max-elements', type=int, default=100_000,
+        help='largest mesh size, meshes of about 10^3, 10^4, ... '
+             'elements not exceeding this size are benchmarked '
+             '(default: 10^5)')
+    parser.add_argument(
+        '--rules', nargs='+', default=[rule.name for rule in CubatureRuleEnum],
+        choices=[rule.name for rule in CubatureRuleEnum],
+        help='the rules to benchmark (default: all)')
+    parser.add_argument(
+        '--integrands', nargs='+', default=list(INTEGRANDS),
+        choices=list(INTEGRANDS),
+        help='the integrands to benchmark (default: all)')
+    parser.add_argument(
+        '--n-triangles', type=int, default=1000,
+        help='number of single triangles to integrate one at a time '
+             '(default: 1000)')
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='number of timed runs, the best is reported (default: 3)')
+    parser.add_argument(
+        '--output', type=Path,
+        help='path to the JSON file the results are written to')
+    parser.add_argument(
+        '--baseline', type=Path,
+        help='path to a JSON file of previous results to compare against')
+    args = parser.parse_args(arguments)
+
+    n_elements_targets = [
+        10**k for k in range(3, 8) if 10**k <= args.max_elements]
+    results = run_benchmarks(
+        n_elements_targets=n_elements_targets,
+        max_elements=args.max_elements,
+        rules=[CubatureRuleEnum[rule] for rule in args.rules],
+        integrands=args.integrands,
+        n_triangles=args.n_triangles,
+        repeat=args.repeat)
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump({'metadata': get_metadata(), 'results': results},
+                      file, indent=2)
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            compare(results=results, baseline=json.load(file)['results'])
+
+
+if __name__ == '__main__':
+    main()
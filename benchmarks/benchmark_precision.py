@@ -0,0 +1,132 @@
+"""
+benchmarks the accuracy/throughput trade-off of the floating point
+types and accumulation modes of `integrate_on_mesh`
+
+usage
+-----
+from the root of the repository, run e.g.
+
+    python benchmarks/benchmark_precision.py \\
+        --max-elements 1000000 --output precision.json
+
+notes
+-----
+for each rule, the relative error of the approximated integral of a
+smooth function on the unit square is compared to the rule's
+discretization error, i.e. the error in double precision.
+Typical observations (10^6 elements, DAYTAYLOR):
+- float32 roughly halves the wall time, as the geometry, integration
+  points and values of f need half the memory traffic
+- in float32, the relative rounding error is about 1e-8 to 1e-7,
+  dominated by the rounding of the integration points and of f,
+  while 'pairwise', 'kahan' and 'float64' accumulation keep the
+  summation error at machine precision independently of the number
+  of elements ('naive' summation may grow with it)
+- 'kahan' is the slowest mode without batching, 'pairwise' and
+  'float64' come at (almost) no cost
+hence, float32 is the better choice whenever the discretization
+error of the rule exceeds about 1e-6, e.g. for low-order rules or
+coarse meshes
+"""
+import argparse
+import json
+import time
+import numpy as np
+from pathlib import Path
+from typing import Optional
+from benchmark_integrate import get_meshes
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.integrate import integrate_on_mesh
+
+DTYPES = ['float32', 'float64']
+ACCUMULATIONS = ['naive', 'pairwise', 'kahan', 'float64']
+
+
+def integrand(coordinates: np.ndarray) -> np.ndarray:
+    return np.exp(coordinates[:, 0]) * np.cos(coordinates[:, 1])
+
+
+# integral of the integrand over the unit square
+EXACT_INTEGRAL = (np.e - 1.) * np.sin(1.)
+
+
+def run_benchmarks(n_elements_targets: list[int],
+                   max_elements: int,
+                   rules: list[CubatureRuleEnum],
+                   repeat: int) -> list[dict]:
+    results = []
+    for coordinates, elements in get_meshes(
+            n_elements_targets=n_elements_targets,
+            max_elements=max_elements):
+        for rule in rules:
+            for batched in [False, True]:
+                for dtype in DTYPES:
+                    for accumulation in ACCUMULATIONS:
+                        times = []
+                        for _ in range(repeat):
+                            start = time.perf_counter()
+                            integral = integrate_on_mesh(
+                                f=integrand,
+                                coordinates=coordinates,
+                                elements=elements,
+                                cubature_rule=rule,
+                                batched=batched,
+                                dtype=dtype,
+                                accumulation=accumulation)
+                            times.append(time.perf_counter() - start)
+                        result = {
+                            'rule': rule.name,
+                            'n_elements': elements.shape[0],
+                            'batched': batched,
+                            'dtype': dtype,
+                            'accumulation': accumulation,
+                            'wall_time': min(times),
+                            'relative_error': float(
+                                abs(integral - EXACT_INTEGRAL)
+                                / EXACT_INTEGRAL),
+                        }
+                        results.append(result)
+                        print(f'{rule.name:12s} '
+                              f'{elements.shape[0]:>10d} elements '
+                              f'{"batched" if batched else "":7s} '
+                              f'{dtype:8s} {accumulation:9s} '
+                              f'{result["wall_time"]:10.4f} s '
+                              f'relative error '
+                              f'{result["relative_error"]:9.2e}')
+    return results
+
+
+def main(arguments: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument(
+        '--max-elements', type=int, default=100_000,
+        help='largest mesh size, meshes of about 10^3, 10^4, ... '
+             'elements not exceeding this size are benchmarked '
+             '(default: 10^5)')
+    parser.add_argument(
+        '--rules', nargs='+', default=['MIDPOINT', 'DAYTAYLOR', 'DUNAVANT9'],
+        choices=[rule.name for rule in CubatureRuleEnum],
+        help='the rules to benchmark '
+             '(default: MIDPOINT DAYTAYLOR DUNAVANT9)')
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='number of timed runs, the best is reported (default: 3)')
+    parser.add_argument(
+        '--output', type=Path,
+        help='path to the JSON file the results are written to')
+    args = parser.parse_args(arguments)
+
+    results = run_benchmarks(
+        n_elements_targets=[
+            10**k for k in range(3, 8) if 10**k <= args.max_elements],
+        max_elements=args.max_elements,
+        rules=[CubatureRuleEnum[rule] for rule in args.rules],
+        repeat=args.repeat)
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
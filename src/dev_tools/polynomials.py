@@ -3,6 +3,7 @@ from p1afempy.data_structures import CoordinatesType, ElementsType
 import sympy
 from tqdm import tqdm
 from math import factorial, comb
+import triangle_cubature.polynomials
 
 
 def multinomial_coefficient(*args):
@@ -52,11 +53,16 @@ class Polynomial():
         self.monomials = monomials
 
     def eval_at(self, coordinates: CoordinatesType) -> np.ndarray:
-        # TODO get rid of this for loop
-        result = np.zeros(coordinates.shape[0])
-        for monomial in self.monomials:
-            result += monomial.eval_at(coordinates=coordinates)
-        return result
+        return self.to_array_polynomial().eval_at(coordinates=coordinates)
+
+    def to_array_polynomial(self) -> triangle_cubature.polynomials.Polynomial:
+        """
+        returns the array-backed representation of this polynomial
+        """
+        return triangle_cubature.polynomials.Polynomial(
+            x_exponents=[m.x_exponent for m in self.monomials],
+            y_exponents=[m.y_exponent for m in self.monomials],
+            coefficients=[m.coefficient for m in self.monomials])
 
     @property
     def degree(self) -> int:
@@ -223,7 +229,26 @@ def integrate_on_mesh(
         elements: ElementsType,
         vertices: CoordinatesType,
         display_progress: bool = False,
-        using_sympy: bool = True) -> float:
+        using_sympy: bool = True,
+        vectorized: bool = False) -> float:
+    """
+    integrates the polynomial on the specified mesh
+
+    polynomial: Polynomial
+        the polynomial to be integrated
+    elements: ElementsType
+        the elements of the mesh
+    vertices: CoordinatesType
+        the vertices of the mesh
+    vectorized: bool
+        if True, all elements are integrated at once using
+        `triangle_cubature.polynomials`, ignoring
+        `display_progress` and `using_sympy`
+    """
+    if vectorized:
+        return polynomial.to_array_polynomial().integrate_on_mesh(
+            coordinates=vertices, elements=elements)
+
     sum = 0.
     for element in tqdm(elements, disable=not display_progress):
         sum += integrate_on_triangle(
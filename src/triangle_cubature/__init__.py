@@ -1,4 +1,83 @@
-from .integrate import *
-from .rule_factory import *
-from .transformations import *
-from .cubature_rule import *
+"""
+cubature rules on triangles
+
+the submodules are imported lazily, i.e. on first access of one of
+their attributes, e.g. `triangle_cubature.integrate_on_mesh`,
+such that importing the package itself is cheap (PEP 562)
+"""
+from importlib import import_module
+
+# public attributes and the submodules they are defined in
+_ATTRIBUTES_BY_SUBMODULE = {
+    'integrate': [
+        'integrate_on_triangle', 'integrate_on_mesh',
+        'integrate_on_mesh_elementwise', 'integrate_on_triangles',
+        'integrate_nodal_fields_on_mesh',
+        'integrate_nodal_fields_on_mesh_elementwise'],
+    'rule_factory': [
+        'get_rule', 'get_rule_by_degree', 'get_gauss_jacobi_rule',
+        'get_gauss_legendre_rule'],
+    'transformations': [
+        'transform_weights_and_integration_points', 'transform_weights',
+        'transform_integration_points', 'get_jacobian',
+        'get_physical_triangles', 'get_jacobians',
+        'get_jacobian_determinants', 'transform_weights_batched',
+        'transform_integration_points_batched',
+        'transform_weights_and_integration_points_batched'],
+    'cubature_rule': [
+        'WeightsAndIntegrationPoints', 'CubatureRuleEnum', 'CubatureRule',
+        'LineRule'],
+    'integration_context': ['IntegrationContext'],
+    'summation': ['CompensatedSum'],
+    'streaming': [
+        'iterate_element_blocks', 'integrate_on_element_blocks',
+        'integrate_on_mesh_in_chunks'],
+    'mesh_io': [
+        'convert_dat_to_npy', 'convert_mesh_to_npy', 'read_mesh_memmap',
+        'integrate_on_mesh_from_files'],
+    'parallel': ['integrate_on_mesh_parallel'],
+    'adaptive': ['AdaptiveIntegrationResult', 'integrate_adaptively'],
+    'incremental': ['IncrementalIntegral'],
+    'polynomials': [
+        'Polynomial', 'get_reference_moments',
+        'integrate_monomials_on_mesh_elementwise',
+        'integrate_monomials_on_mesh'],
+    'basis_functions': [
+        'get_p1_basis_values', 'get_p2_basis_values', 'get_basis_values'],
+    'assembly': [
+        'get_local_load_vectors', 'get_local_mass_matrices',
+        'get_local_stiffness_matrices', 'assemble_vector',
+        'assemble_matrix'],
+    'line_integrals': [
+        'integrate_on_boundary', 'integrate_on_interior_edges',
+        'get_interior_edges', 'get_unit_normals'],
+    'profiling': ['IntegrationProfile', 'profile_integration'],
+    'workspace': ['IntegrationWorkspace'],
+    'data_structures': ['ElementsType', 'CoordinatesType', 'BoundaryType'],
+}
+
+_SUBMODULE_BY_ATTRIBUTE = {
+    attribute: submodule
+    for submodule, attributes in _ATTRIBUTES_BY_SUBMODULE.items()
+    for attribute in attributes
+}
+
+__all__ = list(_SUBMODULE_BY_ATTRIBUTE)
+
+
+def __getattr__(name: str):
+    if name in _ATTRIBUTES_BY_SUBMODULE:
+        return import_module(f'{__name__}.{name}')
+    submodule = _SUBMODULE_BY_ATTRIBUTE.get(name)
+    if submodule is None:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(f'{__name__}.{submodule}'), name)
+    # subsequent accesses do not go through `__getattr__` anymore
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(
+        list(globals()) + __all__ + list(_ATTRIBUTES_BY_SUBMODULE))
@@ -0,0 +1,153 @@
+from triangle_cubature.data_structures import \
+    CoordinatesType, ElementsType
+from triangle_cubature.cubature_rule \
+    import CubatureRuleEnum
+from triangle_cubature.rule_factory import get_rule
+from triangle_cubature.integrate import integrate_on_triangles
+from dataclasses import dataclass
+from typing import Callable, Union
+import numpy as np
+
+
+@dataclass(frozen=True)
+class AdaptiveIntegrationResult:
+    value: Union[float, np.ndarray]
+    """the approximated value of the integral"""
+    error_estimate: float
+    """the estimated (absolute) error of `value`"""
+    n_function_evaluations: int
+    """the total number of points f has been evaluated at"""
+    n_triangles: int
+    """the number of triangles of the final (local) refinement"""
+    converged: bool
+    """whether `error_estimate <= tolerance` has been reached"""
+
+
+def integrate_adaptively(
+        f: Callable[[CoordinatesType], np.ndarray],
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        tolerance: float,
+        low_rule: Union[CubatureRuleEnum, int] = CubatureRuleEnum.RADON5,
+        high_rule: Union[CubatureRuleEnum, int] = CubatureRuleEnum.DUNAVANT9,
+        max_iterations: int = 30,
+        batched: bool = False) -> AdaptiveIntegrationResult:
+    """
+    approximates the integral of the function provided over
+    the mesh at hand up to the specified (absolute) tolerance,
+    refining only the triangles with large error estimates
+
+    parameters
+    ----------
+    f: Callable[[CoordinatesType], np.ndarray]
+        the function to be integrated
+    coordinates: CoordinatesType
+        vertices of the mesh
+    elements: ElementsType
+        the elements of the mesh
+    tolerance: float
+        the (absolute) tolerance of the global error estimate
+    low_rule: CubatureRuleEnum | int
+        the lower order rule used for the error estimation
+    high_rule: CubatureRuleEnum | int
+        the higher order rule used for the approximation
+    max_iterations: int
+        maximal number of refinement iterations
+    batched: bool
+        if True, f is called once per rule and iteration
+        on all integration points of the triangles to be integrated
+
+    returns
+    -------
+    AdaptiveIntegrationResult: the approximated value of the integral
+        together with its error estimate and the spent effort
+
+    notes
+    -----
+    - the local error on a triangle K is estimated by
+      |Q_high(K) - Q_low(K)|, i.e. the estimate is
+      conservative for the returned sum of Q_high(K)
+    - in each iteration, all triangles whose local error estimate
+      exceeds the equidistributed share `tolerance / n_triangles`
+      are subdivided into four congruent triangles (red refinement);
+      only the new triangles are integrated again
+    - f may return values of shape (N,) or (N, ...), in the latter
+      case the local error is measured in the maximum norm
+    """
+    n_points = (
+        get_rule(low_rule).weights_and_integration_points.weights.shape[0]
+        + get_rule(high_rule).weights_and_integration_points.weights.shape[0])
+
+    triangles = coordinates[elements]
+    local_integrals, local_errors = _get_local_integrals_and_errors(
+        f=f, triangles=triangles, low_rule=low_rule,
+        high_rule=high_rule, batched=batched)
+    n_function_evaluations = n_points * triangles.shape[0]
+
+    converged = False
+    for iteration in range(max_iterations + 1):
+        if np.sum(local_errors) <= tolerance:
+            converged = True
+            break
+        if iteration == max_iterations:
+            break
+
+        marked = local_errors > tolerance / triangles.shape[0]
+        children = _refine_red(triangles[marked])
+        children_integrals, children_errors = \
+            _get_local_integrals_and_errors(
+                f=f, triangles=children, low_rule=low_rule,
+                high_rule=high_rule, batched=batched)
+        n_function_evaluations += n_points * children.shape[0]
+
+        triangles = np.concatenate([triangles[~marked], children])
+        local_integrals = np.concatenate(
+            [local_integrals[~marked], children_integrals])
+        local_errors = np.concatenate(
+            [local_errors[~marked], children_errors])
+
+    return AdaptiveIntegrationResult(
+        value=np.sum(local_integrals, axis=0),
+        error_estimate=float(np.sum(local_errors)),
+        n_function_evaluations=n_function_evaluations,
+        n_triangles=triangles.shape[0],
+        converged=converged)
+
+
+def _get_local_integrals_and_errors(
+        f: Callable[[CoordinatesType], np.ndarray],
+        triangles: np.ndarray,
+        low_rule: Union[CubatureRuleEnum, int],
+        high_rule: Union[CubatureRuleEnum, int],
+        batched: bool) -> tuple[np.ndarray, np.ndarray]:
+    """
+    returns the local integrals using the high order rule
+    and the local error estimates |Q_high(K) - Q_low(K)|
+    """
+    low = integrate_on_triangles(
+        f=f, triangles=triangles, cubature_rule=low_rule,
+        elementwise=True, batched=batched)
+    high = integrate_on_triangles(
+        f=f, triangles=triangles, cubature_rule=high_rule,
+        elementwise=True, batched=batched)
+    errors = np.abs(high - low).reshape(triangles.shape[0], -1)
+    return high, np.max(errors, axis=1, initial=0.)
+
+
+def _refine_red(triangles: np.ndarray) -> np.ndarray:
+    """
+    subdivides each of the (N, 3, 2) triangles into four congruent
+    triangles by connecting the edge midpoints, preserving the
+    orientation, i.e. returns an array of shape (4N, 3, 2)
+    """
+    p1 = triangles[:, 0, :]
+    p2 = triangles[:, 1, :]
+    p3 = triangles[:, 2, :]
+    m12 = (p1 + p2) / 2.
+    m23 = (p2 + p3) / 2.
+    m31 = (p3 + p1) / 2.
+    return np.concatenate([
+        np.stack([p1, m12, m31], axis=1),
+        np.stack([m12, p2, m23], axis=1),
+        np.stack([m31, m23, p3], axis=1),
+        np.stack([m12, m23, m31], axis=1)])
@@ -0,0 +1,221 @@
+from triangle_cubature.data_structures import \
+    CoordinatesType, ElementsType
+from triangle_cubature.cubature_rule import \
+    CubatureRuleEnum, WeightsAndIntegrationPoints
+from triangle_cubature.rule_factory import get_rule
+from triangle_cubature.basis_functions import get_basis_values
+from triangle_cubature.integrate import \
+    _get_element_geometry, _get_physical_points
+from functools import lru_cache
+from typing import Callable, Union
+from scipy.sparse import coo_matrix, csr_matrix
+import numpy as np
+
+
+# gradients of the P1 basis functions on the reference triangle,
+# i.e. `_REFERENCE_GRADIENTS[i]` is the gradient of the i-th one
+_REFERENCE_GRADIENTS = np.array([
+    [-1., -1.],
+    [1., 0.],
+    [0., 1.]
+])
+_REFERENCE_GRADIENTS.flags.writeable = False
+
+
+def get_local_load_vectors(
+        f: Callable[[CoordinatesType], np.ndarray],
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        cubature_rule: Union[CubatureRuleEnum, int],
+        batched: bool = False) -> np.ndarray:
+    """
+    approximates the local load vectors `int_K f phi_i`
+    for all elements K and the P1 basis functions phi_i
+    associated to the vertices of K
+
+    parameters
+    ----------
+    f: Callable[[CoordinatesType], np.ndarray]
+        the (scalar) function to be integrated against
+        the basis functions
+    coordinates: CoordinatesType
+        vertices of the mesh
+    elements: ElementsType
+        the elements of the mesh
+    cubature_rule: CubatureRuleEnum | int
+        the cubature rule to be used or the required
+        degree of exactness, see `get_rule_by_degree`
+    batched: bool
+        if True, f is called once on all integration points
+        instead of once per integration point of the cubature rule
+
+    returns
+    -------
+    np.ndarray: array of shape (n_elements, 3), where `result[k, i]`
+        is the integral of f times the basis function associated to
+        the vertex `elements[k, i]` on the k-th element
+
+    notes
+    -----
+    - the basis functions are tabulated only once per rule,
+      see `get_basis_values`
+    """
+    c1, d21, d31, areas_2 = _get_element_geometry(
+        coordinates=coordinates, elements=elements)
+    waip = get_rule(rule=cubature_rule).weights_and_integration_points
+    f_on_points = _get_values_on_physical_points(
+        f=f, c1=c1, d21=d21, d31=d31, waip=waip, batched=batched)
+    basis_values = get_basis_values(cubature_rule=cubature_rule)
+
+    # sum_q w_q f(x_q^K) phi_i(x_q)
+    local_load_vectors = (f_on_points.T * waip.weights) @ basis_values
+    return local_load_vectors * areas_2[:, np.newaxis]
+
+
+def get_local_mass_matrices(
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        cubature_rule: Union[CubatureRuleEnum, int] = 2) -> np.ndarray:
+    """
+    returns the local mass matrices `int_K phi_i phi_j` for all
+    elements K and the P1 basis functions phi_i, phi_j
+    associated to the vertices of K
+
+    parameters
+    ----------
+    coordinates: CoordinatesType
+        vertices of the mesh
+    elements: ElementsType
+        the elements of the mesh
+    cubature_rule: CubatureRuleEnum | int
+        the cubature rule to be used or the required
+        degree of exactness, see `get_rule_by_degree`,
+        defaults to exact integration
+
+    returns
+    -------
+    np.ndarray: array of shape (n_elements, 3, 3)
+
+    notes
+    -----
+    - as the integrand does not depend on the element, the reference
+      mass matrix is computed only once per rule and scaled by the
+      doubled element areas
+    """
+    _, _, _, areas_2 = _get_element_geometry(
+        coordinates=coordinates, elements=elements)
+    reference_mass_matrix = _get_reference_mass_matrix(
+        cubature_rule=cubature_rule)
+    return areas_2[:, np.newaxis, np.newaxis] * reference_mass_matrix
+
+
+def get_local_stiffness_matrices(
+        coordinates: CoordinatesType,
+        elements: ElementsType) -> np.ndarray:
+    """
+    returns the local stiffness matrices `int_K grad phi_i . grad phi_j`
+    for all elements K and the P1 basis functions phi_i, phi_j
+    associated to the vertices of K
+
+    parameters
+    ----------
+    coordinates: CoordinatesType
+        vertices of the mesh
+    elements: ElementsType
+        the elements of the mesh
+
+    returns
+    -------
+    np.ndarray: array of shape (n_elements, 3, 3)
+
+    notes
+    -----
+    - the gradients of P1 functions are constant on each element,
+      i.e. no cubature rule is needed
+    """
+    _, d21, d31, areas_2 = _get_element_geometry(
+        coordinates=coordinates, elements=elements)
+
+    # inverse transposed jacobians (times the determinants)
+    # of the affine transformations to the reference triangle
+    inverse_jacobians_t = np.empty((areas_2.shape[0], 2, 2))
+    inverse_jacobians_t[:, 0, 0] = d31[:, 1]
+    inverse_jacobians_t[:, 0, 1] = -d21[:, 1]
+    inverse_jacobians_t[:, 1, 0] = -d31[:, 0]
+    inverse_jacobians_t[:, 1, 1] = d21[:, 0]
+
+    # gradients[k, i] = areas_2[k] * (grad phi_i on the k-th element)
+    gradients = np.einsum(
+        'kab,ib->kia', inverse_jacobians_t, _REFERENCE_GRADIENTS)
+    return (gradients @ gradients.transpose(0, 2, 1)) / (
+        2. * areas_2[:, np.newaxis, np.newaxis])
+
+
+def assemble_vector(local_vectors: np.ndarray,
+                    elements: ElementsType,
+                    n_vertices: int) -> np.ndarray:
+    """
+    assembles the global vector of shape (n_vertices,)
+    from the local vectors of shape (n_elements, 3),
+    e.g. as returned by `get_local_load_vectors`
+    """
+    return np.bincount(
+        elements.ravel(), weights=local_vectors.ravel(),
+        minlength=n_vertices)
+
+
+def assemble_matrix(local_matrices: np.ndarray,
+                    elements: ElementsType,
+                    n_vertices: int) -> csr_matrix:
+    """
+    assembles the global sparse matrix of shape (n_vertices, n_vertices)
+    from the local matrices of shape (n_elements, 3, 3),
+    e.g. as returned by `get_local_mass_matrices`
+
+    notes
+    -----
+    - entries belonging to the same pair of vertices are summed up
+      during the conversion to CSR format
+    """
+    rows = np.repeat(elements, 3, axis=1)
+    columns = np.tile(elements, (1, 3))
+    return coo_matrix(
+        (local_matrices.ravel(), (rows.ravel(), columns.ravel())),
+        shape=(n_vertices, n_vertices)).tocsr()
+
+
+@lru_cache(maxsize=None)
+def _get_reference_mass_matrix(
+        cubature_rule: Union[CubatureRuleEnum, int]) -> np.ndarray:
+    """
+    returns the (read-only) matrix `sum_q w_q phi_i(x_q) phi_j(x_q)`
+    on the reference triangle
+    """
+    waip = get_rule(rule=cubature_rule).weights_and_integration_points
+    basis_values = get_basis_values(cubature_rule=cubature_rule)
+    reference_mass_matrix = (basis_values.T * waip.weights) @ basis_values
+    reference_mass_matrix.flags.writeable = False
+    return reference_mass_matrix
+
+
+def _get_values_on_physical_points(
+        f: Callable[[CoordinatesType], np.ndarray],
+        c1: np.ndarray,
+        d21: np.ndarray,
+        d31: np.ndarray,
+        waip: WeightsAndIntegrationPoints,
+        batched: bool = False) -> np.ndarray:
+    """
+    returns the values of f on the physical integration points
+    as array of shape (n_qp, n_elements)
+    """
+    if batched:
+        points = _get_physical_points(
+            c1=c1, d21=d21, d31=d31,
+            integration_points=waip.integration_points)
+        return f(points.reshape(-1, 2)).reshape(points.shape[:2])
+
+    f_on_points = np.empty((waip.weights.shape[0], c1.shape[0]))
+    for k, (x_hat, y_hat) in enumerate(waip.integration_points):
+        f_on_points[k] = f(c1 + x_hat * d21 + y_hat * d31)
+    return f_on_points
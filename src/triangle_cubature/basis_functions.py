@@ -0,0 +1,99 @@
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.rule_factory import get_rule
+from functools import lru_cache
+from typing import Union
+import numpy as np
+
+
+def get_p1_basis_values(points: np.ndarray) -> np.ndarray:
+    """
+    evaluates the P1 (hat) basis functions of the reference triangle
+    conv{(0, 0), (1, 0), (0, 1)} at the points at hand
+
+    parameters
+    ----------
+    points: np.ndarray
+        points on the reference triangle, i.e. array of shape (N, 2)
+
+    returns
+    -------
+    np.ndarray: array of shape (N, 3), where `result[q, i]` is the
+        value of the basis function associated to the i-th vertex
+        at the q-th point
+    """
+    s = points[:, 0]
+    t = points[:, 1]
+    return np.column_stack([1. - s - t, s, t])
+
+
+def get_p2_basis_values(points: np.ndarray) -> np.ndarray:
+    """
+    evaluates the P2 basis functions of the reference triangle
+    conv{(0, 0), (1, 0), (0, 1)} at the points at hand
+
+    parameters
+    ----------
+    points: np.ndarray
+        points on the reference triangle, i.e. array of shape (N, 2)
+
+    returns
+    -------
+    np.ndarray: array of shape (N, 6), where `result[q, i]` is the
+        value of the i-th basis function at the q-th point
+
+    notes
+    -----
+    - the first three basis functions are associated to the vertices,
+      the last three to the midpoints of the edges
+      (v0, v1), (v1, v2) and (v2, v0), i.e. in the order
+      of `element2edges` as provided by p1afempy
+    """
+    lambdas = get_p1_basis_values(points)
+    l0, l1, l2 = lambdas[:, 0], lambdas[:, 1], lambdas[:, 2]
+    return np.column_stack([
+        l0 * (2. * l0 - 1.),
+        l1 * (2. * l1 - 1.),
+        l2 * (2. * l2 - 1.),
+        4. * l0 * l1,
+        4. * l1 * l2,
+        4. * l2 * l0])
+
+
+@lru_cache(maxsize=None)
+def get_basis_values(
+        cubature_rule: Union[CubatureRuleEnum, int],
+        polynomial_degree: int = 1) -> np.ndarray:
+    """
+    returns the values of the P1 or P2 basis functions of the
+    reference triangle at the integration points of the cubature rule
+
+    parameters
+    ----------
+    cubature_rule: CubatureRuleEnum | int
+        the cubature rule to be used or the required
+        degree of exactness, see `get_rule_by_degree`
+    polynomial_degree: int
+        1 for P1 and 2 for P2 basis functions
+
+    returns
+    -------
+    np.ndarray: array of shape (n_qp, 3) or (n_qp, 6), respectively,
+        see `get_p1_basis_values` and `get_p2_basis_values`
+
+    notes
+    -----
+    - the tabulation is computed only once per rule and
+      polynomial degree, i.e. the returned array is read-only
+    """
+    integration_points = get_rule(
+        rule=cubature_rule).weights_and_integration_points.integration_points
+    if polynomial_degree == 1:
+        basis_values = get_p1_basis_values(integration_points)
+    elif polynomial_degree == 2:
+        basis_values = get_p2_basis_values(integration_points)
+    else:
+        raise ValueError(
+            f'polynomial degree {polynomial_degree} is not supported, '
+            'only P1 (1) and P2 (2) basis functions are available.')
+    basis_values.flags.writeable = False
+    return basis_values
@@ -1,10 +1,10 @@
 from enum import Enum
-from p1afempy.data_structures import CoordinatesType
+from triangle_cubature.data_structures import CoordinatesType
 import numpy as np
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class WeightsAndIntegrationPoints:
     weights: np.ndarray
     integration_points: CoordinatesType
@@ -15,10 +15,28 @@ class CubatureRuleEnum(Enum):
     LAUFFER_LINEAR = 2
     SMPLX1 = 3
     DAYTAYLOR = 4
+    DUNAVANT4 = 5
+    RADON5 = 6
+    GATERMANN7 = 7
+    DUNAVANT8 = 8
+    DUNAVANT9 = 9
 
 
-@dataclass
+@dataclass(frozen=True)
 class CubatureRule:
     weights_and_integration_points: WeightsAndIntegrationPoints
     degree_of_exactness: int
     name: str
+
+
+@dataclass(frozen=True)
+class LineRule:
+    """
+    quadrature rule on the unit interval [0, 1], i.e. the
+    integration points are parameters t of shape (n,) and
+    not coordinates of shape (n, 2) as for `CubatureRule`
+    """
+    weights: np.ndarray
+    integration_points: np.ndarray
+    degree_of_exactness: int
+    name: str
@@ -0,0 +1,153 @@
+from triangle_cubature.data_structures import \
+    CoordinatesType, ElementsType
+from triangle_cubature.cubature_rule \
+    import CubatureRuleEnum
+from triangle_cubature.integrate import integrate_on_mesh_elementwise
+from triangle_cubature.summation import CompensatedSum
+from typing import Callable, Optional, Union
+import numpy as np
+
+
+class IncrementalIntegral:
+    """
+    integral of a fixed function over a mesh, holding the
+    integrals on each element such that, after local changes of the mesh
+    (e.g. refinement), only the new elements need to be integrated
+
+    usage
+    -----
+    >>> integral = IncrementalIntegral(
+    ...     f=f, coordinates=coordinates, elements=elements,
+    ...     cubature_rule=CubatureRuleEnum.DAYTAYLOR)
+    >>> integral.total
+    >>> # replacing the marked elements by their children
+    >>> integral.replace_elements(
+    ...     removed_elements=marked_elements,
+    ...     coordinates=new_coordinates,
+    ...     new_elements=children)
+    >>> integral.total
+
+    notes
+    -----
+    - `elements` and `local_integrals` are kept aligned, i.e.
+      `local_integrals[k]` is the integral on `elements[k]`
+    - the total is updated using compensated summation
+    """
+    f: Callable[[CoordinatesType], np.ndarray]
+    cubature_rule: CubatureRuleEnum
+    batched: bool
+    coordinates: CoordinatesType
+    elements: ElementsType
+    local_integrals: np.ndarray
+
+    def __init__(self,
+                 f: Callable[[CoordinatesType], np.ndarray],
+                 coordinates: CoordinatesType,
+                 elements: ElementsType,
+                 cubature_rule: Union[CubatureRuleEnum, int],
+                 batched: bool = False) -> None:
+        """
+        parameters
+        ----------
+        f: Callable[[CoordinatesType], np.ndarray]
+            the function to be integrated
+        coordinates: CoordinatesType
+            vertices of the mesh
+        elements: ElementsType
+            the elements of the mesh
+        cubature_rule: CubatureRuleEnum | int
+            the cubature rule to be used or the required
+            degree of exactness, see `get_rule_by_degree`
+        batched: bool
+            if True, f is called once on all integration points
+            of the elements to be integrated
+        """
+        self.f = f
+        self.cubature_rule = cubature_rule
+        self.batched = batched
+        self.coordinates = coordinates
+        self.elements = elements
+        self.local_integrals = self._integrate(elements=elements)
+        self._total = CompensatedSum()
+        self._total.add(np.sum(self.local_integrals, axis=0))
+
+    @property
+    def total(self) -> Union[float, np.ndarray]:
+        """the integral over the whole mesh"""
+        return self._total.value
+
+    def reintegrate(self,
+                    marked_elements: np.ndarray,
+                    coordinates: Optional[CoordinatesType] = None) -> None:
+        """
+        integrates again on the marked elements only, e.g. after
+        their vertices have been moved or f has changed locally
+
+        parameters
+        ----------
+        marked_elements: np.ndarray
+            indices or boolean mask of the elements to integrate on,
+            where repeated indices are integrated once
+        coordinates: Optional[CoordinatesType]
+            new vertices of the mesh, defaults to the current ones
+        """
+        if coordinates is not None:
+            self.coordinates = coordinates
+        # as boolean mask, such that each element is updated only once
+        marked = np.zeros(self.elements.shape[0], dtype=bool)
+        marked[marked_elements] = True
+        marked_elements = marked
+        updated = self._integrate(
+            elements=self.elements, marked_elements=marked_elements)
+        self._total.add(np.sum(
+            updated - self.local_integrals[marked_elements], axis=0))
+        self.local_integrals[marked_elements] = updated
+
+    def replace_elements(self,
+                         removed_elements: np.ndarray,
+                         coordinates: CoordinatesType,
+                         new_elements: ElementsType) -> None:
+        """
+        removes the specified elements and appends the new ones,
+        where only the new elements are integrated
+
+        parameters
+        ----------
+        removed_elements: np.ndarray
+            indices or boolean mask of the elements to be removed,
+            e.g. the elements marked for refinement
+        coordinates: CoordinatesType
+            vertices of the changed mesh, where the indices of the
+            existing vertices must not change (e.g. new vertices appended)
+        new_elements: ElementsType
+            the elements to be added, e.g. the children of the
+            removed elements
+
+        notes
+        -----
+        - the kept elements retain their order and the new
+          elements are appended, see `elements`
+        """
+        self.coordinates = coordinates
+        kept = np.ones(self.elements.shape[0], dtype=bool)
+        kept[removed_elements] = False
+
+        new_local_integrals = self._integrate(elements=new_elements)
+        self._total.add(-np.sum(self.local_integrals[~kept], axis=0))
+        self._total.add(np.sum(new_local_integrals, axis=0))
+
+        self.elements = np.concatenate([self.elements[kept], new_elements])
+        self.local_integrals = np.concatenate(
+            [self.local_integrals[kept], new_local_integrals])
+
+    def _integrate(self,
+                   elements: ElementsType,
+                   marked_elements: Optional[np.ndarray] = None
+                   ) -> np.ndarray:
+        return integrate_on_mesh_elementwise(
+            f=self.f,
+            coordinates=self.coordinates,
+            elements=elements,
+            cubature_rule=self.cubature_rule,
+            marked_elements=marked_elements,
+            batched=self.batched)
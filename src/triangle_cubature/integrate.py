@@ -1,18 +1,25 @@
-from p1afempy.data_structures import \
+from triangle_cubature.data_structures import \
     CoordinatesType, ElementsType
 from triangle_cubature.cubature_rule \
-    import CubatureRuleEnum
+    import CubatureRuleEnum, WeightsAndIntegrationPoints
 from triangle_cubature.transformations import \
-    transform_weights_and_integration_points
+    transform_weights_and_integration_points, get_jacobians, \
+    get_jacobian_determinants
 from triangle_cubature.rule_factory import get_rule
-from typing import Callable
+from triangle_cubature.basis_functions import get_basis_values
+from triangle_cubature.profiling import \
+    _DISABLED_PROFILE, _get_active_profile
+from triangle_cubature.summation import compensated_sum
+from triangle_cubature.workspace import IntegrationWorkspace
+from typing import Callable, Optional, Sequence, Union
 import numpy as np
 
 
 def integrate_on_triangle(
         f: Callable[[CoordinatesType], np.ndarray],
         triangle: CoordinatesType,
-        cubature_rule: CubatureRuleEnum) -> float:
+        cubature_rule: Union[CubatureRuleEnum, int]
+) -> Union[float, np.ndarray]:
     """
     approximates the integral of the function provided
     on the triangle at hand using the specified cubature rule
@@ -24,31 +31,61 @@ def integrate_on_triangle(
     triangle: CoordinatesType
         the coordinates of the triangle's vertices
         in counter-clockwise order
-    cubature_rule: CubatureRuleEnum
-        the cubature rule to be used
+    cubature_rule: CubatureRuleEnum | int
+        the cubature rule to be used or the required
+        degree of exactness, see `get_rule_by_degree`
 
     returns
     -------
-    float: the approximated value of the integral
+    float | np.ndarray: the approximated value of the integral
 
     notes
     -----
     - the function f must be able to
       handle inputs of shape (N, 2), i.e.
       coordinates as array
+    - f may return values of shape (N,) or (N, ...), e.g. (N, k)
+      for k integrands at once, in the latter case the result
+      has shape (...)
+    - if f is a `triangle_cubature.polynomials.Polynomial` (or provides
+      `to_array_polynomial`, e.g. `dev_tools.polynomials.Polynomial`),
+      its integral is computed exactly from the vertex coordinates,
+      i.e. f is never evaluated and the cubature rule is not used
     """
+    polynomial = _as_polynomial(f)
+    if polynomial is not None:
+        return polynomial.integrate_on_mesh(
+            coordinates=triangle, elements=np.array([[0, 1, 2]]))
+
+    profile = _get_active_profile()
     waip = get_rule(rule=cubature_rule).weights_and_integration_points
-    transformed = transform_weights_and_integration_points(
-        weights_and_integration_points=waip,
-        physical_triangle=triangle)
-    return np.dot(transformed.weights, f(transformed.integration_points))
+    with profile.phase('points'):
+        transformed = transform_weights_and_integration_points(
+            weights_and_integration_points=waip,
+            physical_triangle=triangle)
+    profile.record_allocation(
+        transformed.weights, transformed.integration_points)
+    with profile.phase('evaluation'):
+        f_on_integration_points = f(transformed.integration_points)
+    profile.record_evaluation(f_on_integration_points)
+    with profile.phase('reduction'):
+        integral = np.tensordot(
+            transformed.weights, f_on_integration_points, axes=1)[()]
+    return integral
 
 
 def integrate_on_mesh(
         f: Callable[[CoordinatesType], np.ndarray],
         coordinates: CoordinatesType,
         elements: ElementsType,
-        cubature_rule: CubatureRuleEnum) -> float:
+        cubature_rule: Union[CubatureRuleEnum, int],
+        marked_elements: Optional[np.ndarray] = None,
+        batched: bool = False,
+        batch_size: Optional[int] = None,
+        dtype: Optional[np.dtype] = None,
+        accumulation: str = 'naive',
+        workspace: Optional[IntegrationWorkspace] = None
+) -> Union[float, np.ndarray]:
     """
     approximates the integral of the function provided
     over the mesh at hand using the specified cubature rule
@@ -61,20 +98,509 @@ def integrate_on_mesh(
         vrtices of the mesh
     elements: ElementsType
         the elements of the mesh
-    cubature_rule: CubatureRuleEnum
-        the cubature rule to be used
+    cubature_rule: CubatureRuleEnum | int
+        the cubature rule to be used or the required
+        degree of exactness, see `get_rule_by_degree`
+    marked_elements: Optional[np.ndarray]
+        indices or boolean mask of the elements to integrate on,
+        defaults to all elements of the mesh
+    batched: bool
+        if True, f is called once on all integration points
+        of (a batch of) the elements instead of once per
+        integration point of the cubature rule
+    batch_size: Optional[int]
+        only used if `batched`, maximal number of elements
+        per call of f, defaults to all elements at once
+    dtype: Optional[np.dtype]
+        floating point type of the geometry and the integration
+        points, e.g. np.float32 to halve the memory traffic,
+        defaults to the type of the coordinates
+    accumulation: str
+        how the contributions of the elements are summed up, i.e.
+        'naive' (dot products in `dtype`),
+        'pairwise' (pairwise summation in `dtype`),
+        'kahan' (compensated summation in `dtype`, see `compensated_sum`)
+        or 'float64' (pairwise summation in double precision)
+    workspace: Optional[IntegrationWorkspace]
+        if provided, the geometry, the integration points and
+        all other temporaries are computed in place in the buffers
+        of the workspace, which are reused by subsequent calls
 
     returns
     -------
-    float: the approximated value of the integral
+    float | np.ndarray: the approximated value of the integral
 
     notes
     -----
     - the function f must be able to
       handle inputs of shape (N, 2), i.e.
       coordinates as array
+    - f may return values of shape (N,) or (N, ...), e.g. (N, k)
+      for k integrands at once, in the latter case the result
+      has shape (...)
+    - in batched mode, peak memory is proportional to
+      `batch_size` times the number of integration points
+    - if f is a `triangle_cubature.polynomials.Polynomial` (or provides
+      `to_array_polynomial`, e.g. `dev_tools.polynomials.Polynomial`),
+      its integral is computed exactly from the vertex coordinates,
+      i.e. f is never evaluated and the cubature rule is not used
+    - in single precision, the rounding error of the naive summation
+      grows with the number of elements, whereas it stays close to
+      machine precision for all other accumulation modes, see
+      `benchmarks/benchmark_precision.py` for the trade-off
+    - when using a workspace, f must not keep references
+      to the arrays of points passed to it, as they are overwritten
+    """
+    if accumulation not in _ACCUMULATIONS:
+        raise ValueError(
+            f'unknown accumulation {accumulation!r}, '
+            f'must be one of {_ACCUMULATIONS}.')
+
+    polynomial = _as_polynomial(f)
+    if polynomial is not None:
+        if marked_elements is not None:
+            elements = elements[marked_elements]
+        return polynomial.integrate_on_mesh(
+            coordinates=coordinates, elements=elements)
+
+    waip = get_rule(rule=cubature_rule).weights_and_integration_points
+    if dtype is not None:
+        waip = WeightsAndIntegrationPoints(
+            weights=waip.weights.astype(dtype),
+            integration_points=waip.integration_points.astype(dtype))
+
+    if workspace is None:
+        if dtype is not None:
+            coordinates = np.asarray(coordinates, dtype=dtype)
+        c1, d21, d31, areas_2 = _get_element_geometry(
+            coordinates=coordinates, elements=elements,
+            marked_elements=marked_elements)
+    else:
+        c1, d21, d31, areas_2 = _get_element_geometry_in_workspace(
+            coordinates=coordinates, elements=elements,
+            workspace=workspace, marked_elements=marked_elements,
+            dtype=dtype)
+
+    profile = _get_active_profile()
+    if batched:
+        weighted_sums = _get_batched_weighted_sums(
+            f=f, c1=c1, d21=d21, d31=d31, waip=waip,
+            batch_size=batch_size, workspace=workspace)
+        with profile.phase('reduction'):
+            integral = _accumulate_over_elements(
+                values=weighted_sums, areas_2=areas_2,
+                accumulation=accumulation, workspace=workspace)
+        return integral
+
+    weights = waip.weights
+    integration_points = waip.integration_points
+    points, scratch = None, None
+    if workspace is not None:
+        points = workspace.get_buffer('points', c1.shape, c1.dtype)
+        scratch = workspace.get_buffer('scratch', c1.shape, c1.dtype)
+
+    # contributions of the integration points to the integral,
+    # summed up directly or, if not 'naive', collected first
+    sum = 0.
+    partial_sums = []
+    if profile is _DISABLED_PROFILE:
+        # same as below, without entering any (no-op) phases
+        for weight, integration_point in zip(weights, integration_points):
+            x_hat, y_hat = integration_point
+            if workspace is None:
+                transformed_integration_points = (
+                    c1 + x_hat * d21 + y_hat * d31)
+            else:
+                transformed_integration_points = _transform_points(
+                    c1=c1, d21=d21, d31=d31, x_hat=x_hat, y_hat=y_hat,
+                    out=points, scratch=scratch)
+            f_on_integration_points = f(transformed_integration_points)
+            if accumulation == 'naive':
+                sum += weight * _sum_over_elements(
+                    values=f_on_integration_points, areas_2=areas_2)
+            else:
+                partial_sums.append(weight * _accumulate_over_elements(
+                    values=f_on_integration_points, areas_2=areas_2,
+                    accumulation=accumulation, workspace=workspace))
+        if accumulation == 'naive':
+            return sum
+        return _accumulate(
+            values=np.stack(partial_sums), accumulation=accumulation)
+
+    for weight, integration_point in zip(weights, integration_points):
+        x_hat, y_hat = integration_point
+        with profile.phase('points'):
+            transformed_integration_points = _transform_points(
+                c1=c1, d21=d21, d31=d31, x_hat=x_hat, y_hat=y_hat,
+                out=points, scratch=scratch)
+        if workspace is None:
+            profile.record_allocation(transformed_integration_points)
+        with profile.phase('evaluation'):
+            f_on_integration_points = f(transformed_integration_points)
+        profile.record_evaluation(f_on_integration_points)
+        with profile.phase('reduction'):
+            if accumulation == 'naive':
+                sum += weight * _sum_over_elements(
+                    values=f_on_integration_points, areas_2=areas_2)
+            else:
+                partial_sums.append(weight * _accumulate_over_elements(
+                    values=f_on_integration_points, areas_2=areas_2,
+                    accumulation=accumulation, workspace=workspace))
+    if accumulation == 'naive':
+        return sum
+    with profile.phase('reduction'):
+        integral = _accumulate(
+            values=np.stack(partial_sums), accumulation=accumulation)
+    return integral
+
+
+def integrate_on_mesh_elementwise(
+        f: Callable[[CoordinatesType], np.ndarray],
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        cubature_rule: Union[CubatureRuleEnum, int],
+        marked_elements: Optional[np.ndarray] = None,
+        batched: bool = False,
+        batch_size: Optional[int] = None) -> np.ndarray:
     """
+    approximates the integral of the function provided
+    on each element of the mesh at hand using the specified
+    cubature rule
+
+    parameters
+    ----------
+    f: Callable[[CoordinatesType], np.ndarray]
+        the function to be integrated
+    coordinates: CoordinatesType
+        vertices of the mesh
+    elements: ElementsType
+        the elements of the mesh
+    cubature_rule: CubatureRuleEnum | int
+        the cubature rule to be used or the required
+        degree of exactness, see `get_rule_by_degree`
+    marked_elements: Optional[np.ndarray]
+        indices or boolean mask of the elements to integrate on,
+        defaults to all elements of the mesh
+    batched: bool
+        if True, f is called once on all integration points
+        of (a batch of) the elements instead of once per
+        integration point of the cubature rule
+    batch_size: Optional[int]
+        only used if `batched`, maximal number of elements
+        per call of f, defaults to all elements at once
+
+    returns
+    -------
+    np.ndarray: the approximated values of the local integrals,
+        i.e. `result[k]` is the integral on the k-th (marked) element
+
+    notes
+    -----
+    - the function f must be able to
+      handle inputs of shape (N, 2), i.e.
+      coordinates as array
+    - f may return values of shape (N,) or (N, ...), e.g. (N, k)
+      for k integrands at once, in the latter case the result
+      has shape (n_elements, ...)
+    - f is evaluated exactly as often as in `integrate_on_mesh`,
+      i.e. once per integration point of the cubature rule
+      or once per batch if `batched`
+    - if f is a `triangle_cubature.polynomials.Polynomial` (or provides
+      `to_array_polynomial`, e.g. `dev_tools.polynomials.Polynomial`),
+      its integral is computed exactly from the vertex coordinates,
+      i.e. f is never evaluated and the cubature rule is not used
+    """
+    polynomial = _as_polynomial(f)
+    if polynomial is not None:
+        if marked_elements is not None:
+            elements = elements[marked_elements]
+        return polynomial.integrate_on_mesh_elementwise(
+            coordinates=coordinates, elements=elements)
+
+    c1, d21, d31, areas_2 = _get_element_geometry(
+        coordinates=coordinates, elements=elements,
+        marked_elements=marked_elements)
+
+    waip = get_rule(rule=cubature_rule).weights_and_integration_points
+    weighted_sums = _get_weighted_sums(
+        f=f, c1=c1, d21=d21, d31=d31, waip=waip,
+        batched=batched, batch_size=batch_size)
+    with _get_active_profile().phase('reduction'):
+        local_integrals = _scale_elementwise(
+            values=weighted_sums, areas_2=areas_2)
+    return local_integrals
+
+
+def integrate_on_triangles(
+        f: Callable[[CoordinatesType], np.ndarray],
+        triangles: np.ndarray,
+        cubature_rule: Union[CubatureRuleEnum, int],
+        elementwise: bool = False,
+        batched: bool = False,
+        batch_size: Optional[int] = None) -> Union[float, np.ndarray]:
+    """
+    approximates the integral of the function provided
+    on each of the (independent) triangles at hand
+    using the specified cubature rule
+
+    parameters
+    ----------
+    f: Callable[[CoordinatesType], np.ndarray]
+        the function to be integrated
+    triangles: np.ndarray
+        array of shape (N, 3, 2), where `triangles[k]` holds
+        the coordinates of the k-th triangle's vertices
+        in counter-clockwise order
+    cubature_rule: CubatureRuleEnum | int
+        the cubature rule to be used or the required
+        degree of exactness, see `get_rule_by_degree`
+    elementwise: bool
+        if True, returns the integrals on each triangle,
+        otherwise their sum
+    batched: bool
+        if True, f is called once on all integration points
+        of (a batch of) the triangles instead of once per
+        integration point of the cubature rule
+    batch_size: Optional[int]
+        only used if `batched`, maximal number of triangles
+        per call of f, defaults to all triangles at once
+
+    returns
+    -------
+    float | np.ndarray: the approximated value of the integral
+        over all triangles or, if `elementwise`, the array of shape
+        (N,) or (N, ...) holding the approximated integrals on each
+        triangle
+
+    notes
+    -----
+    - the function f must be able to
+      handle inputs of shape (N, 2), i.e.
+      coordinates as array
+    - f may return values of shape (N,) or (N, ...), e.g. (N, k)
+      for k integrands at once
+    - the result on `triangles[k]` coincides with
+      `integrate_on_triangle(f, triangles[k], cubature_rule)`
+      up to rounding
+    - if f is a `triangle_cubature.polynomials.Polynomial` (or provides
+      `to_array_polynomial`, e.g. `dev_tools.polynomials.Polynomial`),
+      its integral is computed exactly from the vertex coordinates,
+      i.e. f is never evaluated and the cubature rule is not used
+    """
+    polynomial = _as_polynomial(f)
+    if polynomial is not None:
+        coordinates = triangles.reshape(-1, 2)
+        elements = np.arange(coordinates.shape[0]).reshape(-1, 3)
+        if elementwise:
+            return polynomial.integrate_on_mesh_elementwise(
+                coordinates=coordinates, elements=elements)
+        return polynomial.integrate_on_mesh(
+            coordinates=coordinates, elements=elements)
+
+    profile = _get_active_profile()
+    with profile.phase('geometry'):
+        jacobians = get_jacobians(physical_triangles=triangles)
+        c1 = triangles[:, 0, :]
+        d21 = jacobians[:, :, 0]
+        d31 = jacobians[:, :, 1]
+        areas_2 = get_jacobian_determinants(jacobians=jacobians)
+    profile.record_allocation(jacobians, areas_2)
+
+    waip = get_rule(rule=cubature_rule).weights_and_integration_points
+    weighted_sums = _get_weighted_sums(
+        f=f, c1=c1, d21=d21, d31=d31, waip=waip,
+        batched=batched, batch_size=batch_size)
+    with profile.phase('reduction'):
+        if elementwise:
+            integral = _scale_elementwise(
+                values=weighted_sums, areas_2=areas_2)
+        else:
+            integral = _sum_over_elements(
+                values=weighted_sums, areas_2=areas_2)
+    return integral
+
+
+def integrate_nodal_fields_on_mesh(
+        nodal_values: Union[np.ndarray, Sequence[np.ndarray]],
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        polynomial_degree: int = 1,
+        element2edges: Optional[np.ndarray] = None,
+        cubature_rule: Optional[Union[CubatureRuleEnum, int]] = None,
+        marked_elements: Optional[np.ndarray] = None) -> float:
+    """
+    integrates the finite element function (or the product of the
+    finite element functions) given by its nodal values
+    over the mesh at hand
+
+    see `integrate_nodal_fields_on_mesh_elementwise` for details
+    on the parameters
+
+    returns
+    -------
+    float: the approximated value of the integral
+    """
+    return np.sum(integrate_nodal_fields_on_mesh_elementwise(
+        nodal_values=nodal_values,
+        coordinates=coordinates,
+        elements=elements,
+        polynomial_degree=polynomial_degree,
+        element2edges=element2edges,
+        cubature_rule=cubature_rule,
+        marked_elements=marked_elements))
+
+
+def integrate_nodal_fields_on_mesh_elementwise(
+        nodal_values: Union[np.ndarray, Sequence[np.ndarray]],
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        polynomial_degree: int = 1,
+        element2edges: Optional[np.ndarray] = None,
+        cubature_rule: Optional[Union[CubatureRuleEnum, int]] = None,
+        marked_elements: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    integrates the finite element function (or the product of the
+    finite element functions) given by its nodal values
+    on each element of the mesh at hand
+
+    parameters
+    ----------
+    nodal_values: np.ndarray | Sequence[np.ndarray]
+        the nodal values of a single function u, i.e. array of shape
+        (n_dofs,), or a sequence of such arrays [u, v, ...] in which
+        case their product u*v*... is integrated, e.g. [u, u] for u^2
+    coordinates: CoordinatesType
+        vertices of the mesh
+    elements: ElementsType
+        the elements of the mesh
+    polynomial_degree: int
+        1 for P1 functions, where n_dofs is the number of vertices,
+        2 for P2 functions, where n_dofs is the number of vertices
+        plus the number of edges and `nodal_values[n_vertices + k]`
+        holds the value at the midpoint of the k-th edge
+    element2edges: Optional[np.ndarray]
+        only (and necessarily) used for P2 functions,
+        the indices of the edges (v0, v1), (v1, v2), (v2, v0)
+        of each element, see `p1afempy.mesh.provide_geometric_data`
+    cubature_rule: Optional[CubatureRuleEnum | int]
+        the cubature rule to be used or the required
+        degree of exactness, see `get_rule_by_degree`,
+        defaults to the degree of the product, i.e. exact integration
+    marked_elements: Optional[np.ndarray]
+        indices or boolean mask of the elements to integrate on,
+        defaults to all elements of the mesh
+
+    returns
+    -------
+    np.ndarray: the values of the local integrals,
+        i.e. `result[k]` is the integral on the k-th (marked) element
 
+    notes
+    -----
+    - the basis functions are tabulated at the reference integration
+      points only once per rule, see `get_basis_values`, i.e. the
+      values at the integration points are obtained by gathering
+      the local nodal values and a single matrix product per function
+    """
+    if isinstance(nodal_values, np.ndarray):
+        nodal_values = [nodal_values]
+    if len(nodal_values) == 0:
+        raise ValueError('at least one function must be provided.')
+    if cubature_rule is None:
+        cubature_rule = len(nodal_values) * polynomial_degree
+
+    if marked_elements is None:
+        marked_elements = slice(None)
+    local_dofs = elements[marked_elements]
+    if polynomial_degree == 2:
+        if element2edges is None:
+            raise ValueError(
+                'element2edges must be provided for P2 functions.')
+        local_dofs = np.hstack([
+            local_dofs, coordinates.shape[0] + element2edges[marked_elements]])
+
+    _, _, _, areas_2 = _get_element_geometry(
+        coordinates=coordinates, elements=elements,
+        marked_elements=marked_elements)
+
+    basis_values = get_basis_values(
+        cubature_rule=cubature_rule, polynomial_degree=polynomial_degree)
+    waip = get_rule(rule=cubature_rule).weights_and_integration_points
+
+    # product[k, q] = (u*v*...)(x_q^k)
+    product = None
+    for values in nodal_values:
+        values_on_points = values[local_dofs] @ basis_values.T
+        if product is None:
+            product = values_on_points
+        else:
+            product *= values_on_points
+    return (product @ waip.weights) * areas_2
+
+
+def _as_polynomial(f: Callable[[CoordinatesType], np.ndarray]):
+    """
+    returns f as `triangle_cubature.polynomials.Polynomial`
+    if f is a polynomial (or provides `to_array_polynomial`)
+    and None otherwise
+    """
+    # imported here as `triangle_cubature.polynomials`
+    # itself builds on this module
+    from triangle_cubature.polynomials import Polynomial
+    if isinstance(f, Polynomial):
+        return f
+    to_array_polynomial = getattr(f, 'to_array_polynomial', None)
+    if callable(to_array_polynomial):
+        return to_array_polynomial()
+    return None
+
+
+def _get_weighted_sums(
+        f: Callable[[CoordinatesType], np.ndarray],
+        c1: np.ndarray,
+        d21: np.ndarray,
+        d31: np.ndarray,
+        waip: WeightsAndIntegrationPoints,
+        batched: bool = False,
+        batch_size: Optional[int] = None) -> np.ndarray:
+    """
+    returns the weighted sums `sum_q w_q f(x_q^K)` for all elements K,
+    i.e. the local integrals up to the factor `2*|K|`
+    """
+    if batched:
+        return _get_batched_weighted_sums(
+            f=f, c1=c1, d21=d21, d31=d31, waip=waip, batch_size=batch_size)
+
+    profile = _get_active_profile()
+    weighted_sums = 0.
+    for weight, integration_point in zip(
+            waip.weights, waip.integration_points):
+        x_hat, y_hat = integration_point
+        with profile.phase('points'):
+            transformed_integration_points = c1 + x_hat * d21 + y_hat * d31
+        profile.record_allocation(transformed_integration_points)
+        with profile.phase('evaluation'):
+            f_on_integration_points = f(transformed_integration_points)
+        profile.record_evaluation(f_on_integration_points)
+        with profile.phase('reduction'):
+            weighted_sums = weighted_sums + weight * f_on_integration_points
+    return weighted_sums
+
+
+def _get_element_geometry(
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        marked_elements: Optional[np.ndarray] = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    returns the first vertex `c1`, the edge vectors `d21`, `d31`
+    and the doubled areas `areas_2` of the (marked) elements
+
+    notes
+    -----
+    - only the geometry of the marked elements is gathered,
+      i.e. `elements[marked_elements]` is never copied as a whole
+    """
     # fully vectorized integration,
     # based on ideas found in the following paper:
     # --------------------------------------------------------------------
@@ -82,21 +608,338 @@ def integrate_on_mesh(
     # Efficient Implementation of Adaptive P1-FEM in Matlab.
     # Computational Methods in Applied Mathematics 11,
     # no. 4 (1 January 2011): 460–90. https://doi.org/10.2478/cmam-2011-0026.
-    c1 = coordinates[elements[:, 0]]
-    d21 = coordinates[elements[:, 1]] - c1
-    d31 = coordinates[elements[:, 2]] - c1
+    if marked_elements is None:
+        marked_elements = slice(None)
+    profile = _get_active_profile()
+    with profile.phase('geometry'):
+        c1 = coordinates[elements[marked_elements, 0]]
+        d21 = coordinates[elements[marked_elements, 1]] - c1
+        d31 = coordinates[elements[marked_elements, 2]] - c1
 
-    # vector of element areas 2*|T|
-    areas_2 = (d21[:, 0]*d31[:, 1] - d21[:, 1] * d31[:, 0])
+        # vector of element areas 2*|T|
+        areas_2 = (d21[:, 0]*d31[:, 1] - d21[:, 1] * d31[:, 0])
+    profile.record_allocation(c1, d21, d31, areas_2)
+    return c1, d21, d31, areas_2
+
+
+def _get_element_geometry_in_workspace(
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        workspace: IntegrationWorkspace,
+        marked_elements: Optional[np.ndarray] = None,
+        dtype: Optional[np.dtype] = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    same as `_get_element_geometry` (optionally in the specified
+    floating point type), but computed in place in the buffers
+    of the workspace
+    """
+    profile = _get_active_profile()
+    with profile.phase('geometry'):
+        if dtype is None and not np.issubdtype(
+                coordinates.dtype, np.floating):
+            # e.g. integer coordinates, the buffers must hold
+            # the (floating point) integration points
+            dtype = np.float64
+        if dtype is not None and coordinates.dtype != dtype:
+            cast_coordinates = workspace.get_buffer(
+                'coordinates', coordinates.shape, dtype)
+            np.copyto(cast_coordinates, coordinates)
+            coordinates = cast_coordinates
+
+        if marked_elements is not None:
+            marked_elements = np.asarray(marked_elements)
+            if marked_elements.dtype == bool:
+                if marked_elements.shape != elements.shape[:1]:
+                    raise IndexError(
+                        f'boolean marked_elements of shape '
+                        f'{marked_elements.shape} do not match the '
+                        f'{elements.shape[0]} elements')
+                n_marked = np.count_nonzero(marked_elements)
+            else:
+                _check_indices(indices=marked_elements,
+                               size=elements.shape[0])
+                n_marked = marked_elements.shape[0]
+            local_elements = workspace.get_buffer(
+                'elements', (n_marked, 3), elements.dtype)
+            if marked_elements.dtype == bool:
+                np.compress(
+                    marked_elements, elements, axis=0, out=local_elements)
+            else:
+                np.take(elements, marked_elements, axis=0,
+                        out=local_elements, mode='wrap')
+            elements = local_elements
+        _check_indices(indices=elements, size=coordinates.shape[0])
+
+        n_elements = elements.shape[0]
+        shape = (n_elements, 2)
+        dtype = coordinates.dtype
+        c1 = workspace.get_buffer('c1', shape, dtype)
+        d21 = workspace.get_buffer('d21', shape, dtype)
+        d31 = workspace.get_buffer('d31', shape, dtype)
+        areas_2 = workspace.get_buffer('areas_2', (n_elements,), dtype)
+        scratch = workspace.get_buffer('scratch', (n_elements,), dtype)
+
+        # contiguous vertex indices, such that np.take does not copy them
+        indices = workspace.get_buffer(
+            'indices', (n_elements,), elements.dtype)
+        for k, out in enumerate([c1, d21, d31]):
+            np.copyto(indices, elements[:, k])
+            np.take(coordinates, indices, axis=0, out=out, mode='wrap')
+        np.subtract(d21, c1, out=d21)
+        np.subtract(d31, c1, out=d31)
+
+        # vector of element areas 2*|T|
+        np.multiply(d21[:, 0], d31[:, 1], out=areas_2)
+        np.multiply(d21[:, 1], d31[:, 0], out=scratch)
+        np.subtract(areas_2, scratch, out=areas_2)
+    return c1, d21, d31, areas_2
+
+
+def _check_indices(indices: np.ndarray, size: int) -> None:
+    """
+    raises an IndexError if any of the indices is out of bounds
+    for an axis of the given size, i.e. mimics fancy indexing
+    for the gathers with `mode='wrap'`, which never raise
+    """
+    if indices.size == 0:
+        return
+    # reducing the flattened view avoids the buffering of 2D reductions
+    indices = np.ravel(indices)
+    if indices.min() < -size or indices.max() >= size:
+        raise IndexError(
+            f'index out of bounds for axis 0 with size {size}')
+
+
+def _transform_points(
+        c1: np.ndarray,
+        d21: np.ndarray,
+        d31: np.ndarray,
+        x_hat: float,
+        y_hat: float,
+        out: Optional[np.ndarray] = None,
+        scratch: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    returns `c1 + x_hat * d21 + y_hat * d31`, i.e. the reference point
+    (x_hat, y_hat) transformed to all elements, computed in place
+    in `out` (using `scratch` of the same shape) if provided
+    """
+    if out is None:
+        return c1 + x_hat * d21 + y_hat * d31
+    np.multiply(d21, x_hat, out=out)
+    np.add(c1, out, out=out)
+    np.multiply(d31, y_hat, out=scratch)
+    np.add(out, scratch, out=out)
+    return out
+
+
+def _get_batched_weighted_sums(
+        f: Callable[[CoordinatesType], np.ndarray],
+        c1: np.ndarray,
+        d21: np.ndarray,
+        d31: np.ndarray,
+        waip: WeightsAndIntegrationPoints,
+        batch_size: Optional[int] = None,
+        workspace: Optional[IntegrationWorkspace] = None) -> np.ndarray:
+    """
+    returns the weighted sums `sum_q w_q f(x_q^K)` for all elements K,
+    where f is called once per batch of elements on a contiguous
+    array of shape (n_qp * n_batch, 2) holding the physical points
+
+    notes
+    -----
+    - the physical points are ordered integration point by
+      integration point, i.e. the k-th block of `n_batch` rows
+      contains the k-th integration point of each element
+    - if a workspace is provided, the physical points and the
+      weighted sums are computed in place in its buffers
+    """
+    n_elements = c1.shape[0]
+    if batch_size is None:
+        batch_size = max(n_elements, 1)
+    if batch_size < 1:
+        raise ValueError('batch_size must be a positive integer.')
 
-    waip = get_rule(rule=cubature_rule).weights_and_integration_points
     weights = waip.weights
-    integration_points = waip.integration_points
+    n_qp = weights.shape[0]
 
-    sum = 0.
-    for weight, integration_point in zip(weights, integration_points):
-        x_hat, y_hat = integration_point
-        transformed_integration_points = c1 + x_hat * d21 + y_hat * d31
-        f_on_integration_points = f(transformed_integration_points)
-        sum += weight * np.dot(f_on_integration_points, areas_2)
-    return sum
+    profile = _get_active_profile()
+    weighted_sums = None
+    # without any elements, f is still called once (on an empty array)
+    # to determine the shape and type of its values
+    for start in range(0, max(n_elements, 1), batch_size):
+        batch = slice(start, min(start + batch_size, n_elements))
+        with profile.phase('points'):
+            if workspace is None:
+                points = _get_physical_points(
+                    c1=c1[batch], d21=d21[batch], d31=d31[batch],
+                    integration_points=waip.integration_points)
+                profile.record_allocation(points)
+            else:
+                points = _get_physical_points_in_workspace(
+                    c1=c1[batch], d21=d21[batch], d31=d31[batch],
+                    integration_points=waip.integration_points,
+                    workspace=workspace)
+        n_batch = points.shape[1]
+        with profile.phase('evaluation'):
+            f_on_points = f(points.reshape(n_qp * n_batch, 2))
+        profile.record_evaluation(f_on_points)
+        f_on_points = f_on_points.reshape(
+            (n_qp, n_batch) + f_on_points.shape[1:])
+        with profile.phase('reduction'):
+            if weighted_sums is None:
+                shape = (n_elements,) + f_on_points.shape[2:]
+                dtype = np.result_type(weights, f_on_points)
+                if workspace is None:
+                    weighted_sums = np.empty(shape, dtype=dtype)
+                    profile.record_allocation(weighted_sums)
+                else:
+                    weighted_sums = workspace.get_buffer(
+                        'weighted_sums', shape, dtype)
+            if workspace is None:
+                weighted_sums[batch] = np.tensordot(
+                    weights, f_on_points, axes=1)
+            else:
+                np.matmul(weights, f_on_points.reshape(n_qp, -1),
+                          out=weighted_sums[batch].reshape(-1))
+    return weighted_sums
+
+
+def _get_physical_points(
+        c1: np.ndarray,
+        d21: np.ndarray,
+        d31: np.ndarray,
+        integration_points: CoordinatesType,
+        dtype: Optional[np.dtype] = None) -> np.ndarray:
+    """
+    returns the reference integration points transformed
+    to all elements as contiguous array of shape (n_qp, n_elements, 2)
+
+    notes
+    -----
+    - if `dtype` is provided, the geometry is cast before transforming,
+      i.e. no temporaries of shape (n_qp, n_elements, 2) are
+      allocated in any other floating point type
+    """
+    if dtype is not None:
+        c1 = c1.astype(dtype, copy=False)
+        d21 = d21.astype(dtype, copy=False)
+        d31 = d31.astype(dtype, copy=False)
+        integration_points = integration_points.astype(dtype, copy=False)
+    n_qp = integration_points.shape[0]
+    points = np.empty((n_qp,) + c1.shape,
+                      dtype=np.result_type(c1, integration_points))
+    scratch = np.empty(c1.shape, dtype=points.dtype)
+    _fill_physical_points(
+        points=points, scratch=scratch, c1=c1, d21=d21, d31=d31,
+        integration_points=integration_points)
+    return points
+
+
+def _get_physical_points_in_workspace(
+        c1: np.ndarray,
+        d21: np.ndarray,
+        d31: np.ndarray,
+        integration_points: CoordinatesType,
+        workspace: IntegrationWorkspace) -> np.ndarray:
+    """
+    same as `_get_physical_points`, but computed in place
+    in the buffers of the workspace
+    """
+    n_qp = integration_points.shape[0]
+    points = workspace.get_buffer(
+        'points', (n_qp,) + c1.shape, c1.dtype)
+    scratch = workspace.get_buffer('scratch', c1.shape, c1.dtype)
+    _fill_physical_points(
+        points=points, scratch=scratch, c1=c1, d21=d21, d31=d31,
+        integration_points=integration_points)
+    return points
+
+
+def _fill_physical_points(
+        points: np.ndarray,
+        scratch: np.ndarray,
+        c1: np.ndarray,
+        d21: np.ndarray,
+        d31: np.ndarray,
+        integration_points: CoordinatesType) -> None:
+    """
+    writes `x_hat * d21 + y_hat * d31 + c1` for the k-th integration
+    point (x_hat, y_hat) to `points[k]`, using `scratch` of the
+    shape of `c1` as the only temporary
+    """
+    for k, (x_hat, y_hat) in enumerate(integration_points):
+        np.multiply(d21, x_hat, out=points[k])
+        np.multiply(d31, y_hat, out=scratch)
+        np.add(points[k], scratch, out=points[k])
+        np.add(points[k], c1, out=points[k])
+
+
+_ACCUMULATIONS = ('naive', 'pairwise', 'kahan', 'float64')
+
+
+def _accumulate_over_elements(
+        values: np.ndarray,
+        areas_2: np.ndarray,
+        accumulation: str,
+        workspace: Optional[IntegrationWorkspace] = None
+) -> Union[float, np.ndarray]:
+    """
+    returns `sum_k values[k, ...] * areas_2[k]`,
+    summed up as specified by `accumulation`
+    """
+    if accumulation == 'naive':
+        return _sum_over_elements(values=values, areas_2=areas_2)
+    out = None
+    if workspace is not None:
+        out = workspace.get_buffer(
+            'products', np.shape(values),
+            np.result_type(values, areas_2))
+    return _accumulate(
+        values=_scale_elementwise(values=values, areas_2=areas_2, out=out),
+        accumulation=accumulation)
+
+
+def _accumulate(values: np.ndarray,
+                accumulation: str) -> Union[float, np.ndarray]:
+    """
+    returns the sum of the values along the first axis,
+    summed up as specified by `accumulation`
+    """
+    if accumulation == 'kahan':
+        return compensated_sum(values)
+    if accumulation == 'naive':
+        total = 0.
+        for value in values:
+            total = total + value
+        return total
+    # numpy sums pairwise only along a contiguous axis, i.e. the
+    # summation axis is moved last for vector-valued integrands
+    if np.ndim(values) > 1:
+        values = np.ascontiguousarray(np.moveaxis(values, 0, -1))
+    if accumulation == 'float64':
+        return np.sum(values, axis=-1, dtype=np.float64)
+    return np.sum(values, axis=-1)
+
+
+def _scale_elementwise(values: np.ndarray,
+                       areas_2: np.ndarray,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    returns `values[k, ...] * areas_2[k]` for all elements k,
+    computed in place in `out` if provided
+    """
+    return np.multiply(
+        values,
+        areas_2.reshape(areas_2.shape + (1,) * (np.ndim(values) - 1)),
+        out=out)
+
+
+def _sum_over_elements(values: np.ndarray,
+                       areas_2: np.ndarray) -> Union[float, np.ndarray]:
+    """
+    returns `sum_k values[k, ...] * areas_2[k]`
+    """
+    if np.ndim(values) == 1:
+        return np.dot(values, areas_2)
+    return np.tensordot(areas_2, values, axes=1)
@@ -0,0 +1,159 @@
+from triangle_cubature.data_structures import \
+    CoordinatesType, ElementsType
+from triangle_cubature.cubature_rule \
+    import CubatureRuleEnum
+from triangle_cubature.rule_factory import get_rule
+from triangle_cubature.integrate import \
+    _get_element_geometry, _get_physical_points, \
+    _scale_elementwise, _sum_over_elements
+from typing import Callable, Union
+import numpy as np
+
+
+class IntegrationContext:
+    """
+    precomputed geometry and physical integration points
+    of a fixed mesh, used to integrate many different
+    functions on the same mesh
+
+    usage
+    -----
+    >>> context = IntegrationContext(
+    ...     coordinates=coordinates,
+    ...     elements=elements,
+    ...     cubature_rule=CubatureRuleEnum.DAYTAYLOR)
+    >>> integral_of_f = context.integrate(f)
+    >>> integral_of_g = context.integrate(g)
+    >>> # after moving the vertices of the mesh
+    >>> context.update_coordinates(new_coordinates)
+
+    notes
+    -----
+    - the context holds the doubled element areas, i.e. an array of
+      shape (n_elements,), and the physical integration points, i.e.
+      an array of shape (n_qp, n_elements, 2), both in `dtype`
+    """
+    elements: ElementsType
+    cubature_rule: Union[CubatureRuleEnum, int]
+    dtype: np.dtype
+    areas_2: np.ndarray
+    integration_points: np.ndarray
+
+    def __init__(self,
+                 coordinates: CoordinatesType,
+                 elements: ElementsType,
+                 cubature_rule: Union[CubatureRuleEnum, int],
+                 dtype: np.dtype = np.float64) -> None:
+        """
+        parameters
+        ----------
+        coordinates: CoordinatesType
+            vertices of the mesh
+        elements: ElementsType
+            the elements of the mesh
+        cubature_rule: CubatureRuleEnum | int
+            the cubature rule to be used or the required
+            degree of exactness, see `get_rule_by_degree`
+        dtype: np.dtype
+            floating point type of the precomputed areas
+            and integration points, e.g. np.float32 or np.float64
+        """
+        self.elements = elements
+        self.cubature_rule = cubature_rule
+        self.dtype = np.dtype(dtype)
+        self.update_coordinates(coordinates=coordinates)
+
+    @property
+    def n_elements(self) -> int:
+        return self.elements.shape[0]
+
+    def update_coordinates(self, coordinates: CoordinatesType) -> None:
+        """
+        recomputes the precomputed geometry and integration points,
+        e.g. after the vertices of the mesh have been moved
+
+        notes
+        -----
+        - the connectivity, i.e. `elements`, must not change,
+          otherwise a new context should be created
+        """
+        c1, d21, d31, areas_2 = _get_element_geometry(
+            coordinates=coordinates, elements=self.elements)
+        waip = get_rule(
+            rule=self.cubature_rule).weights_and_integration_points
+        self.areas_2 = areas_2.astype(self.dtype, copy=False)
+        self.integration_points = _get_physical_points(
+            c1=c1, d21=d21, d31=d31,
+            integration_points=waip.integration_points,
+            dtype=self.dtype)
+
+    def integrate(self,
+                  f: Callable[[CoordinatesType], np.ndarray],
+                  batched: bool = False) -> Union[float, np.ndarray]:
+        """
+        approximates the integral of the function provided
+        over the mesh of this context
+
+        parameters
+        ----------
+        f: Callable[[CoordinatesType], np.ndarray]
+            the function to be integrated
+        batched: bool
+            if True, f is called once on all integration points
+            instead of once per integration point of the cubature rule
+
+        returns
+        -------
+        float | np.ndarray: the approximated value of the integral,
+            of shape (...) if f returns values of shape (N, ...)
+        """
+        return _sum_over_elements(
+            values=self._get_weighted_sums(f=f, batched=batched),
+            areas_2=self.areas_2)
+
+    def integrate_elementwise(
+            self,
+            f: Callable[[CoordinatesType], np.ndarray],
+            batched: bool = False) -> np.ndarray:
+        """
+        approximates the integral of the function provided
+        on each element of the mesh of this context
+
+        parameters
+        ----------
+        f: Callable[[CoordinatesType], np.ndarray]
+            the function to be integrated
+        batched: bool
+            if True, f is called once on all integration points
+            instead of once per integration point of the cubature rule
+
+        returns
+        -------
+        np.ndarray: the approximated values of the local integrals,
+            i.e. `result[k]` is the integral on the k-th element
+        """
+        return _scale_elementwise(
+            values=self._get_weighted_sums(f=f, batched=batched),
+            areas_2=self.areas_2)
+
+    def _get_weighted_sums(
+            self,
+            f: Callable[[CoordinatesType], np.ndarray],
+            batched: bool) -> np.ndarray:
+        weights = get_rule(
+            rule=self.cubature_rule).weights_and_integration_points.weights
+        n_qp = weights.shape[0]
+
+        if batched:
+            f_on_points = f(self.integration_points.reshape(
+                n_qp * self.n_elements, 2))
+            return np.tensordot(
+                weights,
+                f_on_points.reshape(
+                    (n_qp, self.n_elements) + f_on_points.shape[1:]),
+                axes=1)
+
+        weighted_sums = 0.
+        for weight, points in zip(weights, self.integration_points):
+            weighted_sums = weighted_sums + weight * f(points)
+        return weighted_sums
@@ -0,0 +1,206 @@
+from triangle_cubature.data_structures import \
+    BoundaryType, CoordinatesType, ElementsType
+from triangle_cubature.cubature_rule import LineRule
+from triangle_cubature.rule_factory import get_gauss_legendre_rule
+from triangle_cubature.integrate import \
+    _scale_elementwise, _sum_over_elements
+from typing import Callable, Union
+import numpy as np
+
+
+def integrate_on_boundary(
+        f: Callable[[CoordinatesType], np.ndarray],
+        coordinates: CoordinatesType,
+        boundary: BoundaryType,
+        degree: int,
+        elementwise: bool = False,
+        batched: bool = False) -> Union[float, np.ndarray]:
+    """
+    approximates the line integral of the function provided
+    over the edges of the boundary at hand using the
+    Gauss-Legendre rule of the specified degree of exactness
+
+    parameters
+    ----------
+    f: Callable[[CoordinatesType], np.ndarray]
+        the function to be integrated
+    coordinates: CoordinatesType
+        vertices of the mesh
+    boundary: BoundaryType
+        the edges to integrate on, i.e. array of shape (n_edges, 2)
+        holding the indices of the edges' vertices
+    degree: int
+        the required degree of exactness, see `get_gauss_legendre_rule`
+    elementwise: bool
+        if True, returns the integrals on each edge,
+        otherwise their sum
+    batched: bool
+        if True, f is called once on all integration points
+        instead of once per integration point of the rule
+
+    returns
+    -------
+    float | np.ndarray: the approximated value of the integral
+        over all edges or, if `elementwise`, the array of shape
+        (n_edges,) or (n_edges, ...) holding the integrals on each edge
+
+    notes
+    -----
+    - the function f must be able to
+      handle inputs of shape (N, 2), i.e.
+      coordinates as array
+    - f may return values of shape (N,) or (N, ...), e.g. (N, k)
+      for k integrands at once
+    - the outward unit normals needed for e.g. Neumann data
+      are provided by `get_unit_normals`
+    """
+    starts = coordinates[boundary[:, 0]]
+    directions = coordinates[boundary[:, 1]] - starts
+    lengths = np.linalg.norm(directions, axis=1)
+
+    rule = get_gauss_legendre_rule(degree=degree)
+    weighted_sums = _get_weighted_sums_on_edges(
+        f=f, starts=starts, directions=directions, rule=rule,
+        batched=batched)
+    if elementwise:
+        return _scale_elementwise(values=weighted_sums, areas_2=lengths)
+    return _sum_over_elements(values=weighted_sums, areas_2=lengths)
+
+
+def integrate_on_interior_edges(
+        f: Callable[[CoordinatesType, np.ndarray, np.ndarray], np.ndarray],
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        degree: int,
+        elementwise: bool = False,
+        batched: bool = False) -> Union[float, np.ndarray]:
+    """
+    approximates the line integral of the function provided
+    over all interior edges of the mesh at hand, e.g. the
+    jump terms of residual error estimators
+
+    parameters
+    ----------
+    f: Callable[[CoordinatesType, np.ndarray, np.ndarray], np.ndarray]
+        the function to be integrated, called as
+        `f(points, left_elements, right_elements)`, where
+        `left_elements[n]` and `right_elements[n]` are the indices
+        of the two elements sharing the edge of `points[n]`,
+        such that piecewise defined quantities can be evaluated
+        on both sides of the edge, e.g. to compute jumps
+    coordinates: CoordinatesType
+        vertices of the mesh
+    elements: ElementsType
+        the elements of the mesh
+    degree: int
+        the required degree of exactness, see `get_gauss_legendre_rule`
+    elementwise: bool
+        if True, returns the integrals on each interior edge
+        in the order of `get_interior_edges`, otherwise their sum
+    batched: bool
+        if True, f is called once on all integration points
+        instead of once per integration point of the rule
+
+    returns
+    -------
+    float | np.ndarray: the approximated value of the integral
+        over all interior edges or, if `elementwise`, the array of shape
+        (n_interior_edges,) or (n_interior_edges, ...)
+
+    notes
+    -----
+    - the interior edges are oriented counter-clockwise with respect
+      to the left element, i.e. `get_unit_normals` returns the unit
+      normals pointing from the left to the right element
+    """
+    interior_edges, adjacent_elements = get_interior_edges(
+        elements=elements)
+    starts = coordinates[interior_edges[:, 0]]
+    directions = coordinates[interior_edges[:, 1]] - starts
+    lengths = np.linalg.norm(directions, axis=1)
+
+    rule = get_gauss_legendre_rule(degree=degree)
+    weighted_sums = _get_weighted_sums_on_edges(
+        f=f, starts=starts, directions=directions, rule=rule,
+        batched=batched,
+        args=(adjacent_elements[:, 0], adjacent_elements[:, 1]))
+    if elementwise:
+        return _scale_elementwise(values=weighted_sums, areas_2=lengths)
+    return _sum_over_elements(values=weighted_sums, areas_2=lengths)
+
+
+def get_interior_edges(
+        elements: ElementsType) -> tuple[np.ndarray, np.ndarray]:
+    """
+    returns the interior edges of the mesh and their adjacent elements
+
+    returns
+    -------
+    interior_edges: np.ndarray
+        array of shape (n_interior_edges, 2) holding the indices of
+        the edges' vertices, oriented counter-clockwise with respect
+        to the left element
+    adjacent_elements: np.ndarray
+        array of shape (n_interior_edges, 2), where
+        `adjacent_elements[n]` holds the indices of the left
+        and the right element of the n-th interior edge
+
+    notes
+    -----
+    - the mesh is assumed to be conforming, i.e. each interior
+      edge is shared by exactly two elements
+    """
+    # all directed edges (v0, v1), (v1, v2), (v2, v0) of all elements
+    edges = elements[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2)
+    sorted_edges = np.sort(edges, axis=1)
+    order = np.lexsort((sorted_edges[:, 1], sorted_edges[:, 0]))
+    sorted_edges = sorted_edges[order]
+    is_duplicate = np.all(sorted_edges[1:] == sorted_edges[:-1], axis=1)
+    first = order[:-1][is_duplicate]
+    second = order[1:][is_duplicate]
+    return edges[first], np.column_stack([first // 3, second // 3])
+
+
+def get_unit_normals(coordinates: CoordinatesType,
+                     edges: BoundaryType) -> np.ndarray:
+    """
+    returns the unit normals of the edges at hand as array of
+    shape (n_edges, 2), pointing to the right of the edges'
+    direction, i.e. outwards for counter-clockwise oriented
+    boundaries
+    """
+    directions = coordinates[edges[:, 1]] - coordinates[edges[:, 0]]
+    normals = np.column_stack([directions[:, 1], -directions[:, 0]])
+    return normals / np.linalg.norm(normals, axis=1)[:, np.newaxis]
+
+
+def _get_weighted_sums_on_edges(
+        f: Callable[..., np.ndarray],
+        starts: np.ndarray,
+        directions: np.ndarray,
+        rule: LineRule,
+        batched: bool = False,
+        args: tuple[np.ndarray, ...] = ()) -> np.ndarray:
+    """
+    returns the weighted sums `sum_q w_q f(a + t_q (b - a), *args)`
+    for all edges from a to b, i.e. the line integrals
+    up to the factor |b - a|
+    """
+    weights = rule.weights
+    ts = rule.integration_points
+
+    if batched:
+        n_qp, n_edges = ts.shape[0], starts.shape[0]
+        points = starts + np.multiply.outer(ts, directions)
+        f_on_points = f(
+            points.reshape(n_qp * n_edges, 2),
+            *(np.tile(arg, n_qp) for arg in args))
+        f_on_points = f_on_points.reshape(
+            (n_qp, n_edges) + f_on_points.shape[1:])
+        return np.tensordot(weights, f_on_points, axes=1)
+
+    weighted_sums = 0.
+    for weight, t in zip(weights, ts):
+        f_on_points = f(starts + t * directions, *args)
+        weighted_sums = weighted_sums + weight * f_on_points
+    return weighted_sums
@@ -0,0 +1,180 @@
+from triangle_cubature.data_structures import \
+    CoordinatesType, ElementsType
+from triangle_cubature.cubature_rule \
+    import CubatureRuleEnum
+from triangle_cubature.streaming import integrate_on_mesh_in_chunks
+from pathlib import Path
+from typing import Callable, Union
+import numpy as np
+
+
+def convert_dat_to_npy(path_to_dat: Path,
+                       path_to_npy: Path,
+                       dtype: np.dtype,
+                       shift_indices: bool = False,
+                       chunk_size: int = 1_000_000) -> None:
+    """
+    converts a whitespace separated text file, e.g. `coordinates.dat`
+    or `elements.dat`, to the binary `.npy` format
+
+    parameters
+    ----------
+    path_to_dat: Path
+        path to the text file, one row per line
+    path_to_npy: Path
+        path to the `.npy` file to be written
+    dtype: np.dtype
+        data type of the binary file, e.g. np.float64
+        for coordinates and np.int64 for elements
+    shift_indices: bool
+        if True, shifts the values according to i' := i-1,
+        e.g. for elements using Matlab/Fortran/Julia indexing
+    chunk_size: int
+        maximal number of lines parsed at a time
+
+    notes
+    -----
+    - the text file is read twice (counting and parsing the lines),
+      such that peak memory is bounded by `chunk_size`
+      and not by the size of the file
+    """
+    path_to_dat = Path(path_to_dat)
+    n_rows = 0
+    n_columns = None
+    with open(path_to_dat) as file:
+        for line in file:
+            if line.strip():
+                n_rows += 1
+                if n_columns is None:
+                    n_columns = len(line.split())
+    if n_columns is None:
+        raise ValueError(f'{path_to_dat} does not contain any data.')
+
+    output = np.lib.format.open_memmap(
+        Path(path_to_npy), mode='w+', dtype=dtype, shape=(n_rows, n_columns))
+
+    row = 0
+    with open(path_to_dat) as file:
+        lines = []
+        for line in file:
+            if line.strip():
+                lines.append(line)
+            if len(lines) == chunk_size:
+                row = _write_lines(output, lines, row, shift_indices)
+                lines = []
+        if lines:
+            _write_lines(output, lines, row, shift_indices)
+    output.flush()
+    del output
+
+
+def convert_mesh_to_npy(path_to_coordinates: Path,
+                        path_to_elements: Path,
+                        output_directory: Path,
+                        shift_indices: bool = False,
+                        chunk_size: int = 1_000_000) -> tuple[Path, Path]:
+    """
+    converts a mesh given as `coordinates.dat` / `elements.dat`
+    text files to `coordinates.npy` / `elements.npy` in the
+    specified output directory
+
+    returns
+    -------
+    tuple[Path, Path]: the paths to the coordinates and
+        elements `.npy` files, respectively
+    """
+    output_directory = Path(output_directory)
+    output_directory.mkdir(parents=True, exist_ok=True)
+    path_to_coordinates_npy = output_directory / Path('coordinates.npy')
+    path_to_elements_npy = output_directory / Path('elements.npy')
+
+    convert_dat_to_npy(
+        path_to_dat=path_to_coordinates,
+        path_to_npy=path_to_coordinates_npy,
+        dtype=np.float64,
+        chunk_size=chunk_size)
+    convert_dat_to_npy(
+        path_to_dat=path_to_elements,
+        path_to_npy=path_to_elements_npy,
+        dtype=np.int64,
+        shift_indices=shift_indices,
+        chunk_size=chunk_size)
+    return path_to_coordinates_npy, path_to_elements_npy
+
+
+def read_mesh_memmap(
+        path_to_coordinates: Path,
+        path_to_elements: Path) -> tuple[CoordinatesType, ElementsType]:
+    """
+    returns the coordinates and elements stored as `.npy` files
+    as read-only memory maps, i.e. without loading them into memory
+    """
+    coordinates = np.load(Path(path_to_coordinates), mmap_mode='r')
+    elements = np.load(Path(path_to_elements), mmap_mode='r')
+    return coordinates, elements
+
+
+def integrate_on_mesh_from_files(
+        f: Callable[[CoordinatesType], np.ndarray],
+        path_to_coordinates: Path,
+        path_to_elements: Path,
+        cubature_rule: Union[CubatureRuleEnum, int],
+        chunk_size: int = 1_000_000,
+        batched: bool = False) -> Union[float, np.ndarray]:
+    """
+    approximates the integral of the function provided over
+    the mesh stored as `.npy` files, streaming chunks of elements
+    through the cubature from memory maps
+
+    parameters
+    ----------
+    f: Callable[[CoordinatesType], np.ndarray]
+        the function to be integrated
+    path_to_coordinates: Path
+        path to the coordinates `.npy` file
+    path_to_elements: Path
+        path to the elements `.npy` file
+    cubature_rule: CubatureRuleEnum | int
+        the cubature rule to be used or the required
+        degree of exactness, see `get_rule_by_degree`
+    chunk_size: int
+        maximal number of elements processed at a time
+    batched: bool
+        if True, f is called once per chunk on all integration
+        points of the chunk instead of once per integration point
+        of the cubature rule
+
+    returns
+    -------
+    float | np.ndarray: the approximated value of the integral
+
+    notes
+    -----
+    - text meshes, i.e. `coordinates.dat` / `elements.dat`,
+      can be converted once using `convert_mesh_to_npy`
+    """
+    coordinates, elements = read_mesh_memmap(
+        path_to_coordinates=path_to_coordinates,
+        path_to_elements=path_to_elements)
+    return integrate_on_mesh_in_chunks(
+        f=f,
+        coordinates=coordinates,
+        elements=elements,
+        cubature_rule=cubature_rule,
+        chunk_size=chunk_size,
+        batched=batched)
+
+
+def _write_lines(output: np.ndarray,
+                 lines: list[str],
+                 row: int,
+                 shift_indices: bool) -> int:
+    """
+    parses the lines and writes them to `output` starting
+    at the specified row, returns the next row to be written
+    """
+    values = np.loadtxt(lines, dtype=output.dtype, ndmin=2)
+    if shift_indices:
+        values -= 1
+    output[row:row + values.shape[0]] = values
+    return row + values.shape[0]
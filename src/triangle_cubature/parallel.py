@@ -0,0 +1,185 @@
+from triangle_cubature.data_structures import \
+    CoordinatesType, ElementsType
+from triangle_cubature.cubature_rule \
+    import CubatureRuleEnum
+from triangle_cubature.rule_factory import get_rule
+from triangle_cubature.streaming import _integrate_on_block
+from triangle_cubature.summation import CompensatedSum
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Optional, Union
+import numpy as np
+import os
+
+
+def integrate_on_mesh_parallel(
+        f: Callable[[CoordinatesType], np.ndarray],
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        cubature_rule: Union[CubatureRuleEnum, int],
+        n_workers: Optional[int] = None,
+        backend: str = 'thread',
+        partition_size: int = 100_000,
+        batched: bool = False) -> Union[float, np.ndarray]:
+    """
+    approximates the integral of the function provided
+    over the mesh at hand using the specified cubature rule,
+    integrating partitions of the elements in parallel
+
+    parameters
+    ----------
+    f: Callable[[CoordinatesType], np.ndarray]
+        the function to be integrated
+    coordinates: CoordinatesType
+        vertices of the mesh
+    elements: ElementsType
+        the elements of the mesh
+    cubature_rule: CubatureRuleEnum | int
+        the cubature rule to be used or the required
+        degree of exactness, see `get_rule_by_degree`
+    n_workers: Optional[int]
+        number of threads or processes, defaults to `os.cpu_count()`
+    backend: str
+        either 'thread', suitable for functions releasing the GIL
+        (e.g. vectorized numpy code), or 'process', suitable for
+        pure python functions
+    partition_size: int
+        number of elements per partition
+    batched: bool
+        if True, f is called once per partition on all integration
+        points of the partition instead of once per integration point
+        of the cubature rule
+
+    returns
+    -------
+    float | np.ndarray: the approximated value of the integral
+
+    notes
+    -----
+    - the partitions only depend on `partition_size` and their
+      partial sums are reduced in a fixed order using compensated
+      summation, i.e. the result is bitwise reproducible
+      regardless of `n_workers` and `backend`
+    - using the 'process' backend, f must be picklable and
+      coordinates and elements are copied once to shared memory,
+      instead of being sent to each of the worker processes
+    """
+    if partition_size < 1:
+        raise ValueError('partition_size must be a positive integer.')
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+
+    n_elements = elements.shape[0]
+    partitions = [(start, min(start + partition_size, n_elements))
+                  for start in range(0, n_elements, partition_size)]
+
+    if backend == 'thread':
+        waip = get_rule(rule=cubature_rule).weights_and_integration_points
+
+        def integrate_partition(partition: tuple[int, int]):
+            start, stop = partition
+            return _integrate_on_block(
+                f=f, coordinates=coordinates,
+                elements=elements[start:stop],
+                waip=waip, batched=batched)
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            partial_sums = list(executor.map(integrate_partition, partitions))
+    elif backend == 'process':
+        partial_sums = _integrate_partitions_in_processes(
+            f=f, coordinates=coordinates, elements=elements,
+            cubature_rule=cubature_rule, partitions=partitions,
+            n_workers=n_workers, batched=batched)
+    else:
+        raise ValueError(
+            f"unknown backend '{backend}', use 'thread' or 'process'.")
+
+    total = CompensatedSum()
+    for partial_sum in partial_sums:
+        total.add(partial_sum)
+    return total.value
+
+
+# ---------------------------------------------------------------
+# process backend, i.e. state shared with each worker process
+# ---------------------------------------------------------------
+
+_worker_state: dict = {}
+
+
+def _integrate_partitions_in_processes(
+        f: Callable[[CoordinatesType], np.ndarray],
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        cubature_rule: Union[CubatureRuleEnum, int],
+        partitions: list[tuple[int, int]],
+        n_workers: int,
+        batched: bool) -> list:
+    shared_arrays = [_SharedArray(array=coordinates),
+                     _SharedArray(array=elements)]
+    try:
+        with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_worker,
+                initargs=(f,
+                          shared_arrays[0].spec,
+                          shared_arrays[1].spec,
+                          cubature_rule,
+                          batched)) as executor:
+            return list(executor.map(_integrate_partition_in_worker,
+                                     partitions))
+    finally:
+        for shared_array in shared_arrays:
+            shared_array.release()
+
+
+def _init_worker(f: Callable[[CoordinatesType], np.ndarray],
+                 coordinates_spec: tuple,
+                 elements_spec: tuple,
+                 cubature_rule: Union[CubatureRuleEnum, int],
+                 batched: bool) -> None:
+    coordinates_memory, coordinates = _attach(*coordinates_spec)
+    elements_memory, elements = _attach(*elements_spec)
+    _worker_state.update(
+        f=f,
+        coordinates=coordinates,
+        elements=elements,
+        # keeping references such that the memory stays mapped
+        shared_memories=(coordinates_memory, elements_memory),
+        waip=get_rule(rule=cubature_rule).weights_and_integration_points,
+        batched=batched)
+
+
+def _integrate_partition_in_worker(partition: tuple[int, int]):
+    start, stop = partition
+    return _integrate_on_block(
+        f=_worker_state['f'],
+        coordinates=_worker_state['coordinates'],
+        elements=_worker_state['elements'][start:stop],
+        waip=_worker_state['waip'],
+        batched=_worker_state['batched'])
+
+
+def _attach(name: str, shape: tuple, dtype: str
+            ) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    memory = shared_memory.SharedMemory(name=name)
+    return memory, np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+
+
+class _SharedArray:
+    """
+    copy of an array in shared memory, to be attached to
+    in the worker processes using its `spec`
+    """
+    def __init__(self, array: np.ndarray) -> None:
+        array = np.ascontiguousarray(array)
+        self.memory = shared_memory.SharedMemory(
+            create=True, size=max(array.nbytes, 1))
+        shared = np.ndarray(
+            array.shape, dtype=array.dtype, buffer=self.memory.buf)
+        shared[...] = array
+        self.spec = (self.memory.name, array.shape, array.dtype.str)
+
+    def release(self) -> None:
+        self.memory.close()
+        self.memory.unlink()
@@ -0,0 +1,326 @@
+from triangle_cubature.data_structures import \
+    CoordinatesType, ElementsType
+from triangle_cubature.integrate import \
+    _get_element_geometry, _scale_elementwise
+from dataclasses import dataclass
+from functools import lru_cache, cached_property
+from math import factorial
+from typing import Union
+import numpy as np
+
+
+@dataclass(frozen=True, eq=False)
+class Polynomial:
+    """
+    polynomial (or batch of k polynomials) in two variables
+
+        p(x, y) = sum_j coefficients[j] * x^x_exponents[j] * y^y_exponents[j]
+
+    usage
+    -----
+    >>> # p(x, y) = 1 + 2xy - 3y^2
+    >>> p = Polynomial(
+    ...     x_exponents=np.array([0, 1, 0]),
+    ...     y_exponents=np.array([0, 1, 2]),
+    ...     coefficients=np.array([1., 2., -3.]))
+    >>> p.eval_at(coordinates)  # or, equivalently, p(coordinates)
+    >>> p.integrate_on_mesh(coordinates=coordinates, elements=elements)
+
+    notes
+    -----
+    - coefficients may be of shape (n_terms,) or (n_terms, k), where
+      the latter represents k polynomials sharing the same monomials,
+      in which case all values and integrals get a trailing axis of size k
+    - repeated monomials are allowed, their coefficients add up
+    - passed as integrand to the functions in `triangle_cubature.integrate`,
+      the polynomial is integrated exactly without any point evaluation
+    - polynomials compare (and hash) by identity, as the generated
+      comparison of the array fields would be ambiguous
+    """
+    x_exponents: np.ndarray
+    y_exponents: np.ndarray
+    coefficients: np.ndarray
+
+    def __post_init__(self) -> None:
+        x_exponents = np.asarray(self.x_exponents, dtype=int)
+        y_exponents = np.asarray(self.y_exponents, dtype=int)
+        coefficients = np.asarray(self.coefficients, dtype=float)
+        if not (x_exponents.ndim == y_exponents.ndim == 1
+                and x_exponents.shape[0] == y_exponents.shape[0]
+                == coefficients.shape[0]):
+            raise ValueError(
+                'x_exponents, y_exponents and coefficients '
+                'must have the same number of terms.')
+        if np.any(x_exponents < 0) or np.any(y_exponents < 0):
+            raise ValueError('exponents must be non-negative.')
+        for array in [x_exponents, y_exponents, coefficients]:
+            array.flags.writeable = False
+        object.__setattr__(self, 'x_exponents', x_exponents)
+        object.__setattr__(self, 'y_exponents', y_exponents)
+        object.__setattr__(self, 'coefficients', coefficients)
+
+    @property
+    def degree(self) -> int:
+        if self.x_exponents.shape[0] == 0:
+            return 0
+        return int(np.max(self.x_exponents + self.y_exponents))
+
+    @cached_property
+    def coefficient_matrix(self) -> np.ndarray:
+        """
+        dense (triangular) coefficient matrix `c` of shape
+        (degree+1, degree+1) or (degree+1, degree+1, k), where
+        `c[m, n]` is the coefficient of x^m y^n
+        """
+        coefficient_matrix = np.zeros(
+            (self.degree + 1, self.degree + 1) + self.coefficients.shape[1:])
+        np.add.at(coefficient_matrix,
+                  (self.x_exponents, self.y_exponents), self.coefficients)
+        coefficient_matrix.flags.writeable = False
+        return coefficient_matrix
+
+    def eval_at(self, coordinates: CoordinatesType) -> np.ndarray:
+        """
+        evaluates the polynomial(s) at the coordinates at hand
+
+        parameters
+        ----------
+        coordinates: CoordinatesType
+            the points of evaluation, i.e. array of shape (N, 2)
+
+        returns
+        -------
+        np.ndarray: the values of shape (N,) or (N, k), respectively
+
+        notes
+        -----
+        - using the coefficient matrix c, the polynomials
+          q_m(y) = sum_n c[m, n] y^n are evaluated at once using a table
+          of the powers of y, then p = sum_m x^m q_m(y) is evaluated
+          using Horner's scheme in x
+        """
+        xs = coordinates[:, 0]
+        ys = coordinates[:, 1]
+        degree = self.degree
+
+        y_powers = np.empty((coordinates.shape[0], degree + 1))
+        y_powers[:, 0] = 1.
+        for n in range(1, degree + 1):
+            np.multiply(y_powers[:, n - 1], ys, out=y_powers[:, n])
+
+        # q[:, m, ...] = q_m(y)
+        q = np.tensordot(y_powers, self.coefficient_matrix, axes=([1], [1]))
+
+        values = q[:, degree].copy()
+        for m in range(degree - 1, -1, -1):
+            values *= xs.reshape(xs.shape + (1,) * (values.ndim - 1))
+            values += q[:, m]
+        return values
+
+    def __call__(self, coordinates: CoordinatesType) -> np.ndarray:
+        return self.eval_at(coordinates=coordinates)
+
+    def integrate_on_mesh_elementwise(
+            self,
+            coordinates: CoordinatesType,
+            elements: ElementsType) -> np.ndarray:
+        """
+        integrates the polynomial(s) exactly (up to rounding)
+        on each element of the mesh at hand,
+        see `integrate_monomials_on_mesh_elementwise`
+        """
+        return integrate_monomials_on_mesh_elementwise(
+            x_exponents=self.x_exponents,
+            y_exponents=self.y_exponents,
+            coefficients=self.coefficients,
+            coordinates=coordinates,
+            elements=elements)
+
+    def integrate_on_mesh(
+            self,
+            coordinates: CoordinatesType,
+            elements: ElementsType) -> Union[float, np.ndarray]:
+        """
+        integrates the polynomial(s) exactly (up to rounding)
+        over the mesh at hand, see `integrate_monomials_on_mesh`
+        """
+        return integrate_monomials_on_mesh(
+            x_exponents=self.x_exponents,
+            y_exponents=self.y_exponents,
+            coefficients=self.coefficients,
+            coordinates=coordinates,
+            elements=elements)
+
+
+@lru_cache(maxsize=None)
+def get_reference_moments(max_degree: int) -> np.ndarray:
+    """
+    returns the moments of the reference triangle
+    conv{(0, 0), (1, 0), (0, 1)}, i.e. the array `moments`
+    of shape (max_degree+1, max_degree+1), where
+
+        moments[a, b] = int_{T_ref} s^a t^b d(s, t) = a! b! / (a+b+2)!
+
+    for a + b <= max_degree and zero otherwise
+
+    notes
+    -----
+    - the moments are memoized, i.e. the returned array is read-only
+    """
+    moments = np.zeros((max_degree + 1, max_degree + 1))
+    for a in range(max_degree + 1):
+        for b in range(max_degree + 1 - a):
+            moments[a, b] = factorial(a) * factorial(b) / factorial(a + b + 2)
+    moments.flags.writeable = False
+    return moments
+
+
+def integrate_monomials_on_mesh_elementwise(
+        x_exponents: np.ndarray,
+        y_exponents: np.ndarray,
+        coefficients: np.ndarray,
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        chunk_size: int = 65536) -> np.ndarray:
+    """
+    integrates the polynomial
+
+        p(x, y) = sum_k coefficients[k] * x^x_exponents[k] * y^y_exponents[k]
+
+    exactly (up to rounding) on each element of the mesh at hand
+
+    parameters
+    ----------
+    x_exponents: np.ndarray
+        the x-exponents of the monomials, i.e. array of shape (n_terms,)
+    y_exponents: np.ndarray
+        the y-exponents of the monomials, i.e. array of shape (n_terms,)
+    coefficients: np.ndarray
+        the coefficients of the monomials, i.e. array of shape
+        (n_terms,) or (n_terms, k) for k polynomials at once
+    coordinates: CoordinatesType
+        vertices of the mesh
+    elements: ElementsType
+        the elements of the mesh
+    chunk_size: int
+        maximal number of elements processed at a time
+
+    returns
+    -------
+    np.ndarray: the integrals on each element, i.e. array of shape
+        (n_elements,) or (n_elements, k), respectively
+
+    notes
+    -----
+    - each monomial is pulled back to the reference triangle using the
+      affine transformation (s, t) -> c1 + s*d21 + t*d31, i.e.
+      x^m y^n becomes a polynomial in (s, t), which is then integrated
+      using the moments of the reference triangle, see
+      `get_reference_moments`
+    - the pulled back monomials are built incrementally, i.e. one
+      multiplication by an affine function per monomial
+    """
+    x_exponents = np.asarray(x_exponents, dtype=int)
+    y_exponents = np.asarray(y_exponents, dtype=int)
+    coefficients = np.asarray(coefficients)
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer.')
+
+    n_elements = elements.shape[0]
+    local_integrals = np.zeros((n_elements,) + coefficients.shape[1:])
+    for start in range(0, n_elements, chunk_size):
+        chunk = slice(start, min(start + chunk_size, n_elements))
+        c1, d21, d31, areas_2 = _get_element_geometry(
+            coordinates=coordinates, elements=elements[chunk])
+        monomial_integrals = _get_monomial_integrals_on_reference(
+            x_exponents=x_exponents, y_exponents=y_exponents,
+            c1=c1, d21=d21, d31=d31)
+        local_integrals[chunk] = _scale_elementwise(
+            values=monomial_integrals @ coefficients, areas_2=areas_2)
+    return local_integrals
+
+
+def integrate_monomials_on_mesh(
+        x_exponents: np.ndarray,
+        y_exponents: np.ndarray,
+        coefficients: np.ndarray,
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        chunk_size: int = 65536) -> Union[float, np.ndarray]:
+    """
+    integrates the polynomial
+
+        p(x, y) = sum_k coefficients[k] * x^x_exponents[k] * y^y_exponents[k]
+
+    exactly (up to rounding) over the mesh at hand,
+    see `integrate_monomials_on_mesh_elementwise`
+
+    returns
+    -------
+    float | np.ndarray: the integral, of shape (k,)
+        if coefficients is of shape (n_terms, k)
+    """
+    local_integrals = integrate_monomials_on_mesh_elementwise(
+        x_exponents=x_exponents,
+        y_exponents=y_exponents,
+        coefficients=coefficients,
+        coordinates=coordinates,
+        elements=elements,
+        chunk_size=chunk_size)
+    return np.sum(local_integrals, axis=0)
+
+
+def _get_monomial_integrals_on_reference(
+        x_exponents: np.ndarray,
+        y_exponents: np.ndarray,
+        c1: np.ndarray,
+        d21: np.ndarray,
+        d31: np.ndarray) -> np.ndarray:
+    """
+    returns the array of shape (n_elements, n_terms) holding
+    int_{T_ref} (x^m y^n)(c1 + s*d21 + t*d31) d(s, t)
+    for each element and each monomial x^m y^n
+    """
+    n_elements = c1.shape[0]
+    n_terms = x_exponents.shape[0]
+    monomial_integrals = np.zeros((n_elements, n_terms))
+    if n_terms == 0:
+        return monomial_integrals
+
+    degree = int(np.max(x_exponents + y_exponents))
+    moments = get_reference_moments(max_degree=degree)
+
+    # the affine functions x(s, t) and y(s, t)
+    x_affine = (c1[:, 0], d21[:, 0], d31[:, 0])
+    y_affine = (c1[:, 1], d21[:, 1], d31[:, 1])
+
+    # p[:, a, b] is the coefficient of s^a t^b of x(s, t)^m
+    x_power = np.zeros((n_elements, degree + 1, degree + 1))
+    x_power[:, 0, 0] = 1.
+    for m in range(int(np.max(x_exponents)) + 1):
+        terms_m = np.flatnonzero(x_exponents == m)
+        if terms_m.size > 0:
+            monomial = x_power
+            for n in range(int(np.max(y_exponents[terms_m])) + 1):
+                terms_mn = terms_m[y_exponents[terms_m] == n]
+                if terms_mn.size > 0:
+                    monomial_integrals[:, terms_mn] = np.einsum(
+                        'kab,ab->k', monomial, moments)[:, np.newaxis]
+                monomial = _multiply_by_affine(monomial, *y_affine)
+        x_power = _multiply_by_affine(x_power, *x_affine)
+    return monomial_integrals
+
+
+def _multiply_by_affine(polynomials: np.ndarray,
+                        l0: np.ndarray,
+                        l1: np.ndarray,
+                        l2: np.ndarray) -> np.ndarray:
+    """
+    given polynomials in (s, t) as array of shape (n, D+1, D+1),
+    returns their product with the affine functions l0 + l1*s + l2*t,
+    truncated at degree D in s and t, respectively
+    """
+    product = l0[:, np.newaxis, np.newaxis] * polynomials
+    product[:, 1:, :] += l1[:, np.newaxis, np.newaxis] * polynomials[:, :-1, :]
+    product[:, :, 1:] += l2[:, np.newaxis, np.newaxis] * polynomials[:, :, :-1]
+    return product
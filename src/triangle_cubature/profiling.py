@@ -0,0 +1,146 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Callable, Iterator, Optional
+import numpy as np
+
+
+@dataclass
+class IntegrationProfile:
+    """
+    instrumentation data recorded during integration
+
+    attributes
+    ----------
+    timings: dict[str, float]
+        accumulated wall time (in seconds) per phase, i.e.
+        'geometry' (gathering the vertices and computing the areas),
+        'points' (transforming the integration points),
+        'evaluation' (calling f) and
+        'reduction' (weighting and summing up the values of f)
+    n_function_calls: int
+        the number of calls of f
+    n_points: int
+        the number of points f has been evaluated at
+    bytes_allocated: int
+        the total size (in bytes) of the temporary arrays
+        allocated by the integration routines, i.e. geometry,
+        integration points and the values of f
+    """
+    timings: dict[str, float] = field(default_factory=dict)
+    n_function_calls: int = 0
+    n_points: int = 0
+    bytes_allocated: int = 0
+
+    def phase(self, name: str) -> '_Phase':
+        """
+        returns a context manager adding the wall time
+        spent in its body to `timings[name]`
+        """
+        return _Phase(profile=self, name=name)
+
+    def record_evaluation(self, values: np.ndarray) -> None:
+        self.n_function_calls += 1
+        self.n_points += np.shape(values)[0]
+        self.bytes_allocated += np.asarray(values).nbytes
+
+    def record_allocation(self, *arrays: np.ndarray) -> None:
+        for array in arrays:
+            self.bytes_allocated += np.asarray(array).nbytes
+
+
+class _Phase:
+    __slots__ = ('profile', 'name', 'start')
+
+    def __init__(self, profile: IntegrationProfile, name: str) -> None:
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        timings = self.profile.timings
+        timings[self.name] = (
+            timings.get(self.name, 0.) + perf_counter() - self.start)
+
+
+class _DisabledProfile:
+    """
+    stand-in for `IntegrationProfile` if profiling is disabled,
+    i.e. all recording is a no-op
+    """
+    __slots__ = ()
+
+    def phase(self, name: str) -> '_DisabledProfile':
+        return self
+
+    def record_evaluation(self, values: np.ndarray) -> None:
+        pass
+
+    def record_allocation(self, *arrays: np.ndarray) -> None:
+        pass
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_DISABLED_PROFILE = _DisabledProfile()
+_active_profile: ContextVar[Optional[IntegrationProfile]] = ContextVar(
+    'active_profile', default=None)
+
+
+@contextmanager
+def profile_integration(
+        callback: Optional[Callable[[IntegrationProfile], None]] = None
+) -> Iterator[IntegrationProfile]:
+    """
+    records per-phase timings, function evaluations and temporary
+    allocations of all integrations within its body
+
+    parameters
+    ----------
+    callback: Optional[Callable[[IntegrationProfile], None]]
+        called with the recorded profile on exit,
+        e.g. to forward it to a metrics service
+
+    usage
+    -----
+    >>> with profile_integration() as profile:
+    ...     integrate_on_mesh(f, coordinates, elements, cubature_rule)
+    >>> profile.timings['evaluation']
+    >>> profile.n_function_calls
+
+    notes
+    -----
+    - profiles are bound to the current thread (or context), i.e.
+      integrations running in other threads or processes,
+      e.g. in `integrate_on_mesh_parallel`, are not recorded
+    - nested profiles record independently of each other,
+      i.e. the outer profile does not include the inner one
+    - if no profile is active, the instrumentation reduces to a
+      few no-op calls per integration point of the cubature rule
+    """
+    profile = IntegrationProfile()
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
+        if callback is not None:
+            callback(profile)
+
+
+def _get_active_profile():
+    """
+    returns the active `IntegrationProfile` or,
+    if profiling is disabled, a no-op stand-in
+    """
+    profile = _active_profile.get()
+    if profile is None:
+        return _DISABLED_PROFILE
+    return profile
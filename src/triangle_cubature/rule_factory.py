@@ -1,15 +1,363 @@
 import numpy as np
+from functools import lru_cache
+from math import gamma
+from typing import Union
 from triangle_cubature.cubature_rule \
     import CubatureRule, CubatureRuleEnum, WeightsAndIntegrationPoints
+from triangle_cubature.cubature_rule import LineRule
 
 
-def get_rule(rule: CubatureRuleEnum) -> CubatureRule:
+def _make_rule(
+        weights_and_integration_points: WeightsAndIntegrationPoints,
+        degree_of_exactness: int,
+        name: str) -> CubatureRule:
+    """
+    returns the cubature rule with read-only weights and
+    integration points, such that the shared rule
+    objects can not be corrupted by callers
+    """
+    weights_and_integration_points.weights.flags.writeable = False
+    weights_and_integration_points.integration_points.flags.writeable = False
+    return CubatureRule(
+        weights_and_integration_points=weights_and_integration_points,
+        degree_of_exactness=degree_of_exactness,
+        name=name)
+
+
+def _get_midpoint_rule() -> CubatureRule:
+    weights = np.array([1./2.])
+    integration_points = np.array([1./3., 1./3.]).reshape(1, 2)
+    weights_and_integration_points = WeightsAndIntegrationPoints(
+        weights=weights,
+        integration_points=integration_points)
+    name = 'midpoint'
+    degree_of_exactness = 1
+
+    return _make_rule(
+        weights_and_integration_points=weights_and_integration_points,
+        degree_of_exactness=degree_of_exactness,
+        name=name)
+
+
+def _get_lauffer_linear_rule() -> CubatureRule:
+    integration_points = np.array([
+        [0., 0.],
+        [1., 0.],
+        [0., 1.]
+    ])
+    weights = np.array([
+        1/3 * 0.5,
+        1/3 * 0.5,
+        1/3 * 0.5
+    ])
+    weights_and_integration_points = WeightsAndIntegrationPoints(
+        weights=weights,
+        integration_points=integration_points)
+    name = 'lauffer-linear'
+    degree_of_exactness = 1
+
+    return _make_rule(
+        weights_and_integration_points=weights_and_integration_points,
+        degree_of_exactness=degree_of_exactness,
+        name=name)
+
+
+def _get_smplx1_rule() -> CubatureRule:
+    r = (1.)/(6.)
+    s = 2./3.
+    integration_points = np.array([
+        [r, r],
+        [r, s],
+        [s, r]
+    ])
+    weights = np.array([
+        1/3 * 0.5,
+        1/3 * 0.5,
+        1/3 * 0.5
+    ])
+    weights_and_integration_points = WeightsAndIntegrationPoints(
+        weights=weights,
+        integration_points=integration_points)
+    name = 'SMPLX1'
+    degree_of_exactness = 2
+
+    return _make_rule(
+        weights_and_integration_points=weights_and_integration_points,
+        degree_of_exactness=degree_of_exactness,
+        name=name)
+
+
+def _get_day_taylor_rule() -> CubatureRule:
+    """
+    https://www.math.unipd.it/~alvise/SETS_CUBATURE_TRIANGLE/day_taylor/set_day_taylor_standard.m
+
+    If specified lik unavailable, see instead
+    D.M. Day and M.A. Taylor,
+    "A new 11 point degree 6 formula for the triangle",
+    PAMM Proc. Appl. Math. Mech. 7 1022501-1022502 (2007).
+    """
+
+    integration_points = np.array([
+        [5.72549866774768601018763547472190e-02,
+            8.95498146789879490015096052957233e-01],
+        [8.95362640024579103936730462010019e-01,
+            6.18282212503219533172860167269391e-02],
+        [6.84475748456514043738252439652570e-01,
+            2.33437384976827311255931363120908e-02],
+        [6.87462559150295304810640573123237e-02,
+            6.00302757472630024726534259116306e-02],
+        [6.15676205575839574635210738051683e-01,
+            3.33461808341377174969011321081780e-01],
+        [6.27946141197789464705181217141217e-01,
+            1.59189185992151482906820092466660e-01],
+        [6.29091383418635685664810353046050e-02,
+            6.55295093705452469379224567092024e-01],
+        [6.83782119205099125913704938284354e-02,
+            3.09117685428267230385301900241757e-01],
+        [2.87529458374392254960127957019722e-01,
+            6.36426509179620181200220940809231e-01],
+        [3.28783556413134614437865366198821e-01,
+            7.70240056424634222942415817669826e-02],
+        [3.12290405013644800646943622268736e-01,
+            3.52344786445899504911949406960048e-01]])
+    weights = np.array([
+        1.90340359264777984893424189749567e-02,
+        1.91896776538764100850098515138598e-02,
+        2.31002283722809183263979804223709e-02,
+        2.67337947220994999464327435134692e-02,
+        4.18779134828728416550802648998797e-02,
+        5.08224165127585322809800061349961e-02,
+        5.09307622306834767433869615160802e-02,
+        5.57109158300008525110946777658683e-02,
+        5.60047251314730321070101126679219e-02,
+        6.23937857187791614088645530955546e-02,
+        9.42017444186974139963552943299874e-02])
+    weights_and_integration_points = WeightsAndIntegrationPoints(
+        weights=weights,
+        integration_points=integration_points)
+    name = 'DAYTAYLOR'
+    degree_of_exactness = 6
+
+    return _make_rule(
+        weights_and_integration_points=weights_and_integration_points,
+        degree_of_exactness=degree_of_exactness,
+        name=name)
+
+
+def _get_s21_orbit(a: float) -> np.ndarray:
+    """
+    returns the 3 points with barycentric coordinates
+    being the permutations of (a, a, 1-2a)
+    """
+    b = 1. - 2.*a
+    return np.array([[a, a], [a, b], [b, a]])
+
+
+def _get_s111_orbit(a: float, b: float) -> np.ndarray:
+    """
+    returns the 6 points with barycentric coordinates
+    being the permutations of (a, b, 1-a-b)
+    """
+    c = 1. - a - b
+    return np.array([[a, b], [b, a], [a, c], [c, a], [b, c], [c, b]])
+
+
+def _get_c3_orbit(a: float, b: float) -> np.ndarray:
+    """
+    returns the 3 points with barycentric coordinates
+    being the cyclic permutations of (a, b, 1-a-b)
+    """
+    c = 1. - a - b
+    return np.array([[a, b], [b, c], [c, a]])
+
+
+def _get_dunavant4_rule() -> CubatureRule:
+    """
+    D.A. Dunavant,
+    'High degree efficient symmetrical Gaussian quadrature
+    rules for the triangle',
+    Int. J. Numer. Meth. Engng. 21, 1129-1148 (1985).
+
+    NOTE the weights and integration points have been refined
+    to full double precision using the moment equations.
+    """
+    integration_points = np.vstack([
+        _get_s21_orbit(4.4594849091596488632e-01),
+        _get_s21_orbit(9.1576213509770743460e-02)])
+    weights = np.repeat([
+        1.1169079483900573285e-01,
+        5.4975871827660933819e-02], 3)
+    weights_and_integration_points = WeightsAndIntegrationPoints(
+        weights=weights,
+        integration_points=integration_points)
+    name = 'DUNAVANT4'
+    degree_of_exactness = 4
+
+    return _make_rule(
+        weights_and_integration_points=weights_and_integration_points,
+        degree_of_exactness=degree_of_exactness,
+        name=name)
+
+
+def _get_radon5_rule() -> CubatureRule:
+    """
+    J. Radon,
+    'Zur mechanischen Kubatur',
+    Monatsh. Math. 52, 286-300 (1948),
+    see also [1], formula T2:5-1.
+    """
+    sqrt_15 = np.sqrt(15.)
+    integration_points = np.vstack([
+        np.array([[1./3., 1./3.]]),
+        _get_s21_orbit((6. - sqrt_15)/21.),
+        _get_s21_orbit((6. + sqrt_15)/21.)])
+    weights = np.concatenate([
+        [9./80.],
+        np.repeat((155. - sqrt_15)/2400., 3),
+        np.repeat((155. + sqrt_15)/2400., 3)])
+    weights_and_integration_points = WeightsAndIntegrationPoints(
+        weights=weights,
+        integration_points=integration_points)
+    name = 'RADON5'
+    degree_of_exactness = 5
+
+    return _make_rule(
+        weights_and_integration_points=weights_and_integration_points,
+        degree_of_exactness=degree_of_exactness,
+        name=name)
+
+
+def _get_gatermann7_rule() -> CubatureRule:
+    """
+    K. Gatermann,
+    'The construction of symmetric cubature formulas
+    for the square and the triangle',
+    Computing 40, 229-240 (1988).
+
+    NOTE the weights and integration points have been refined
+    to full double precision using the moment equations.
+    """
+    integration_points = np.vstack([
+        _get_c3_orbit(6.2382265094402118174e-02, 6.7517867073916085443e-02),
+        _get_c3_orbit(5.5225456656926611737e-02, 3.2150249385198182267e-01),
+        _get_c3_orbit(3.4324302945097146470e-02, 6.6094919618673565761e-01),
+        _get_c3_orbit(5.1584233435359177926e-01, 2.7771616697639178257e-01)])
+    weights = np.repeat([
+        2.6517028157436251429e-02,
+        4.3881408714446055037e-02,
+        2.8775042784981585738e-02,
+        6.7493187009802774463e-02], 3)
+    weights_and_integration_points = WeightsAndIntegrationPoints(
+        weights=weights,
+        integration_points=integration_points)
+    name = 'GATERMANN7'
+    degree_of_exactness = 7
+
+    return _make_rule(
+        weights_and_integration_points=weights_and_integration_points,
+        degree_of_exactness=degree_of_exactness,
+        name=name)
+
+
+def _get_dunavant8_rule() -> CubatureRule:
+    """
+    D.A. Dunavant,
+    'High degree efficient symmetrical Gaussian quadrature
+    rules for the triangle',
+    Int. J. Numer. Meth. Engng. 21, 1129-1148 (1985).
+
+    NOTE the weights and integration points have been refined
+    to full double precision using the moment equations.
+    """
+    integration_points = np.vstack([
+        np.array([[1./3., 1./3.]]),
+        _get_s21_orbit(4.5929258829272315603e-01),
+        _get_s21_orbit(1.7056930775176020662e-01),
+        _get_s21_orbit(5.0547228317030975458e-02),
+        _get_s111_orbit(8.3947774099576053372e-03, 2.6311282963463811342e-01)])
+    weights = np.concatenate([
+        [7.2157803838893584126e-02],
+        np.repeat(4.7545817133642312397e-02, 3),
+        np.repeat(5.1608685267359125141e-02, 3),
+        np.repeat(1.6229248811599040155e-02, 3),
+        np.repeat(1.3615157087217497132e-02, 6)])
+    weights_and_integration_points = WeightsAndIntegrationPoints(
+        weights=weights,
+        integration_points=integration_points)
+    name = 'DUNAVANT8'
+    degree_of_exactness = 8
+
+    return _make_rule(
+        weights_and_integration_points=weights_and_integration_points,
+        degree_of_exactness=degree_of_exactness,
+        name=name)
+
+
+def _get_dunavant9_rule() -> CubatureRule:
+    """
+    D.A. Dunavant,
+    'High degree efficient symmetrical Gaussian quadrature
+    rules for the triangle',
+    Int. J. Numer. Meth. Engng. 21, 1129-1148 (1985).
+
+    NOTE the weights and integration points have been refined
+    to full double precision using the moment equations.
+    """
+    integration_points = np.vstack([
+        np.array([[1./3., 1./3.]]),
+        _get_s21_orbit(4.8968251919873762778e-01),
+        _get_s21_orbit(4.3708959149293663727e-01),
+        _get_s21_orbit(1.8820353561903273024e-01),
+        _get_s21_orbit(4.4729513394452709865e-02),
+        _get_s111_orbit(3.6838412054736283635e-02, 2.2196298916076569568e-01)])
+    weights = np.concatenate([
+        [4.8567898141399416910e-02],
+        np.repeat(1.5667350113569535268e-02, 3),
+        np.repeat(3.8913770502387139658e-02, 3),
+        np.repeat(3.9823869463605126516e-02, 3),
+        np.repeat(1.2788837829349015631e-02, 3),
+        np.repeat(2.1641769688644688645e-02, 6)])
+    weights_and_integration_points = WeightsAndIntegrationPoints(
+        weights=weights,
+        integration_points=integration_points)
+    name = 'DUNAVANT9'
+    degree_of_exactness = 9
+
+    return _make_rule(
+        weights_and_integration_points=weights_and_integration_points,
+        degree_of_exactness=degree_of_exactness,
+        name=name)
+
+
+_RULES: dict[CubatureRuleEnum, CubatureRule] = {
+    CubatureRuleEnum.MIDPOINT: _get_midpoint_rule(),
+    CubatureRuleEnum.LAUFFER_LINEAR: _get_lauffer_linear_rule(),
+    CubatureRuleEnum.SMPLX1: _get_smplx1_rule(),
+    CubatureRuleEnum.DAYTAYLOR: _get_day_taylor_rule(),
+    CubatureRuleEnum.DUNAVANT4: _get_dunavant4_rule(),
+    CubatureRuleEnum.RADON5: _get_radon5_rule(),
+    CubatureRuleEnum.GATERMANN7: _get_gatermann7_rule(),
+    CubatureRuleEnum.DUNAVANT8: _get_dunavant8_rule(),
+    CubatureRuleEnum.DUNAVANT9: _get_dunavant9_rule()
+}
+
+
+def get_rule(rule: Union[CubatureRuleEnum, int]) -> CubatureRule:
     """
     given a cubature rule, returns the corresponding
     weight(s) and integration point(s)
 
+    parameters
+    ----------
+    rule: CubatureRuleEnum | int
+        the cubature rule or the required degree of exactness,
+        in the latter case, the rule with the least integration
+        points is returned, see `get_rule_by_degree`
+
     Notes
     -----
+    - the returned rule is shared between all callers,
+      i.e. it is immutable and its arrays are read-only
     - the rules correspond to the rules as specified in [1]
 
     References
@@ -19,120 +367,176 @@ def get_rule(rule: CubatureRuleEnum) -> CubatureRule:
       SIAM Review 15, no. 1 (January 1973): 234-35.
       https://doi.org/10.1137/1015023. p. 306-315
     """
-    if rule == CubatureRuleEnum.MIDPOINT:
-        weights = np.array([1./2.])
-        integration_points = np.array([1./3., 1./3.]).reshape(1, 2)
-        weights_and_integration_points = WeightsAndIntegrationPoints(
-            weights=weights,
-            integration_points=integration_points)
-        name = 'midpoint'
-        degree_of_exactness = 1
-
-        return CubatureRule(
-            weights_and_integration_points=weights_and_integration_points,
-            degree_of_exactness=degree_of_exactness,
-            name=name)
-
-    if rule == CubatureRuleEnum.LAUFFER_LINEAR:
-        integration_points = np.array([
-            [0., 0.],
-            [1., 0.],
-            [0., 1.]
-        ])
-        weights = np.array([
-            1/3 * 0.5,
-            1/3 * 0.5,
-            1/3 * 0.5
-        ])
-        weights_and_integration_points = WeightsAndIntegrationPoints(
-            weights=weights,
-            integration_points=integration_points)
-        name = 'lauffer-linear'
-        degree_of_exactness = 1
-
-        return CubatureRule(
-            weights_and_integration_points=weights_and_integration_points,
-            degree_of_exactness=degree_of_exactness,
-            name=name)
-
-    if rule == CubatureRuleEnum.SMPLX1:
-        r = (1.)/(6.)
-        s = 2./3.
-        integration_points = np.array([
-            [r, r],
-            [r, s],
-            [s, r]
-        ])
-        weights = np.array([
-            1/3 * 0.5,
-            1/3 * 0.5,
-            1/3 * 0.5
-        ])
-        weights_and_integration_points = WeightsAndIntegrationPoints(
-            weights=weights,
-            integration_points=integration_points)
-        name = 'SMPLX1'
-        degree_of_exactness = 2
-
-        return CubatureRule(
-            weights_and_integration_points=weights_and_integration_points,
-            degree_of_exactness=degree_of_exactness,
-            name=name)
-
-    if rule == CubatureRuleEnum.DAYTAYLOR:
-        """
-        https://www.math.unipd.it/~alvise/SETS_CUBATURE_TRIANGLE/day_taylor/set_day_taylor_standard.m
-
-        If specified lik unavailable, see instead
-        D.M. Day and M.A. Taylor,
-        "A new 11 point degree 6 formula for the triangle",
-        PAMM Proc. Appl. Math. Mech. 7 1022501-1022502 (2007).
-        """
-
-        integration_points = np.array([
-            [5.72549866774768601018763547472190e-02,
-                8.95498146789879490015096052957233e-01],
-            [8.95362640024579103936730462010019e-01,
-                6.18282212503219533172860167269391e-02],
-            [6.84475748456514043738252439652570e-01,
-                2.33437384976827311255931363120908e-02],
-            [6.87462559150295304810640573123237e-02,
-                6.00302757472630024726534259116306e-02],
-            [6.15676205575839574635210738051683e-01,
-                3.33461808341377174969011321081780e-01],
-            [6.27946141197789464705181217141217e-01,
-                1.59189185992151482906820092466660e-01],
-            [6.29091383418635685664810353046050e-02,
-                6.55295093705452469379224567092024e-01],
-            [6.83782119205099125913704938284354e-02,
-                3.09117685428267230385301900241757e-01],
-            [2.87529458374392254960127957019722e-01,
-                6.36426509179620181200220940809231e-01],
-            [3.28783556413134614437865366198821e-01,
-                7.70240056424634222942415817669826e-02],
-            [3.12290405013644800646943622268736e-01,
-                3.52344786445899504911949406960048e-01]])
-        weights = np.array([
-            1.90340359264777984893424189749567e-02,
-            1.91896776538764100850098515138598e-02,
-            2.31002283722809183263979804223709e-02,
-            2.67337947220994999464327435134692e-02,
-            4.18779134828728416550802648998797e-02,
-            5.08224165127585322809800061349961e-02,
-            5.09307622306834767433869615160802e-02,
-            5.57109158300008525110946777658683e-02,
-            5.60047251314730321070101126679219e-02,
-            6.23937857187791614088645530955546e-02,
-            9.42017444186974139963552943299874e-02])
-        weights_and_integration_points = WeightsAndIntegrationPoints(
-            weights=weights,
-            integration_points=integration_points)
-        name = 'DAYTAYLOR'
-        degree_of_exactness = 6
-
-        return CubatureRule(
-            weights_and_integration_points=weights_and_integration_points,
-            degree_of_exactness=degree_of_exactness,
-            name=name)
-
-    raise ValueError('specified rule does not exist.')
+    if isinstance(rule, (int, np.integer)):
+        return get_rule_by_degree(degree=rule)
+    try:
+        return _RULES[rule]
+    except KeyError:
+        raise ValueError('specified rule does not exist.') from None
+
+
+def get_rule_by_degree(degree: int) -> CubatureRule:
+    """
+    returns the rule with the least integration points
+    among all rules exact for polynomials of the specified degree
+
+    Notes
+    -----
+    - candidates are the rules in `CubatureRuleEnum`
+      and the collapsed Gauss-Jacobi rules
+    - the lookup uses a precomputed registry,
+      i.e. it runs in constant time
+    """
+    if degree < 0:
+        raise ValueError('degree must be a non-negative integer.')
+    if degree < len(_RULES_BY_DEGREE):
+        return _RULES_BY_DEGREE[degree]
+    return get_gauss_jacobi_rule(degree=degree)
+
+
+def get_gauss_jacobi_rule(degree: int) -> CubatureRule:
+    """
+    returns a collapsed (conical product) Gauss-Jacobi rule
+    exact for polynomials of (at least) the specified degree,
+    i.e. n^2 integration points, where n = ceil((degree+1)/2)
+
+    Notes
+    -----
+    - the reference triangle is collapsed to the unit square using
+      the Duffy transformation (s, t) -> (s, (1-s)t), where the
+      Jacobian (1-s) is integrated exactly by the Gauss-Jacobi rule
+      with weight (1-s) in s, and Gauss-Legendre is used in t
+    - the rules are memoized, i.e. the returned rule is shared
+      between all callers and its arrays are read-only
+    - for low degrees, the tabulated rules in `CubatureRuleEnum`
+      need considerably less integration points
+
+    References
+    ----------
+    - [1] Stenger, Frank.
+      'Approximate Calculation of Multiple Integrals (A. H. Stroud)'.
+      SIAM Review 15, no. 1 (January 1973): 234-35.
+      https://doi.org/10.1137/1015023. p. 18-31
+    """
+    if degree < 0:
+        raise ValueError('degree must be a non-negative integer.')
+    return _get_gauss_jacobi_rule(n=degree//2 + 1)
+
+
+@lru_cache(maxsize=None)
+def _get_gauss_jacobi_rule(n: int) -> CubatureRule:
+    """
+    returns the collapsed Gauss-Jacobi rule with n^2 integration points,
+    i.e. of degree of exactness 2n-1
+    """
+    # Gauss-Jacobi on [0, 1] with weight (1-s)
+    s, weights_s = _get_gauss_jacobi_nodes_and_weights(n=n, alpha=1.)
+    s, weights_s = (1. + s)/2., weights_s/4.
+    # Gauss-Legendre on [0, 1]
+    t, weights_t = np.polynomial.legendre.leggauss(n)
+    t, weights_t = (1. + t)/2., weights_t/2.
+
+    ss, tt = np.meshgrid(s, t, indexing='ij')
+    integration_points = np.column_stack(
+        [ss.ravel(), ((1. - ss) * tt).ravel()])
+    weights = np.outer(weights_s, weights_t).ravel()
+
+    weights_and_integration_points = WeightsAndIntegrationPoints(
+        weights=weights,
+        integration_points=integration_points)
+    return _make_rule(
+        weights_and_integration_points=weights_and_integration_points,
+        degree_of_exactness=2*n - 1,
+        name=f'gauss-jacobi-{n}x{n}')
+
+
+def get_gauss_legendre_rule(degree: int) -> LineRule:
+    """
+    returns the Gauss-Legendre rule on the unit interval [0, 1]
+    exact for polynomials of (at least) the specified degree,
+    i.e. n integration points, where n = ceil((degree+1)/2)
+
+    Notes
+    -----
+    - as opposed to the cubature rules on triangles, a `LineRule`
+      is returned, i.e. the integration points are the parameters
+      t in [0, 1] of shape (n,), and the weights sum up to one,
+      such that the integral over the edge from a to b reads
+      |b - a| * sum_q w_q f(a + t_q (b - a))
+    - the rules are memoized, i.e. the returned rule is shared
+      between all callers and its arrays are read-only
+    """
+    if degree < 0:
+        raise ValueError('degree must be a non-negative integer.')
+    return _get_gauss_legendre_rule(n=degree//2 + 1)
+
+
+@lru_cache(maxsize=None)
+def _get_gauss_legendre_rule(n: int) -> LineRule:
+    """
+    returns the Gauss-Legendre rule on [0, 1] with n integration points,
+    i.e. of degree of exactness 2n-1
+    """
+    t, weights = np.polynomial.legendre.leggauss(n)
+    weights = weights/2.
+    integration_points = (1. + t)/2.
+    weights.flags.writeable = False
+    integration_points.flags.writeable = False
+    return LineRule(
+        weights=weights,
+        integration_points=integration_points,
+        degree_of_exactness=2*n - 1,
+        name=f'gauss-legendre-{n}')
+
+
+def _get_gauss_jacobi_nodes_and_weights(
+        n: int, alpha: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    returns the n nodes and weights of the Gauss-Jacobi rule on [-1, 1]
+    with weight function (1-x)^alpha, i.e. beta = 0,
+    using the Golub-Welsch algorithm
+    """
+    beta = 0.
+    k = np.arange(n)
+    a_b = alpha + beta
+    denominator = (2.*k + a_b) * (2.*k + a_b + 2.)
+    diagonal = np.where(
+        denominator != 0.,
+        (beta**2 - alpha**2) / np.where(denominator != 0., denominator, 1.),
+        (beta - alpha) / (a_b + 2.))
+    k = np.arange(1, n)
+    off_diagonal = np.sqrt(
+        4.*k*(k + alpha)*(k + beta)*(k + a_b)
+        / ((2.*k + a_b)**2 * (2.*k + a_b + 1.) * (2.*k + a_b - 1.)))
+
+    jacobi_matrix = (np.diag(diagonal)
+                     + np.diag(off_diagonal, 1)
+                     + np.diag(off_diagonal, -1))
+    nodes, eigenvectors = np.linalg.eigh(jacobi_matrix)
+    # integral of the weight function over [-1, 1]
+    mu_0 = 2.**(a_b + 1.) * gamma(alpha + 1.) * gamma(beta + 1.) \
+        / gamma(a_b + 2.)
+    return nodes, mu_0 * eigenvectors[0, :]**2
+
+
+def _get_rules_by_degree() -> list[CubatureRule]:
+    """
+    returns the list `rules`, where `rules[d]` is the rule with the
+    least integration points among all rules exact for degree d,
+    for all degrees covered by the rules in `CubatureRuleEnum`
+    """
+    max_degree = max(rule.degree_of_exactness for rule in _RULES.values())
+    candidates = list(_RULES.values()) + [
+        get_gauss_jacobi_rule(degree=degree)
+        for degree in range(max_degree + 1)]
+
+    def n_points(rule: CubatureRule) -> int:
+        return rule.weights_and_integration_points.weights.shape[0]
+
+    return [
+        min((rule for rule in candidates
+             if rule.degree_of_exactness >= degree), key=n_points)
+        for degree in range(max_degree + 1)]
+
+
+_RULES_BY_DEGREE: list[CubatureRule] = _get_rules_by_degree()
@@ -0,0 +1,145 @@
+from triangle_cubature.data_structures import \
+    CoordinatesType, ElementsType
+from triangle_cubature.cubature_rule \
+    import CubatureRuleEnum, WeightsAndIntegrationPoints
+from triangle_cubature.rule_factory import get_rule
+from triangle_cubature.integrate import \
+    _get_element_geometry, _get_weighted_sums, _sum_over_elements
+from triangle_cubature.summation import CompensatedSum
+from typing import Callable, Iterable, Iterator, Union
+import numpy as np
+
+
+def iterate_element_blocks(elements: ElementsType,
+                           chunk_size: int) -> Iterator[ElementsType]:
+    """
+    yields consecutive blocks of at most `chunk_size` elements,
+    each block being a view into `elements`, i.e. no copy
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer.')
+    for start in range(0, elements.shape[0], chunk_size):
+        yield elements[start:start + chunk_size]
+
+
+def integrate_on_element_blocks(
+        f: Callable[[CoordinatesType], np.ndarray],
+        coordinates: CoordinatesType,
+        element_blocks: Iterable[ElementsType],
+        cubature_rule: Union[CubatureRuleEnum, int],
+        batched: bool = False) -> Union[float, np.ndarray]:
+    """
+    approximates the integral of the function provided
+    over the mesh given as stream of element blocks
+    using the specified cubature rule
+
+    parameters
+    ----------
+    f: Callable[[CoordinatesType], np.ndarray]
+        the function to be integrated
+    coordinates: CoordinatesType
+        vertices of the mesh
+    element_blocks: Iterable[ElementsType]
+        the elements of the mesh, given as iterable
+        (e.g. generator) of element arrays of shape (M_k, 3)
+    cubature_rule: CubatureRuleEnum | int
+        the cubature rule to be used or the required
+        degree of exactness, see `get_rule_by_degree`
+    batched: bool
+        if True, f is called once per block on all integration
+        points of the block instead of once per integration point
+        of the cubature rule
+
+    returns
+    -------
+    float | np.ndarray: the approximated value of the integral
+
+    notes
+    -----
+    - only one block is processed at a time, i.e. peak memory of
+      the temporaries is bounded by the size of the largest block
+    - the partial sums of the blocks are accumulated using
+      compensated summation
+    - an empty stream integrates to zero of the shape of the values
+      of f, i.e. f is called once on an empty array, as for
+      `integrate_on_mesh` without any (marked) elements
+    """
+    waip = get_rule(rule=cubature_rule).weights_and_integration_points
+
+    total = CompensatedSum()
+    is_empty = True
+    for elements in element_blocks:
+        is_empty = False
+        total.add(_integrate_on_block(
+            f=f, coordinates=coordinates, elements=elements,
+            waip=waip, batched=batched))
+    if is_empty:
+        total.add(_integrate_on_block(
+            f=f, coordinates=coordinates,
+            elements=np.zeros((0, 3), dtype=int),
+            waip=waip, batched=batched))
+    return total.value
+
+
+def integrate_on_mesh_in_chunks(
+        f: Callable[[CoordinatesType], np.ndarray],
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        cubature_rule: Union[CubatureRuleEnum, int],
+        chunk_size: int,
+        batched: bool = False) -> Union[float, np.ndarray]:
+    """
+    approximates the integral of the function provided
+    over the mesh at hand using the specified cubature rule,
+    processing at most `chunk_size` elements at a time
+
+    parameters
+    ----------
+    f: Callable[[CoordinatesType], np.ndarray]
+        the function to be integrated
+    coordinates: CoordinatesType
+        vertices of the mesh
+    elements: ElementsType
+        the elements of the mesh
+    cubature_rule: CubatureRuleEnum | int
+        the cubature rule to be used or the required
+        degree of exactness, see `get_rule_by_degree`
+    chunk_size: int
+        maximal number of elements processed at a time
+    batched: bool
+        if True, f is called once per chunk on all integration
+        points of the chunk instead of once per integration point
+        of the cubature rule
+
+    returns
+    -------
+    float | np.ndarray: the approximated value of the integral
+
+    notes
+    -----
+    - peak memory of the temporaries is bounded by `chunk_size`,
+      not by the number of elements of the mesh
+    """
+    return integrate_on_element_blocks(
+        f=f,
+        coordinates=coordinates,
+        element_blocks=iterate_element_blocks(
+            elements=elements, chunk_size=chunk_size),
+        cubature_rule=cubature_rule,
+        batched=batched)
+
+
+def _integrate_on_block(
+        f: Callable[[CoordinatesType], np.ndarray],
+        coordinates: CoordinatesType,
+        elements: ElementsType,
+        waip: WeightsAndIntegrationPoints,
+        batched: bool) -> Union[float, np.ndarray]:
+    """
+    returns the approximated integral over a single block of elements
+    """
+    c1, d21, d31, areas_2 = _get_element_geometry(
+        coordinates=coordinates, elements=elements)
+    weighted_sums = _get_weighted_sums(
+        f=f, c1=c1, d21=d21, d31=d31, waip=waip, batched=batched)
+    return _sum_over_elements(values=weighted_sums, areas_2=areas_2)
@@ -0,0 +1,92 @@
+import numpy as np
+from typing import Union
+
+
+class CompensatedSum:
+    """
+    accumulates (arrays of) floating point numbers using
+    Kahan-Babuska-Neumaier compensated summation, i.e. the rounding
+    error of each addition is tracked and added back at the end
+
+    usage
+    -----
+    >>> total = CompensatedSum()
+    >>> for partial_sum in partial_sums:
+    ...     total.add(partial_sum)
+    >>> total.value
+
+    References
+    ----------
+    - [1] Neumaier, A.
+      'Rundungsfehleranalyse einiger Verfahren zur Summation endlicher
+      Summen'. ZAMM 54, no. 1 (1974): 39-51.
+      https://doi.org/10.1002/zamm.19740540106.
+    """
+    _sum: np.ndarray
+    _compensation: np.ndarray
+
+    def __init__(self, dtype: np.dtype = np.float64) -> None:
+        """
+        parameters
+        ----------
+        dtype: np.dtype
+            floating point type of the accumulators,
+            e.g. np.float32 or np.float64
+        """
+        self._sum = np.zeros((), dtype=dtype)
+        self._compensation = np.zeros((), dtype=dtype)
+
+    def add(self, value: Union[float, np.ndarray]) -> None:
+        value = np.asarray(value, dtype=self._sum.dtype)
+        new_sum = self._sum + value
+        self._compensation = self._compensation + np.where(
+            np.abs(self._sum) >= np.abs(value),
+            (self._sum - new_sum) + value,
+            (value - new_sum) + self._sum)
+        self._sum = new_sum
+
+    @property
+    def value(self) -> Union[float, np.ndarray]:
+        return (self._sum + self._compensation)[()]
+
+
+def compensated_sum(values: np.ndarray) -> Union[float, np.ndarray]:
+    """
+    sums up the values along the first axis using compensated
+    summation, see `CompensatedSum`, in the floating point type
+    of the values
+
+    parameters
+    ----------
+    values: np.ndarray
+        array of shape (n,) or (n, ...)
+
+    returns
+    -------
+    float | np.ndarray: the sum, of shape (...)
+
+    notes
+    -----
+    - the n values are split into about sqrt(n) blocks of about sqrt(n)
+      values, which are summed up simultaneously, i.e. there are only
+      O(sqrt(n)) vectorized additions
+    """
+    n = values.shape[0]
+    n_columns = max(int(np.ceil(np.sqrt(n))), 1)
+    n_rows = n // n_columns
+    blocks = values[:n_rows * n_columns].reshape(
+        (n_rows, n_columns) + values.shape[1:])
+
+    column_sums = CompensatedSum(dtype=values.dtype)
+    for row in blocks:
+        column_sums.add(row)
+
+    total = CompensatedSum(dtype=values.dtype)
+    if n_rows > 0:
+        for column_sum, column_compensation in zip(
+                column_sums._sum, column_sums._compensation):
+            total.add(column_sum)
+            total.add(column_compensation)
+    for value in values[n_rows * n_columns:]:
+        total.add(value)
+    return total.value
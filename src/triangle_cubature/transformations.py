@@ -1,5 +1,5 @@
 import numpy as np
-from p1afempy.data_structures import CoordinatesType
+from triangle_cubature.data_structures import CoordinatesType, ElementsType
 from triangle_cubature.cubature_rule \
     import WeightsAndIntegrationPoints
 
@@ -29,7 +29,8 @@ def transform_weights_and_integration_points(
 
 def transform_weights(reference_weights: np.ndarray,
                       jacobian: np.ndarray) -> np.ndarray:
-    jacobian_determinant = np.linalg.det(jacobian)
+    jacobian_determinant = (
+        jacobian[0, 0]*jacobian[1, 1] - jacobian[0, 1]*jacobian[1, 0])
     return jacobian_determinant * reference_weights
 
 
@@ -49,3 +50,110 @@ def get_jacobian(physical_triangle: CoordinatesType) -> np.ndarray:
     p2 = physical_triangle[1, :]
     p3 = physical_triangle[2, :]
     return np.column_stack((p2 - p1, p3 - p1))
+
+
+# -----------------------------------------------------------------
+# batched transformations, i.e. for stacks of N triangles at once
+# -----------------------------------------------------------------
+
+
+def get_physical_triangles(coordinates: CoordinatesType,
+                           elements: ElementsType) -> np.ndarray:
+    """
+    returns the vertices of all elements of the mesh
+    as array of shape (N, 3, 2)
+    """
+    return coordinates[elements]
+
+
+def get_jacobians(physical_triangles: np.ndarray) -> np.ndarray:
+    """
+    returns the jacobians of the affine transformations
+    from the reference triangle to each of the physical triangles
+
+    parameters
+    ----------
+    physical_triangles: np.ndarray
+        array of shape (N, 3, 2) holding the vertices
+        of each triangle in counter-clockwise order
+
+    returns
+    -------
+    np.ndarray: the jacobians as array of shape (N, 2, 2),
+        i.e. `jacobians[k] = get_jacobian(physical_triangles[k])`
+    """
+    p1 = physical_triangles[:, 0, :]
+    return np.stack((physical_triangles[:, 1, :] - p1,
+                     physical_triangles[:, 2, :] - p1), axis=-1)
+
+
+def get_jacobian_determinants(jacobians: np.ndarray) -> np.ndarray:
+    """
+    returns the determinants of a stack of (N, 2, 2) jacobians
+    in closed form, i.e. the doubled (signed) areas of the
+    corresponding triangles, as array of shape (N,)
+    """
+    return (jacobians[:, 0, 0]*jacobians[:, 1, 1]
+            - jacobians[:, 0, 1]*jacobians[:, 1, 0])
+
+
+def transform_weights_batched(reference_weights: np.ndarray,
+                              jacobians: np.ndarray) -> np.ndarray:
+    """
+    returns the weights transformed to each of the N triangles
+    as array of shape (N, n_qp)
+    """
+    return np.multiply.outer(
+        get_jacobian_determinants(jacobians=jacobians), reference_weights)
+
+
+def transform_integration_points_batched(
+        reference_integration_points: CoordinatesType,
+        p1: np.ndarray,
+        jacobians: np.ndarray) -> np.ndarray:
+    """
+    returns the integration points transformed to each of the
+    N triangles as array of shape (N, n_qp, 2)
+
+    parameters
+    ----------
+    reference_integration_points: CoordinatesType
+        the integration points on the reference triangle,
+        i.e. array of shape (n_qp, 2)
+    p1: np.ndarray
+        the first vertex of each triangle, i.e. array of shape (N, 2)
+    jacobians: np.ndarray
+        the jacobians of each triangle, i.e. array of shape (N, 2, 2)
+    """
+    transformed_integration_points = np.einsum(
+        'qk,njk->nqj', reference_integration_points, jacobians)
+    transformed_integration_points += p1[:, np.newaxis, :]
+    return transformed_integration_points
+
+
+def transform_weights_and_integration_points_batched(
+    weights_and_integration_points: WeightsAndIntegrationPoints,
+    physical_triangles: np.ndarray
+) -> WeightsAndIntegrationPoints:
+    """
+    transforms the reference rule to each of the N triangles at once
+
+    returns
+    -------
+    WeightsAndIntegrationPoints: weights of shape (N, n_qp)
+        and integration points of shape (N, n_qp, 2)
+    """
+    jacobians = get_jacobians(physical_triangles=physical_triangles)
+
+    transformed_weights = transform_weights_batched(
+        reference_weights=weights_and_integration_points.weights,
+        jacobians=jacobians)
+    transformed_integration_points = transform_integration_points_batched(
+        reference_integration_points=(
+            weights_and_integration_points.integration_points),
+        p1=physical_triangles[:, 0, :],
+        jacobians=jacobians)
+
+    return WeightsAndIntegrationPoints(
+        weights=transformed_weights,
+        integration_points=transformed_integration_points)
@@ -0,0 +1,64 @@
+import numpy as np
+
+
+class IntegrationWorkspace:
+    """
+    reusable scratch buffers for the geometry, the physical
+    integration points and the reduction of `integrate_on_mesh`
+
+    usage
+    -----
+    >>> workspace = IntegrationWorkspace()
+    >>> for f in integrands:
+    ...     integral = integrate_on_mesh(
+    ...         f=f, coordinates=coordinates, elements=elements,
+    ...         cubature_rule=CubatureRuleEnum.DAYTAYLOR,
+    ...         workspace=workspace)
+
+    notes
+    -----
+    - the buffers are allocated on first use and grown if needed,
+      i.e. repeated integrations on meshes of (at most) the same size
+      do not allocate any arrays proportional to the number of elements,
+      except for the values returned by f
+    - a workspace must not be shared between threads
+      integrating simultaneously
+    """
+    _buffers: dict[str, np.ndarray]
+
+    def __init__(self) -> None:
+        self._buffers = {}
+
+    @property
+    def nbytes(self) -> int:
+        """
+        the total size (in bytes) of all buffers held
+        """
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def get_buffer(self,
+                   name: str,
+                   shape: tuple[int, ...],
+                   dtype: np.dtype) -> np.ndarray:
+        """
+        returns an (uninitialized) array of the specified shape and type,
+        reusing the memory of the buffer of the same name if possible
+
+        notes
+        -----
+        - the returned array is only valid until the next call
+          with the same name
+        """
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape))
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.dtype != dtype or buffer.size < size:
+            buffer = np.empty(size, dtype=dtype)
+            self._buffers[name] = buffer
+        return buffer[:size].reshape(shape)
+
+    def clear(self) -> None:
+        """
+        releases all buffers
+        """
+        self._buffers.clear()
@@ -0,0 +1,105 @@
+import unittest
+import numpy as np
+from triangle_cubature.adaptive import integrate_adaptively
+from triangle_cubature.adaptive import _refine_red
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.integrate import integrate_on_mesh
+from triangle_cubature.integrate import integrate_on_triangles
+from dev_tools.polynomials import get_random_polynomial
+
+# unit square split into two triangles
+COORDINATES = np.array([
+    [0., 0.],
+    [1., 0.],
+    [1., 1.],
+    [0., 1.]
+])
+ELEMENTS = np.array([
+    [0, 1, 2],
+    [0, 2, 3]
+])
+
+
+class TestAdaptive(unittest.TestCase):
+    def test_refine_red(self) -> None:
+        triangles = COORDINATES[ELEMENTS]
+        children = _refine_red(triangles)
+        self.assertEqual(children.shape, (8, 3, 2))
+
+        areas = integrate_on_triangles(
+            f=lambda x: np.ones(x.shape[0]), triangles=children,
+            cubature_rule=CubatureRuleEnum.MIDPOINT, elementwise=True)
+        # orientation is preserved and children are congruent
+        self.assertTrue(np.allclose(areas, 1./8.))
+
+    def test_polynomial_needs_no_refinement(self) -> None:
+        np.random.seed(42)
+        polynomial = get_random_polynomial(degree=5)
+        result = integrate_adaptively(
+            f=polynomial.eval_at,
+            coordinates=COORDINATES,
+            elements=ELEMENTS,
+            tolerance=1e-12)
+        self.assertTrue(result.converged)
+        self.assertEqual(result.n_triangles, 2)
+        self.assertEqual(result.n_function_evaluations, 2 * (7 + 19))
+        self.assertAlmostEqual(
+            result.value,
+            integrate_on_mesh(
+                f=polynomial.eval_at,
+                coordinates=COORDINATES,
+                elements=ELEMENTS,
+                cubature_rule=CubatureRuleEnum.DUNAVANT9))
+
+    def test_singular_integrand(self) -> None:
+        def f(x: np.ndarray) -> np.ndarray:
+            return 1. / np.sqrt(np.sum(x**2, axis=1))
+
+        # int_{[0,1]^2} 1/|x| dx = 2 log(1 + sqrt(2))
+        expected = 2. * np.log(1. + np.sqrt(2.))
+        tolerance = 1e-6
+        for batched in [False, True]:
+            result = integrate_adaptively(
+                f=f,
+                coordinates=COORDINATES,
+                elements=ELEMENTS,
+                tolerance=tolerance,
+                batched=batched)
+            self.assertTrue(result.converged)
+            self.assertLessEqual(result.error_estimate, tolerance)
+            self.assertLess(abs(result.value - expected), tolerance)
+            self.assertGreater(result.n_triangles, 2)
+            self.assertEqual(
+                result.n_function_evaluations % (7 + 19), 0)
+
+    def test_max_iterations(self) -> None:
+        def f(x: np.ndarray) -> np.ndarray:
+            return 1. / np.sqrt(np.sum(x**2, axis=1))
+
+        result = integrate_adaptively(
+            f=f,
+            coordinates=COORDINATES,
+            elements=ELEMENTS,
+            tolerance=1e-14,
+            max_iterations=2)
+        self.assertFalse(result.converged)
+        self.assertGreater(result.error_estimate, 1e-14)
+
+    def test_vector_valued_integrand(self) -> None:
+        def f(x: np.ndarray) -> np.ndarray:
+            r = np.sqrt(np.sum(x**2, axis=1))
+            return np.column_stack([np.ones(x.shape[0]), 1. / r])
+
+        result = integrate_adaptively(
+            f=f,
+            coordinates=COORDINATES,
+            elements=ELEMENTS,
+            tolerance=1e-6)
+        self.assertEqual(result.value.shape, (2,))
+        self.assertAlmostEqual(result.value[0], 1.)
+        self.assertLess(
+            abs(result.value[1] - 2. * np.log(1. + np.sqrt(2.))), 1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import numpy as np
+from triangle_cubature.assembly import assemble_matrix
+from triangle_cubature.assembly import assemble_vector
+from triangle_cubature.assembly import get_local_load_vectors
+from triangle_cubature.assembly import get_local_mass_matrices
+from triangle_cubature.assembly import get_local_stiffness_matrices
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.integrate import integrate_on_mesh_elementwise
+from p1afempy.solvers import get_mass_matrix, get_stiffness_matrix
+from p1afempy.solvers import get_right_hand_side_using_quadrature_rule
+from scipy.sparse import csr_matrix
+from test_integrate import get_refined_square_mesh
+
+
+class TestAssembly(unittest.TestCase):
+    def test_local_load_vectors(self) -> None:
+        coordinates, elements, _ = get_refined_square_mesh(n_refinements=3)
+
+        def f(x: np.ndarray) -> np.ndarray:
+            return np.sin(x[:, 0]) * x[:, 1]
+
+        for batched in [False, True]:
+            local_load_vectors = get_local_load_vectors(
+                f=f, coordinates=coordinates, elements=elements,
+                cubature_rule=CubatureRuleEnum.DAYTAYLOR, batched=batched)
+            self.assertEqual(local_load_vectors.shape, (elements.shape[0], 3))
+            # the basis functions sum up to one
+            self.assertTrue(np.allclose(
+                np.sum(local_load_vectors, axis=1),
+                integrate_on_mesh_elementwise(
+                    f=f, coordinates=coordinates, elements=elements,
+                    cubature_rule=CubatureRuleEnum.DAYTAYLOR)))
+            self.assertTrue(np.allclose(
+                assemble_vector(
+                    local_vectors=local_load_vectors, elements=elements,
+                    n_vertices=coordinates.shape[0]),
+                get_right_hand_side_using_quadrature_rule(
+                    coordinates=coordinates, elements=elements, f=f,
+                    cubature_rule=CubatureRuleEnum.DAYTAYLOR)))
+
+    def test_mass_and_stiffness_matrices(self) -> None:
+        coordinates, elements, _ = get_refined_square_mesh(n_refinements=3)
+        n_vertices = coordinates.shape[0]
+
+        local_mass_matrices = get_local_mass_matrices(
+            coordinates=coordinates, elements=elements)
+        local_stiffness_matrices = get_local_stiffness_matrices(
+            coordinates=coordinates, elements=elements)
+        for local_matrices in [local_mass_matrices, local_stiffness_matrices]:
+            self.assertEqual(local_matrices.shape, (elements.shape[0], 3, 3))
+
+        mass_matrix = assemble_matrix(
+            local_matrices=local_mass_matrices, elements=elements,
+            n_vertices=n_vertices)
+        stiffness_matrix = assemble_matrix(
+            local_matrices=local_stiffness_matrices, elements=elements,
+            n_vertices=n_vertices)
+        self.assertIsInstance(mass_matrix, csr_matrix)
+        self.assertTrue(np.allclose(
+            mass_matrix.toarray(),
+            get_mass_matrix(
+                coordinates=coordinates, elements=elements).toarray()))
+        self.assertTrue(np.allclose(
+            stiffness_matrix.toarray(),
+            get_stiffness_matrix(
+                coordinates=coordinates, elements=elements).toarray()))
+
+        # the area of the mesh and the kernel of the stiffness matrix
+        ones = np.ones(n_vertices)
+        self.assertAlmostEqual(ones @ mass_matrix @ ones, 1.)
+        self.assertTrue(np.allclose(stiffness_matrix @ ones, 0.))
+
+
+if __name__ == '__main__':
+    unittest.main()
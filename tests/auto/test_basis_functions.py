@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+from triangle_cubature.basis_functions import get_basis_values
+from triangle_cubature.basis_functions import get_p1_basis_values
+from triangle_cubature.basis_functions import get_p2_basis_values
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.rule_factory import get_rule
+
+
+class TestBasisFunctions(unittest.TestCase):
+    def test_nodal_basis(self) -> None:
+        vertices = np.array([[0., 0.], [1., 0.], [0., 1.]])
+        midpoints = np.array([[0.5, 0.], [0.5, 0.5], [0., 0.5]])
+        self.assertTrue(np.allclose(
+            get_p1_basis_values(vertices), np.eye(3)))
+        self.assertTrue(np.allclose(
+            get_p2_basis_values(np.vstack([vertices, midpoints])),
+            np.eye(6)))
+
+        np.random.seed(42)
+        points = np.random.rand(10, 2)
+        for basis_values in [get_p1_basis_values(points),
+                             get_p2_basis_values(points)]:
+            self.assertTrue(np.allclose(np.sum(basis_values, axis=1), 1.))
+
+    def test_tabulation_is_cached(self) -> None:
+        for rule in CubatureRuleEnum:
+            n_qp = get_rule(
+                rule=rule).weights_and_integration_points.weights.shape[0]
+            for polynomial_degree, n_local in [(1, 3), (2, 6)]:
+                basis_values = get_basis_values(
+                    cubature_rule=rule, polynomial_degree=polynomial_degree)
+                self.assertEqual(basis_values.shape, (n_qp, n_local))
+                self.assertIs(
+                    basis_values,
+                    get_basis_values(
+                        cubature_rule=rule,
+                        polynomial_degree=polynomial_degree))
+                with self.assertRaises(ValueError):
+                    basis_values[0, 0] = 1.
+        with self.assertRaises(ValueError):
+            get_basis_values(
+                cubature_rule=CubatureRuleEnum.MIDPOINT, polynomial_degree=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,7 +21,12 @@ class TestCubatureRules(unittest.TestCase):
             triangle_cubature.rule_factory.CubatureRuleEnum.MIDPOINT,
             triangle_cubature.rule_factory.CubatureRuleEnum.LAUFFER_LINEAR,
             triangle_cubature.rule_factory.CubatureRuleEnum.SMPLX1,
-            triangle_cubature.rule_factory.CubatureRuleEnum.DAYTAYLOR
+            triangle_cubature.rule_factory.CubatureRuleEnum.DAYTAYLOR,
+            triangle_cubature.rule_factory.CubatureRuleEnum.DUNAVANT4,
+            triangle_cubature.rule_factory.CubatureRuleEnum.RADON5,
+            triangle_cubature.rule_factory.CubatureRuleEnum.GATERMANN7,
+            triangle_cubature.rule_factory.CubatureRuleEnum.DUNAVANT8,
+            triangle_cubature.rule_factory.CubatureRuleEnum.DUNAVANT9
         ]
 
         # reading and refining a mesh (same for all tests)
@@ -87,8 +92,7 @@ class TestCubatureRules(unittest.TestCase):
                 polynomial=random_polynomial,
                 elements=elements,
                 vertices=coordinates,
-                display_progress=True,
-                using_sympy=False)
+                vectorized=True)
             calculated_result = triangle_cubature.integrate.integrate_on_mesh(
                 f=random_polynomial.eval_at,
                 coordinates=coordinates,
@@ -0,0 +1,98 @@
+import unittest
+import numpy as np
+from math import factorial
+from triangle_cubature.polynomials import get_reference_moments
+from triangle_cubature.polynomials import integrate_monomials_on_mesh
+from triangle_cubature.polynomials import \
+    integrate_monomials_on_mesh_elementwise
+from dev_tools.polynomials import get_random_polynomial
+from dev_tools.polynomials import integrate_on_triangle
+from dev_tools.utils import generate_random_triangle
+
+
+def to_arrays(polynomial) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return (
+        np.array([m.x_exponent for m in polynomial.monomials]),
+        np.array([m.y_exponent for m in polynomial.monomials]),
+        np.array([m.coefficient for m in polynomial.monomials]))
+
+
+class TestExactIntegration(unittest.TestCase):
+    def test_reference_moments(self) -> None:
+        moments = get_reference_moments(max_degree=4)
+        self.assertEqual(moments.shape, (5, 5))
+        self.assertAlmostEqual(moments[0, 0], 0.5)
+        self.assertAlmostEqual(moments[1, 0], 1./6.)
+        self.assertAlmostEqual(moments[2, 2], 4./factorial(6))
+        self.assertEqual(moments[3, 2], 0.)
+        with self.assertRaises(ValueError):
+            moments[0, 0] = 1.
+
+    def test_against_integration_by_hand(self) -> None:
+        np.random.seed(42)
+        n_triangles = 10
+        triangles = np.array([
+            generate_random_triangle() for _ in range(n_triangles)])
+        coordinates = triangles.reshape(-1, 2)
+        elements = np.arange(3 * n_triangles).reshape(n_triangles, 3)
+
+        for degree in range(9):
+            polynomial = get_random_polynomial(degree=degree)
+            x_exponents, y_exponents, coefficients = to_arrays(polynomial)
+            for chunk_size in [3, 100]:
+                local_integrals = integrate_monomials_on_mesh_elementwise(
+                    x_exponents=x_exponents,
+                    y_exponents=y_exponents,
+                    coefficients=coefficients,
+                    coordinates=coordinates,
+                    elements=elements,
+                    chunk_size=chunk_size)
+                self.assertEqual(local_integrals.shape, (n_triangles,))
+                for triangle, local_integral in zip(
+                        triangles, local_integrals):
+                    self.assertAlmostEqual(
+                        local_integral,
+                        integrate_on_triangle(
+                            polynomial=polynomial, vertices=triangle,
+                            using_sympy=False))
+            self.assertAlmostEqual(
+                np.sum(local_integrals),
+                integrate_monomials_on_mesh(
+                    x_exponents=x_exponents,
+                    y_exponents=y_exponents,
+                    coefficients=coefficients,
+                    coordinates=coordinates,
+                    elements=elements))
+
+    def test_many_polynomials_at_once(self) -> None:
+        np.random.seed(42)
+        n_triangles = 5
+        triangles = np.array([
+            generate_random_triangle() for _ in range(n_triangles)])
+        coordinates = triangles.reshape(-1, 2)
+        elements = np.arange(3 * n_triangles).reshape(n_triangles, 3)
+
+        # repeated and unordered monomials are allowed
+        x_exponents = np.array([2, 0, 1, 2, 0])
+        y_exponents = np.array([1, 0, 3, 1, 2])
+        coefficients = np.random.rand(5, 3)
+        integrals = integrate_monomials_on_mesh(
+            x_exponents=x_exponents,
+            y_exponents=y_exponents,
+            coefficients=coefficients,
+            coordinates=coordinates,
+            elements=elements)
+        self.assertEqual(integrals.shape, (3,))
+        for k in range(3):
+            self.assertAlmostEqual(
+                integrals[k],
+                integrate_monomials_on_mesh(
+                    x_exponents=x_exponents,
+                    y_exponents=y_exponents,
+                    coefficients=coefficients[:, k],
+                    coordinates=coordinates,
+                    elements=elements))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import unittest
+import numpy as np
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.integrate import integrate_on_mesh
+from triangle_cubature.integrate import integrate_on_mesh_elementwise
+from triangle_cubature.incremental import IncrementalIntegral
+from dev_tools.polynomials import get_random_polynomial
+from test_integrate import get_random_mesh
+
+
+def refine_red(coordinates: np.ndarray,
+               elements: np.ndarray,
+               marked_elements: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    returns the extended coordinates and the children of the marked
+    elements, obtained by connecting their edge midpoints
+    """
+    marked = elements[marked_elements]
+    n_marked = marked.shape[0]
+    n_coordinates = coordinates.shape[0]
+    midpoints = np.vstack([
+        (coordinates[marked[:, 0]] + coordinates[marked[:, 1]]) / 2.,
+        (coordinates[marked[:, 1]] + coordinates[marked[:, 2]]) / 2.,
+        (coordinates[marked[:, 2]] + coordinates[marked[:, 0]]) / 2.])
+    m12 = n_coordinates + np.arange(n_marked)
+    m23 = m12 + n_marked
+    m31 = m23 + n_marked
+    children = np.vstack([
+        np.column_stack([marked[:, 0], m12, m31]),
+        np.column_stack([m12, marked[:, 1], m23]),
+        np.column_stack([m31, m23, marked[:, 2]]),
+        np.column_stack([m12, m23, m31])])
+    return np.vstack([coordinates, midpoints]), children
+
+
+class TestIncremental(unittest.TestCase):
+    def test_integrate_on_mesh_marked_elements(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=20)
+        polynomial = get_random_polynomial(degree=2)
+        marked = np.array([1, 5, 19])
+        mask = np.zeros(elements.shape[0], dtype=bool)
+        mask[marked] = True
+
+        local_integrals = integrate_on_mesh_elementwise(
+            f=polynomial.eval_at, coordinates=coordinates,
+            elements=elements, cubature_rule=CubatureRuleEnum.SMPLX1)
+        for marked_elements in [marked, mask]:
+            for batched in [False, True]:
+                self.assertAlmostEqual(
+                    np.sum(local_integrals[marked]),
+                    integrate_on_mesh(
+                        f=polynomial.eval_at, coordinates=coordinates,
+                        elements=elements,
+                        cubature_rule=CubatureRuleEnum.SMPLX1,
+                        marked_elements=marked_elements,
+                        batched=batched))
+
+    def test_replace_elements(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=20)
+        polynomial = get_random_polynomial(degree=6)
+        cubature_rule = CubatureRuleEnum.DAYTAYLOR
+
+        integral = IncrementalIntegral(
+            f=polynomial.eval_at, coordinates=coordinates,
+            elements=elements, cubature_rule=cubature_rule)
+        self.assertAlmostEqual(
+            integral.total,
+            integrate_on_mesh(
+                f=polynomial.eval_at, coordinates=coordinates,
+                elements=elements, cubature_rule=cubature_rule))
+
+        for _ in range(3):
+            n_elements = integral.elements.shape[0]
+            marked = np.random.choice(n_elements, 4, replace=False)
+            coordinates, children = refine_red(
+                coordinates=integral.coordinates,
+                elements=integral.elements,
+                marked_elements=marked)
+            integral.replace_elements(
+                removed_elements=marked,
+                coordinates=coordinates,
+                new_elements=children)
+
+            self.assertEqual(integral.elements.shape[0], n_elements + 12)
+            self.assertTrue(np.array_equal(
+                integral.elements[-children.shape[0]:], children))
+            # the exact integral does not change on refinement
+            self.assertAlmostEqual(
+                integral.total,
+                integrate_on_mesh(
+                    f=polynomial.eval_at, coordinates=coordinates,
+                    elements=elements, cubature_rule=cubature_rule))
+            self.assertTrue(np.allclose(
+                integral.local_integrals,
+                integrate_on_mesh_elementwise(
+                    f=polynomial.eval_at, coordinates=coordinates,
+                    elements=integral.elements,
+                    cubature_rule=cubature_rule)))
+
+    def test_reintegrate(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=20)
+        n_calls = []
+
+        def f(points: np.ndarray) -> np.ndarray:
+            n_calls.append(points.shape[0])
+            return np.column_stack([points[:, 0], points[:, 1]**2])
+
+        integral = IncrementalIntegral(
+            f=f, coordinates=coordinates, elements=elements,
+            cubature_rule=CubatureRuleEnum.SMPLX1, batched=True)
+
+        # moving the vertices of the first two elements
+        moved_coordinates = coordinates.copy()
+        moved_coordinates[elements[:2].ravel()] *= 1.5
+        integral.reintegrate(
+            marked_elements=np.array([0, 1]), coordinates=moved_coordinates)
+
+        self.assertEqual(n_calls, [3 * 20, 3 * 2])
+        self.assertTrue(np.allclose(
+            integral.total,
+            integrate_on_mesh(
+                f=f, coordinates=moved_coordinates, elements=elements,
+                cubature_rule=CubatureRuleEnum.SMPLX1)))
+
+        # repeated indices are integrated (and subtracted) once
+        moved_coordinates[elements[5].ravel()] *= 0.5
+        n_calls.clear()
+        integral.reintegrate(
+            marked_elements=np.array([5, 5, 1, 5]),
+            coordinates=moved_coordinates)
+        self.assertEqual(n_calls, [3 * 2])
+        self.assertTrue(np.allclose(
+            integral.total,
+            integrate_on_mesh(
+                f=f, coordinates=moved_coordinates, elements=elements,
+                cubature_rule=CubatureRuleEnum.SMPLX1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,465 @@
+import unittest
+import numpy as np
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.integrate import integrate_on_mesh
+from triangle_cubature.integrate import integrate_on_mesh_elementwise
+from triangle_cubature.integrate import integrate_on_triangle
+from triangle_cubature.integrate import integrate_on_triangles
+from triangle_cubature.integrate import integrate_nodal_fields_on_mesh
+from triangle_cubature.integrate import \
+    integrate_nodal_fields_on_mesh_elementwise
+from dev_tools.polynomials import get_random_polynomial
+from p1afempy.io_helpers import read_mesh, read_boundary_condition
+from p1afempy.mesh import provide_geometric_data
+from p1afempy.refinement import refineNVB
+from pathlib import Path
+
+
+def get_random_mesh(n_elements: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    returns coordinates and elements of `n_elements`
+    independent, counter-clockwise oriented random triangles
+    """
+    coordinates = np.random.rand(3 * n_elements, 2)
+    elements = np.arange(3 * n_elements).reshape(n_elements, 3)
+    c1 = coordinates[elements[:, 0]]
+    d21 = coordinates[elements[:, 1]] - c1
+    d31 = coordinates[elements[:, 2]] - c1
+    clockwise = d21[:, 0]*d31[:, 1] - d21[:, 1]*d31[:, 0] < 0
+    elements[clockwise] = elements[clockwise][:, [0, 2, 1]]
+    return coordinates, elements
+
+
+def get_refined_square_mesh(
+        n_refinements: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    returns coordinates, elements and boundary of `simple_square_mesh`
+    after `n_refinements` uniform refinements
+    """
+    base_path = Path('tests/data/simple_square_mesh/')
+    coordinates, elements = read_mesh(
+        path_to_coordinates=base_path / Path('coordinates.dat'),
+        path_to_elements=base_path / Path('elements.dat'))
+    boundaries = [read_boundary_condition(
+        path_to_boundary=base_path / Path('boundary.dat'))]
+    for _ in range(n_refinements):
+        coordinates, elements, boundaries, _ = refineNVB(
+            coordinates=coordinates,
+            elements=elements,
+            marked_elements=np.arange(elements.shape[0]),
+            boundary_conditions=boundaries)
+    return coordinates, elements, boundaries[0]
+
+
+class TestIntegrate(unittest.TestCase):
+    def test_integrate_on_mesh_elementwise(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=20)
+
+        for cubature_rule in CubatureRuleEnum:
+            polynomial = get_random_polynomial(degree=3)
+            local_integrals = integrate_on_mesh_elementwise(
+                f=polynomial.eval_at,
+                coordinates=coordinates,
+                elements=elements,
+                cubature_rule=cubature_rule)
+
+            self.assertEqual(local_integrals.shape, (elements.shape[0],))
+            for element, local_integral in zip(elements, local_integrals):
+                expected = integrate_on_triangle(
+                    f=polynomial.eval_at,
+                    triangle=coordinates[element, :],
+                    cubature_rule=cubature_rule)
+                self.assertAlmostEqual(expected, local_integral)
+
+            self.assertAlmostEqual(
+                np.sum(local_integrals),
+                integrate_on_mesh(
+                    f=polynomial.eval_at,
+                    coordinates=coordinates,
+                    elements=elements,
+                    cubature_rule=cubature_rule))
+
+            # marked elements, given as indices and as boolean mask
+            marked_indices = np.array([3, 0, 17])
+            marked_mask = np.zeros(elements.shape[0], dtype=bool)
+            marked_mask[marked_indices] = True
+            on_indices = integrate_on_mesh_elementwise(
+                f=polynomial.eval_at,
+                coordinates=coordinates,
+                elements=elements,
+                cubature_rule=cubature_rule,
+                marked_elements=marked_indices)
+            on_mask = integrate_on_mesh_elementwise(
+                f=polynomial.eval_at,
+                coordinates=coordinates,
+                elements=elements,
+                cubature_rule=cubature_rule,
+                marked_elements=marked_mask)
+            self.assertTrue(np.allclose(
+                on_indices, local_integrals[marked_indices]))
+            self.assertTrue(np.allclose(
+                on_mask, local_integrals[marked_mask]))
+
+    def test_number_of_function_evaluations(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=10)
+        n_calls = []
+
+        def f(points: np.ndarray) -> np.ndarray:
+            n_calls.append(points.shape[0])
+            return np.ones(points.shape[0])
+
+        integrate_on_mesh_elementwise(
+            f=f, coordinates=coordinates, elements=elements,
+            cubature_rule=CubatureRuleEnum.DAYTAYLOR)
+        self.assertEqual(n_calls, [elements.shape[0]] * 11)
+
+    def test_batched_integration(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=25)
+
+        for cubature_rule in CubatureRuleEnum:
+            polynomial = get_random_polynomial(degree=4)
+            expected_local = integrate_on_mesh_elementwise(
+                f=polynomial.eval_at,
+                coordinates=coordinates,
+                elements=elements,
+                cubature_rule=cubature_rule)
+            for batch_size in [None, 1, 7, 25, 100]:
+                batched_local = integrate_on_mesh_elementwise(
+                    f=polynomial.eval_at,
+                    coordinates=coordinates,
+                    elements=elements,
+                    cubature_rule=cubature_rule,
+                    batched=True,
+                    batch_size=batch_size)
+                self.assertTrue(np.allclose(expected_local, batched_local))
+                batched_total = integrate_on_mesh(
+                    f=polynomial.eval_at,
+                    coordinates=coordinates,
+                    elements=elements,
+                    cubature_rule=cubature_rule,
+                    batched=True,
+                    batch_size=batch_size)
+                self.assertAlmostEqual(np.sum(expected_local), batched_total)
+
+        # f is called once per batch
+        n_calls = []
+
+        def f(points: np.ndarray) -> np.ndarray:
+            n_calls.append(points.shape[0])
+            return np.ones(points.shape[0])
+
+        integrate_on_mesh(
+            f=f, coordinates=coordinates, elements=elements,
+            cubature_rule=CubatureRuleEnum.DAYTAYLOR,
+            batched=True, batch_size=10)
+        self.assertEqual(n_calls, [11 * 10, 11 * 10, 11 * 5])
+
+        with self.assertRaises(ValueError):
+            integrate_on_mesh(
+                f=f, coordinates=coordinates, elements=elements,
+                cubature_rule=CubatureRuleEnum.DAYTAYLOR,
+                batched=True, batch_size=0)
+
+    def test_integrate_on_triangles(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=15)
+        triangles = coordinates[elements]
+
+        for cubature_rule in CubatureRuleEnum:
+            polynomial = get_random_polynomial(degree=3)
+            local_integrals = integrate_on_triangles(
+                f=polynomial.eval_at,
+                triangles=triangles,
+                cubature_rule=cubature_rule,
+                elementwise=True)
+            self.assertEqual(local_integrals.shape, (triangles.shape[0],))
+            for triangle, local_integral in zip(triangles, local_integrals):
+                expected = integrate_on_triangle(
+                    f=polynomial.eval_at,
+                    triangle=triangle,
+                    cubature_rule=cubature_rule)
+                self.assertAlmostEqual(expected, local_integral)
+
+            for batched in [False, True]:
+                total = integrate_on_triangles(
+                    f=polynomial.eval_at,
+                    triangles=triangles,
+                    cubature_rule=cubature_rule,
+                    batched=batched,
+                    batch_size=4)
+                self.assertAlmostEqual(np.sum(local_integrals), total)
+
+    def test_vector_valued_integrands(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=12)
+        triangles = coordinates[elements]
+        polynomials = [get_random_polynomial(degree=2) for _ in range(6)]
+
+        def f(points: np.ndarray) -> np.ndarray:
+            # values of shape (N, 2, 3)
+            return np.stack(
+                [p.eval_at(points) for p in polynomials],
+                axis=-1).reshape(points.shape[0], 2, 3)
+
+        cubature_rule = CubatureRuleEnum.SMPLX1
+        expected_local = np.stack([
+            integrate_on_mesh_elementwise(
+                f=p.eval_at, coordinates=coordinates, elements=elements,
+                cubature_rule=cubature_rule)
+            for p in polynomials], axis=-1).reshape(-1, 2, 3)
+        expected = np.sum(expected_local, axis=0)
+
+        for batched in [False, True]:
+            local = integrate_on_mesh_elementwise(
+                f=f, coordinates=coordinates, elements=elements,
+                cubature_rule=cubature_rule,
+                batched=batched, batch_size=5)
+            self.assertEqual(local.shape, (elements.shape[0], 2, 3))
+            self.assertTrue(np.allclose(expected_local, local))
+
+            total = integrate_on_mesh(
+                f=f, coordinates=coordinates, elements=elements,
+                cubature_rule=cubature_rule,
+                batched=batched, batch_size=5)
+            self.assertEqual(total.shape, (2, 3))
+            self.assertTrue(np.allclose(expected, total))
+
+            on_triangles = integrate_on_triangles(
+                f=f, triangles=triangles, cubature_rule=cubature_rule,
+                elementwise=True, batched=batched)
+            self.assertTrue(np.allclose(expected_local, on_triangles))
+
+        on_triangle = integrate_on_triangle(
+            f=f, triangle=triangles[3], cubature_rule=cubature_rule)
+        self.assertEqual(on_triangle.shape, (2, 3))
+        self.assertTrue(np.allclose(expected_local[3], on_triangle))
+
+    def test_empty_selection(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=5)
+        marked_elements = np.zeros(elements.shape[0], dtype=bool)
+
+        for batched in [False, True]:
+            kwargs = dict(
+                f=lambda x: x**2, coordinates=coordinates,
+                elements=elements, cubature_rule=CubatureRuleEnum.DAYTAYLOR,
+                marked_elements=marked_elements, batched=batched)
+            total = integrate_on_mesh(**kwargs)
+            self.assertEqual(np.shape(total), (2,))
+            self.assertTrue(np.all(total == 0.))
+            local = integrate_on_mesh_elementwise(**kwargs)
+            self.assertEqual(local.shape, (0, 2))
+
+    def test_degree_in_place_of_rule(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=10)
+
+        for degree in [0, 3, 6, 12]:
+            polynomial = get_random_polynomial(degree=degree)
+            on_mesh = integrate_on_mesh(
+                f=polynomial.eval_at,
+                coordinates=coordinates,
+                elements=elements,
+                cubature_rule=degree)
+            on_triangles = integrate_on_triangles(
+                f=polynomial.eval_at,
+                triangles=coordinates[elements],
+                cubature_rule=degree + 2,
+                elementwise=True)
+            on_triangle = integrate_on_triangle(
+                f=polynomial.eval_at,
+                triangle=coordinates[elements[0]],
+                cubature_rule=degree + 4)
+            self.assertAlmostEqual(on_mesh, np.sum(on_triangles))
+            self.assertAlmostEqual(on_triangles[0], on_triangle)
+
+    def test_polynomial_integrands(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=10)
+        marked_elements = np.array([1, 4, 5])
+
+        polynomial = get_random_polynomial(degree=7)
+        array_polynomial = polynomial.to_array_polynomial()
+
+        for f in [polynomial, array_polynomial]:
+            self.assertAlmostEqual(
+                integrate_on_mesh(
+                    f=f, coordinates=coordinates, elements=elements,
+                    cubature_rule=CubatureRuleEnum.MIDPOINT),
+                integrate_on_mesh(
+                    f=polynomial.eval_at,
+                    coordinates=coordinates, elements=elements,
+                    cubature_rule=CubatureRuleEnum.DUNAVANT8))
+            self.assertTrue(np.allclose(
+                integrate_on_mesh_elementwise(
+                    f=f, coordinates=coordinates, elements=elements,
+                    cubature_rule=CubatureRuleEnum.MIDPOINT,
+                    marked_elements=marked_elements),
+                integrate_on_mesh_elementwise(
+                    f=polynomial.eval_at,
+                    coordinates=coordinates, elements=elements,
+                    cubature_rule=CubatureRuleEnum.DUNAVANT8,
+                    marked_elements=marked_elements)))
+            self.assertTrue(np.allclose(
+                integrate_on_triangles(
+                    f=f, triangles=coordinates[elements],
+                    cubature_rule=CubatureRuleEnum.MIDPOINT,
+                    elementwise=True),
+                integrate_on_triangles(
+                    f=polynomial.eval_at, triangles=coordinates[elements],
+                    cubature_rule=CubatureRuleEnum.DUNAVANT8,
+                    elementwise=True)))
+            self.assertAlmostEqual(
+                integrate_on_triangle(
+                    f=f, triangle=coordinates[elements[0]],
+                    cubature_rule=CubatureRuleEnum.MIDPOINT),
+                integrate_on_triangle(
+                    f=polynomial.eval_at, triangle=coordinates[elements[0]],
+                    cubature_rule=CubatureRuleEnum.DUNAVANT8))
+        # the polynomials themselves are callable as well
+        self.assertTrue(np.allclose(
+            array_polynomial(coordinates), polynomial.eval_at(coordinates)))
+
+    def test_dtype_and_accumulation(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=1000)
+
+        def f(x: np.ndarray) -> np.ndarray:
+            return np.stack([np.exp(x[:, 0]), np.cos(x[:, 1])], axis=1)
+
+        reference = integrate_on_mesh(
+            f=f, coordinates=coordinates, elements=elements,
+            cubature_rule=CubatureRuleEnum.DAYTAYLOR)
+        for batched in [False, True]:
+            for accumulation in ['naive', 'pairwise', 'kahan', 'float64']:
+                integral = integrate_on_mesh(
+                    f=f, coordinates=coordinates, elements=elements,
+                    cubature_rule=CubatureRuleEnum.DAYTAYLOR,
+                    batched=batched, accumulation=accumulation)
+                self.assertTrue(np.allclose(
+                    integral, reference, rtol=1e-14, atol=0.))
+
+                integral = integrate_on_mesh(
+                    f=f, coordinates=coordinates, elements=elements,
+                    cubature_rule=CubatureRuleEnum.DAYTAYLOR,
+                    batched=batched, dtype=np.float32,
+                    accumulation=accumulation)
+                self.assertEqual(integral.shape, (2,))
+                self.assertEqual(
+                    integral.dtype,
+                    np.float64 if accumulation == 'float64'
+                    else np.float32)
+                self.assertTrue(np.allclose(
+                    integral, reference, rtol=1e-5, atol=0.))
+        with self.assertRaises(ValueError):
+            integrate_on_mesh(
+                f=f, coordinates=coordinates, elements=elements,
+                cubature_rule=CubatureRuleEnum.DAYTAYLOR,
+                accumulation='exact')
+
+    def test_accumulation_of_vector_valued_integrands(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=500_000)
+
+        def f(x: np.ndarray) -> np.ndarray:
+            return np.stack([np.ones(x.shape[0], dtype=x.dtype), x[:, 0]],
+                            axis=1)
+
+        reference = integrate_on_mesh(
+            f=f, coordinates=coordinates, elements=elements,
+            cubature_rule=CubatureRuleEnum.MIDPOINT)
+        for batched in [False, True]:
+            for accumulation in ['pairwise', 'kahan', 'float64']:
+                # naive summation in single precision is off by about 1e-5
+                integral = integrate_on_mesh(
+                    f=f, coordinates=coordinates, elements=elements,
+                    cubature_rule=CubatureRuleEnum.MIDPOINT,
+                    batched=batched, dtype=np.float32,
+                    accumulation=accumulation)
+                self.assertTrue(np.allclose(
+                    integral, reference, rtol=1e-6, atol=0.))
+
+    def test_p1_nodal_fields(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=10)
+        marked_elements = np.array([0, 3, 7])
+
+        # P1 functions are represented exactly by their nodal values
+        def u(x: np.ndarray) -> np.ndarray:
+            return 2. * x[:, 0] - x[:, 1] + 1.
+
+        def v(x: np.ndarray) -> np.ndarray:
+            return x[:, 0] + 3. * x[:, 1]
+
+        self.assertAlmostEqual(
+            integrate_nodal_fields_on_mesh(
+                nodal_values=u(coordinates),
+                coordinates=coordinates, elements=elements),
+            integrate_on_mesh(
+                f=u, coordinates=coordinates, elements=elements,
+                cubature_rule=CubatureRuleEnum.MIDPOINT))
+        self.assertTrue(np.allclose(
+            integrate_nodal_fields_on_mesh_elementwise(
+                nodal_values=[u(coordinates), v(coordinates), u(coordinates)],
+                coordinates=coordinates, elements=elements,
+                marked_elements=marked_elements),
+            integrate_on_mesh_elementwise(
+                f=lambda x: u(x)**2 * v(x),
+                coordinates=coordinates, elements=elements,
+                cubature_rule=3,
+                marked_elements=marked_elements)))
+
+        # with a cubature rule that is not exact for the product
+        self.assertAlmostEqual(
+            integrate_nodal_fields_on_mesh(
+                nodal_values=[u(coordinates), v(coordinates)],
+                coordinates=coordinates, elements=elements,
+                cubature_rule=CubatureRuleEnum.MIDPOINT),
+            integrate_on_mesh(
+                f=lambda x: u(x) * v(x),
+                coordinates=coordinates, elements=elements,
+                cubature_rule=CubatureRuleEnum.MIDPOINT))
+
+    def test_p2_nodal_fields(self) -> None:
+        base_path = Path('tests/data/simple_square_mesh/')
+        coordinates, elements = read_mesh(
+            path_to_coordinates=base_path / Path('coordinates.dat'),
+            path_to_elements=base_path / Path('elements.dat'))
+        boundaries = [read_boundary_condition(
+            path_to_boundary=base_path / Path('boundary.dat'))]
+        coordinates, elements, boundaries, _ = refineNVB(
+            coordinates=coordinates,
+            elements=elements,
+            marked_elements=np.arange(elements.shape[0]),
+            boundary_conditions=boundaries)
+        element2edges, edge2nodes, _ = provide_geometric_data(
+            elements=elements, boundaries=boundaries)
+        midpoints = 0.5 * (
+            coordinates[edge2nodes[:, 0]] + coordinates[edge2nodes[:, 1]])
+
+        # P2 functions are represented exactly by their nodal values
+        def u(x: np.ndarray) -> np.ndarray:
+            return x[:, 0]**2 - 3. * x[:, 0] * x[:, 1] + x[:, 1] - 1.
+
+        nodal_values = np.concatenate([u(coordinates), u(midpoints)])
+        self.assertAlmostEqual(
+            integrate_nodal_fields_on_mesh(
+                nodal_values=[nodal_values, nodal_values],
+                coordinates=coordinates, elements=elements,
+                polynomial_degree=2, element2edges=element2edges),
+            integrate_on_mesh(
+                f=lambda x: u(x)**2,
+                coordinates=coordinates, elements=elements,
+                cubature_rule=4))
+        with self.assertRaises(ValueError):
+            integrate_nodal_fields_on_mesh(
+                nodal_values=nodal_values,
+                coordinates=coordinates, elements=elements,
+                polynomial_degree=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
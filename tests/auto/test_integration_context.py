@@ -0,0 +1,130 @@
+import unittest
+import tracemalloc
+import numpy as np
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.integrate import integrate_on_mesh
+from triangle_cubature.integrate import integrate_on_mesh_elementwise
+from triangle_cubature.integration_context import IntegrationContext
+from dev_tools.polynomials import get_random_polynomial
+from test_integrate import get_random_mesh
+
+
+class TestIntegrationContext(unittest.TestCase):
+    def test_integrate(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=30)
+
+        for cubature_rule in CubatureRuleEnum:
+            context = IntegrationContext(
+                coordinates=coordinates,
+                elements=elements,
+                cubature_rule=cubature_rule)
+            for _ in range(3):
+                polynomial = get_random_polynomial(degree=3)
+                expected_local = integrate_on_mesh_elementwise(
+                    f=polynomial.eval_at,
+                    coordinates=coordinates,
+                    elements=elements,
+                    cubature_rule=cubature_rule)
+                expected = integrate_on_mesh(
+                    f=polynomial.eval_at,
+                    coordinates=coordinates,
+                    elements=elements,
+                    cubature_rule=cubature_rule)
+                for batched in [False, True]:
+                    self.assertTrue(np.allclose(
+                        expected_local,
+                        context.integrate_elementwise(
+                            f=polynomial.eval_at, batched=batched)))
+                    self.assertAlmostEqual(
+                        expected,
+                        context.integrate(
+                            f=polynomial.eval_at, batched=batched))
+
+    def test_update_coordinates(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=30)
+        cubature_rule = CubatureRuleEnum.DAYTAYLOR
+        polynomial = get_random_polynomial(degree=6)
+
+        context = IntegrationContext(
+            coordinates=coordinates,
+            elements=elements,
+            cubature_rule=cubature_rule)
+        moved_coordinates = 2. * coordinates + 1.
+        context.update_coordinates(coordinates=moved_coordinates)
+
+        self.assertAlmostEqual(
+            integrate_on_mesh(
+                f=polynomial.eval_at,
+                coordinates=moved_coordinates,
+                elements=elements,
+                cubature_rule=cubature_rule),
+            context.integrate(f=polynomial.eval_at))
+
+    def test_single_precision(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=30)
+        cubature_rule = CubatureRuleEnum.SMPLX1
+        polynomial = get_random_polynomial(degree=2)
+
+        context = IntegrationContext(
+            coordinates=coordinates,
+            elements=elements,
+            cubature_rule=cubature_rule,
+            dtype=np.float32)
+        self.assertEqual(context.areas_2.dtype, np.float32)
+        self.assertEqual(context.integration_points.dtype, np.float32)
+        self.assertAlmostEqual(
+            integrate_on_mesh(
+                f=polynomial.eval_at,
+                coordinates=coordinates,
+                elements=elements,
+                cubature_rule=cubature_rule),
+            context.integrate(f=polynomial.eval_at),
+            places=5)
+
+    def test_single_precision_memory(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=10_000)
+
+        context = IntegrationContext(
+            coordinates=coordinates,
+            elements=elements,
+            cubature_rule=CubatureRuleEnum.DAYTAYLOR,
+            dtype=np.float32)
+        tracemalloc.start()
+        context.update_coordinates(coordinates=2.*coordinates)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # no temporaries of the integration points in double precision,
+        # i.e. of twice the size of the single precision ones
+        self.assertLess(
+            peak - context.integration_points.nbytes,
+            2 * context.integration_points.nbytes)
+
+    def test_vector_valued_integrands(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=30)
+        cubature_rule = CubatureRuleEnum.DAYTAYLOR
+        polynomials = [get_random_polynomial(degree=4) for _ in range(3)]
+
+        def f(points: np.ndarray) -> np.ndarray:
+            return np.column_stack([p.eval_at(points) for p in polynomials])
+
+        context = IntegrationContext(
+            coordinates=coordinates,
+            elements=elements,
+            cubature_rule=cubature_rule)
+        expected = np.array([
+            context.integrate(f=p.eval_at) for p in polynomials])
+        for batched in [False, True]:
+            self.assertTrue(np.allclose(
+                expected, context.integrate(f=f, batched=batched)))
+            self.assertEqual(
+                context.integrate_elementwise(f=f, batched=batched).shape,
+                (elements.shape[0], 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
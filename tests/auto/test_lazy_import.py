@@ -0,0 +1,34 @@
+import subprocess
+import sys
+import unittest
+import triangle_cubature
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_import_is_lazy(self) -> None:
+        # in a fresh interpreter, as other tests import the submodules
+        code = (
+            'import sys\n'
+            'import triangle_cubature\n'
+            'print(*sorted(name for name in sys.modules\n'
+            '              if name.startswith(("triangle_cubature.",\n'
+            '                                  "p1afempy", "scipy"))))\n')
+        loaded = subprocess.run(
+            [sys.executable, '-c', code],
+            check=True, capture_output=True, text=True).stdout.split()
+        self.assertEqual(loaded, [])
+
+    def test_attributes(self) -> None:
+        from triangle_cubature.integrate import integrate_on_mesh
+        from triangle_cubature.cubature_rule import CubatureRuleEnum
+        self.assertIs(triangle_cubature.integrate_on_mesh, integrate_on_mesh)
+        self.assertIs(triangle_cubature.CubatureRuleEnum, CubatureRuleEnum)
+        self.assertIn('integrate_on_mesh', dir(triangle_cubature))
+        for name in triangle_cubature.__all__:
+            self.assertTrue(hasattr(triangle_cubature, name))
+        with self.assertRaises(AttributeError):
+            triangle_cubature.does_not_exist
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import numpy as np
+from triangle_cubature.line_integrals import get_interior_edges
+from triangle_cubature.line_integrals import get_unit_normals
+from triangle_cubature.line_integrals import integrate_on_boundary
+from triangle_cubature.line_integrals import integrate_on_interior_edges
+from triangle_cubature.rule_factory import get_gauss_legendre_rule
+from test_integrate import get_refined_square_mesh
+
+
+class TestLineIntegrals(unittest.TestCase):
+    def test_gauss_legendre_rule(self) -> None:
+        for degree in range(12):
+            rule = get_gauss_legendre_rule(degree=degree)
+            self.assertGreaterEqual(rule.degree_of_exactness, degree)
+            self.assertEqual(rule.integration_points.shape,
+                             rule.weights.shape)
+            for k in range(degree + 1):
+                self.assertAlmostEqual(
+                    np.dot(rule.weights, rule.integration_points**k),
+                    1. / (k + 1))
+        with self.assertRaises(ValueError):
+            get_gauss_legendre_rule(degree=-1)
+
+    def test_integrate_on_boundary(self) -> None:
+        coordinates, _, boundary = get_refined_square_mesh(n_refinements=2)
+
+        def f(x: np.ndarray) -> np.ndarray:
+            return x[:, 0]**2
+
+        for batched in [False, True]:
+            self.assertAlmostEqual(
+                integrate_on_boundary(
+                    f=f, coordinates=coordinates, boundary=boundary,
+                    degree=2, batched=batched),
+                5./3.)
+            on_edges = integrate_on_boundary(
+                f=f, coordinates=coordinates, boundary=boundary,
+                degree=2, elementwise=True, batched=batched)
+            self.assertEqual(on_edges.shape, (boundary.shape[0],))
+            self.assertAlmostEqual(np.sum(on_edges), 5./3.)
+
+        # divergence theorem, i.e. int_{boundary} x.n = 2 |domain|
+        normals = get_unit_normals(coordinates=coordinates, edges=boundary)
+        fluxes = integrate_on_boundary(
+            f=lambda x: x, coordinates=coordinates, boundary=boundary,
+            degree=1, elementwise=True, batched=True)
+        self.assertEqual(fluxes.shape, (boundary.shape[0], 2))
+        self.assertAlmostEqual(np.sum(fluxes * normals), 2.)
+
+    def test_interior_edges(self) -> None:
+        coordinates, elements, boundary = get_refined_square_mesh(
+            n_refinements=2)
+        interior_edges, adjacent_elements = get_interior_edges(
+            elements=elements)
+        n_interior_edges = (3 * elements.shape[0] - boundary.shape[0]) // 2
+        self.assertEqual(interior_edges.shape, (n_interior_edges, 2))
+
+        for edge, (left, right) in zip(interior_edges, adjacent_elements):
+            self.assertNotEqual(left, right)
+            for element in [left, right]:
+                self.assertTrue(set(edge).issubset(elements[element]))
+
+        # squared jumps of a piecewise constant function
+        np.random.seed(42)
+        piecewise_constant = np.random.rand(elements.shape[0])
+
+        def squared_jump(x: np.ndarray,
+                         left_elements: np.ndarray,
+                         right_elements: np.ndarray) -> np.ndarray:
+            return (piecewise_constant[left_elements]
+                    - piecewise_constant[right_elements])**2
+
+        lengths = np.linalg.norm(
+            coordinates[interior_edges[:, 1]]
+            - coordinates[interior_edges[:, 0]], axis=1)
+        expected = lengths * (
+            piecewise_constant[adjacent_elements[:, 0]]
+            - piecewise_constant[adjacent_elements[:, 1]])**2
+        for batched in [False, True]:
+            self.assertTrue(np.allclose(
+                integrate_on_interior_edges(
+                    f=squared_jump, coordinates=coordinates,
+                    elements=elements, degree=0,
+                    elementwise=True, batched=batched),
+                expected))
+            self.assertAlmostEqual(
+                integrate_on_interior_edges(
+                    f=squared_jump, coordinates=coordinates,
+                    elements=elements, degree=0, batched=batched),
+                np.sum(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
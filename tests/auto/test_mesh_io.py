@@ -0,0 +1,100 @@
+import unittest
+import tempfile
+import numpy as np
+from pathlib import Path
+from p1afempy.io_helpers import read_mesh, read_boundary_condition
+from p1afempy.refinement import refineNVB
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.integrate import integrate_on_mesh
+from triangle_cubature.mesh_io import convert_mesh_to_npy
+from triangle_cubature.mesh_io import convert_dat_to_npy
+from triangle_cubature.mesh_io import read_mesh_memmap
+from triangle_cubature.mesh_io import integrate_on_mesh_from_files
+from dev_tools.polynomials import get_random_polynomial
+
+
+class TestMeshIO(unittest.TestCase):
+    def test_convert_mesh_to_npy(self) -> None:
+        base_path = Path('tests/data/simple_square_mesh/')
+        path_to_coordinates = base_path / Path('coordinates.dat')
+        path_to_elements = base_path / Path('elements.dat')
+        coordinates, elements = read_mesh(
+            path_to_coordinates=path_to_coordinates,
+            path_to_elements=path_to_elements)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path_to_coordinates_npy, path_to_elements_npy = \
+                convert_mesh_to_npy(
+                    path_to_coordinates=path_to_coordinates,
+                    path_to_elements=path_to_elements,
+                    output_directory=Path(tmp),
+                    chunk_size=3)
+            mapped_coordinates, mapped_elements = read_mesh_memmap(
+                path_to_coordinates=path_to_coordinates_npy,
+                path_to_elements=path_to_elements_npy)
+
+            self.assertIsInstance(mapped_coordinates, np.memmap)
+            self.assertIsInstance(mapped_elements, np.memmap)
+            self.assertTrue(np.array_equal(coordinates, mapped_coordinates))
+            self.assertTrue(np.array_equal(elements, mapped_elements))
+            del mapped_coordinates, mapped_elements
+
+    def test_shift_indices(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path_to_dat = Path(tmp) / Path('elements.dat')
+            path_to_npy = Path(tmp) / Path('elements.npy')
+            path_to_dat.write_text('1 2 3\n\n1 3 4\n')
+            convert_dat_to_npy(
+                path_to_dat=path_to_dat,
+                path_to_npy=path_to_npy,
+                dtype=np.int64,
+                shift_indices=True)
+            self.assertTrue(np.array_equal(
+                np.load(path_to_npy), np.array([[0, 1, 2], [0, 2, 3]])))
+
+    def test_integrate_on_mesh_from_files(self) -> None:
+        base_path = Path('tests/data/simple_square_mesh/')
+        coordinates, elements = read_mesh(
+            path_to_coordinates=base_path / Path('coordinates.dat'),
+            path_to_elements=base_path / Path('elements.dat'))
+        boundaries = [read_boundary_condition(
+            path_to_boundary=base_path / Path('boundary.dat'))]
+        for _ in range(3):
+            coordinates, elements, boundaries, _ = refineNVB(
+                coordinates=coordinates,
+                elements=elements,
+                marked_elements=np.arange(elements.shape[0]),
+                boundary_conditions=boundaries)
+
+        np.random.seed(42)
+        polynomial = get_random_polynomial(degree=6)
+        cubature_rule = CubatureRuleEnum.DAYTAYLOR
+        expected = integrate_on_mesh(
+            f=polynomial.eval_at,
+            coordinates=coordinates,
+            elements=elements,
+            cubature_rule=cubature_rule)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path_to_coordinates = Path(tmp) / Path('coordinates.dat')
+            path_to_elements = Path(tmp) / Path('elements.dat')
+            np.savetxt(path_to_coordinates, coordinates, fmt='%.17g')
+            np.savetxt(path_to_elements, elements, fmt='%d')
+
+            path_to_coordinates_npy, path_to_elements_npy = \
+                convert_mesh_to_npy(
+                    path_to_coordinates=path_to_coordinates,
+                    path_to_elements=path_to_elements,
+                    output_directory=Path(tmp) / Path('npy'),
+                    chunk_size=10)
+            calculated = integrate_on_mesh_from_files(
+                f=polynomial.eval_at,
+                path_to_coordinates=path_to_coordinates_npy,
+                path_to_elements=path_to_elements_npy,
+                cubature_rule=cubature_rule,
+                chunk_size=7)
+        self.assertAlmostEqual(expected, calculated)
+
+
+if __name__ == '__main__':
+    unittest.main()
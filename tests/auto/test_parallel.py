@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.integrate import integrate_on_mesh
+from triangle_cubature.parallel import integrate_on_mesh_parallel
+from test_integrate import get_random_mesh
+
+
+def pure_python_function(coordinates: np.ndarray) -> np.ndarray:
+    return np.array([x**2 - x*y + 3.*y for x, y in coordinates])
+
+
+class TestParallel(unittest.TestCase):
+    def test_integrate_on_mesh_parallel(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=200)
+        cubature_rule = CubatureRuleEnum.SMPLX1
+
+        expected = integrate_on_mesh(
+            f=pure_python_function,
+            coordinates=coordinates,
+            elements=elements,
+            cubature_rule=cubature_rule)
+
+        results = []
+        for backend in ['thread', 'process']:
+            for n_workers in [1, 2, 3]:
+                results.append(integrate_on_mesh_parallel(
+                    f=pure_python_function,
+                    coordinates=coordinates,
+                    elements=elements,
+                    cubature_rule=cubature_rule,
+                    n_workers=n_workers,
+                    backend=backend,
+                    partition_size=33))
+        self.assertAlmostEqual(expected, results[0])
+        # bitwise reproducible regardless of workers and backend
+        for result in results:
+            self.assertEqual(results[0], result)
+
+    def test_batched_vector_valued(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=50)
+        cubature_rule = CubatureRuleEnum.DAYTAYLOR
+
+        def f(points: np.ndarray) -> np.ndarray:
+            return np.column_stack([np.sin(points[:, 0]), points[:, 1]])
+
+        expected = integrate_on_mesh(
+            f=f,
+            coordinates=coordinates,
+            elements=elements,
+            cubature_rule=cubature_rule)
+        calculated = integrate_on_mesh_parallel(
+            f=f,
+            coordinates=coordinates,
+            elements=elements,
+            cubature_rule=cubature_rule,
+            n_workers=4,
+            partition_size=8,
+            batched=True)
+        self.assertTrue(np.allclose(expected, calculated))
+
+    def test_invalid_arguments(self) -> None:
+        coordinates, elements = get_random_mesh(n_elements=5)
+        with self.assertRaises(ValueError):
+            integrate_on_mesh_parallel(
+                f=pure_python_function,
+                coordinates=coordinates,
+                elements=elements,
+                cubature_rule=CubatureRuleEnum.MIDPOINT,
+                backend='gpu')
+        with self.assertRaises(ValueError):
+            integrate_on_mesh_parallel(
+                f=pure_python_function,
+                coordinates=coordinates,
+                elements=elements,
+                cubature_rule=CubatureRuleEnum.MIDPOINT,
+                partition_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
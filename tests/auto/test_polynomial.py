@@ -5,6 +5,9 @@ from dev_tools.polynomials import get_random_polynomial
 from dev_tools.utils import generate_random_triangle
 import numpy as np
 from tqdm import tqdm
+from triangle_cubature.polynomials import Polynomial as ArrayPolynomial
+from triangle_cubature.polynomials import integrate_monomials_on_mesh
+from test_integrate import get_random_mesh
 
 
 class TestPolynomial(unittest.TestCase):
@@ -160,6 +163,82 @@ class TestPolynomial(unittest.TestCase):
 
             self.assertAlmostEqual(integral_by_hand, integral_sympy)
 
+    def test_eval_at_against_monomials(self) -> None:
+        np.random.seed(42)
+        coordinates = np.random.uniform(-2., 2., size=(100, 2))
+        for degree in range(11):
+            polynomial = get_random_polynomial(degree=degree)
+            expected = np.zeros(coordinates.shape[0])
+            for monomial in polynomial.monomials:
+                expected += monomial.eval_at(coordinates=coordinates)
+            computed = polynomial.to_array_polynomial().eval_at(
+                coordinates=coordinates)
+            self.assertEqual(computed.shape, (coordinates.shape[0],))
+            self.assertTrue(np.allclose(computed, expected))
+
+    def test_batch(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=20)
+        k = 4
+        x_exponents = np.array([0, 1, 0, 2, 1, 3])
+        y_exponents = np.array([0, 0, 1, 0, 2, 1])
+        coefficients = np.random.rand(x_exponents.shape[0], k)
+        batch = ArrayPolynomial(
+            x_exponents=x_exponents,
+            y_exponents=y_exponents,
+            coefficients=coefficients)
+
+        values = batch.eval_at(coordinates=coordinates)
+        integrals = batch.integrate_on_mesh(
+            coordinates=coordinates, elements=elements)
+        self.assertEqual(values.shape, (coordinates.shape[0], k))
+        self.assertEqual(integrals.shape, (k,))
+        for j in range(k):
+            single = ArrayPolynomial(
+                x_exponents=x_exponents,
+                y_exponents=y_exponents,
+                coefficients=coefficients[:, j])
+            self.assertTrue(np.allclose(
+                values[:, j], single.eval_at(coordinates=coordinates)))
+            self.assertAlmostEqual(
+                integrals[j],
+                integrate_monomials_on_mesh(
+                    x_exponents=x_exponents,
+                    y_exponents=y_exponents,
+                    coefficients=coefficients[:, j],
+                    coordinates=coordinates,
+                    elements=elements))
+
+    def test_repeated_monomials(self) -> None:
+        # p(x, y) = 1 + x*y + 2*x*y = 1 + 3xy
+        polynomial = ArrayPolynomial(
+            x_exponents=[0, 1, 1],
+            y_exponents=[0, 1, 1],
+            coefficients=[1., 1., 2.])
+        self.assertEqual(polynomial.degree, 2)
+        self.assertEqual(polynomial.coefficient_matrix[1, 1], 3.)
+        coordinates = np.array([[2., 3.], [-1., 0.5]])
+        self.assertTrue(np.allclose(
+            polynomial.eval_at(coordinates=coordinates),
+            [19., -0.5]))
+
+    def test_invalid_input(self) -> None:
+        with self.assertRaises(ValueError):
+            ArrayPolynomial(x_exponents=[0, 1], y_exponents=[0],
+                            coefficients=[1., 1.])
+        with self.assertRaises(ValueError):
+            ArrayPolynomial(x_exponents=[-1], y_exponents=[0],
+                            coefficients=[1.])
+
+    def test_equality_and_hash(self) -> None:
+        p = ArrayPolynomial(x_exponents=[0, 1], y_exponents=[0, 1],
+                            coefficients=[1., 2.])
+        q = ArrayPolynomial(x_exponents=[0, 1], y_exponents=[0, 1],
+                            coefficients=[1., 2.])
+        self.assertEqual(p, p)
+        self.assertNotEqual(p, q)
+        self.assertEqual(len({p, q}), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
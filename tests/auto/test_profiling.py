@@ -0,0 +1,95 @@
+import unittest
+import numpy as np
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.integrate import integrate_on_mesh
+from triangle_cubature.integrate import integrate_on_mesh_elementwise
+from triangle_cubature.integrate import integrate_on_triangle
+from triangle_cubature.profiling import IntegrationProfile
+from triangle_cubature.profiling import profile_integration
+from triangle_cubature.rule_factory import get_rule
+from test_integrate import get_random_mesh
+
+
+class TestProfiling(unittest.TestCase):
+    def test_counts_and_phases(self) -> None:
+        np.random.seed(42)
+        n_elements = 20
+        coordinates, elements = get_random_mesh(n_elements=n_elements)
+        rule = CubatureRuleEnum.DAYTAYLOR
+        waip = get_rule(rule=rule).weights_and_integration_points
+        n_qp = waip.weights.shape[0]
+
+        def f(x: np.ndarray) -> np.ndarray:
+            return np.sin(x[:, 0]) * x[:, 1]
+
+        for batched, n_function_calls in [(False, n_qp), (True, 1)]:
+            with profile_integration() as profile:
+                integral = integrate_on_mesh(
+                    f=f, coordinates=coordinates, elements=elements,
+                    cubature_rule=rule, batched=batched)
+            self.assertEqual(profile.n_function_calls, n_function_calls)
+            self.assertEqual(profile.n_points, n_qp * n_elements)
+            self.assertEqual(
+                set(profile.timings),
+                {'geometry', 'points', 'evaluation', 'reduction'})
+            self.assertTrue(all(
+                timing >= 0. for timing in profile.timings.values()))
+            # at least the integration points and the values of f
+            self.assertGreaterEqual(
+                profile.bytes_allocated, 3 * n_qp * n_elements * 8)
+            # profiling does not change the result
+            self.assertEqual(
+                integral,
+                integrate_on_mesh(
+                    f=f, coordinates=coordinates, elements=elements,
+                    cubature_rule=rule, batched=batched))
+
+        for accumulation in ['pairwise', 'kahan']:
+            with profile_integration():
+                integral = integrate_on_mesh(
+                    f=f, coordinates=coordinates, elements=elements,
+                    cubature_rule=rule, accumulation=accumulation)
+            self.assertEqual(
+                integral,
+                integrate_on_mesh(
+                    f=f, coordinates=coordinates, elements=elements,
+                    cubature_rule=rule, accumulation=accumulation))
+
+        with profile_integration() as profile:
+            integrate_on_triangle(
+                f=f, triangle=coordinates[elements[0]], cubature_rule=rule)
+            integrate_on_mesh_elementwise(
+                f=f, coordinates=coordinates, elements=elements,
+                cubature_rule=rule, batched=True)
+        self.assertEqual(profile.n_function_calls, 2)
+        self.assertEqual(profile.n_points, n_qp * (n_elements + 1))
+
+    def test_scoping_and_callback(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=5)
+        received_profiles = []
+
+        def integrate() -> None:
+            integrate_on_mesh(
+                f=lambda x: x[:, 0], coordinates=coordinates,
+                elements=elements, cubature_rule=CubatureRuleEnum.MIDPOINT)
+
+        with profile_integration(
+                callback=received_profiles.append) as outer_profile:
+            integrate()
+            with profile_integration() as inner_profile:
+                integrate()
+                integrate()
+            integrate()
+        # not recorded
+        integrate()
+
+        self.assertEqual(outer_profile.n_function_calls, 2)
+        self.assertEqual(inner_profile.n_function_calls, 2)
+        self.assertEqual(len(received_profiles), 1)
+        self.assertIs(received_profiles[0], outer_profile)
+        self.assertIsInstance(outer_profile, IntegrationProfile)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import dataclasses
+import numpy as np
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.rule_factory import get_rule
+from triangle_cubature.rule_factory import get_gauss_jacobi_rule
+from triangle_cubature.rule_factory import get_rule_by_degree
+from math import factorial
+
+
+def get_max_moment_error(weights: np.ndarray,
+                         integration_points: np.ndarray,
+                         degree: int) -> float:
+    """
+    returns the maximal error of the rule integrating the monomials
+    x^i y^j, i+j <= degree, over the reference triangle, where
+    the exact integral is i! j! / (i+j+2)!
+    """
+    x = integration_points[:, 0]
+    y = integration_points[:, 1]
+    max_error = 0.
+    for i in range(degree + 1):
+        for j in range(degree - i + 1):
+            exact = factorial(i) * factorial(j) / factorial(i + j + 2)
+            max_error = max(max_error, abs(
+                np.dot(weights, x**i * y**j) - exact))
+    return max_error
+
+
+class TestRuleFactory(unittest.TestCase):
+    def test_rules_are_shared(self) -> None:
+        for cubature_rule in CubatureRuleEnum:
+            self.assertIs(get_rule(cubature_rule), get_rule(cubature_rule))
+
+    def test_rules_are_immutable(self) -> None:
+        for cubature_rule in CubatureRuleEnum:
+            rule = get_rule(cubature_rule)
+            waip = rule.weights_and_integration_points
+
+            with self.assertRaises(dataclasses.FrozenInstanceError):
+                rule.degree_of_exactness = 42
+            with self.assertRaises(dataclasses.FrozenInstanceError):
+                waip.weights = np.zeros_like(waip.weights)
+            with self.assertRaises(ValueError):
+                waip.weights[0] = 42.
+            with self.assertRaises(ValueError):
+                waip.integration_points[0, 0] = 42.
+
+    def test_weights_sum_to_reference_area(self) -> None:
+        for cubature_rule in CubatureRuleEnum:
+            waip = get_rule(cubature_rule).weights_and_integration_points
+            self.assertAlmostEqual(np.sum(waip.weights), 0.5)
+
+    def test_unknown_rule(self) -> None:
+        with self.assertRaises(ValueError):
+            get_rule('not-a-rule')
+
+    def test_degree_of_exactness(self) -> None:
+        for cubature_rule in CubatureRuleEnum:
+            rule = get_rule(cubature_rule)
+            waip = rule.weights_and_integration_points
+            self.assertLess(get_max_moment_error(
+                weights=waip.weights,
+                integration_points=waip.integration_points,
+                degree=rule.degree_of_exactness), 1e-15)
+            # all integration points are in the closed reference triangle
+            x = waip.integration_points[:, 0]
+            y = waip.integration_points[:, 1]
+            self.assertTrue(np.all(x >= 0.))
+            self.assertTrue(np.all(y >= 0.))
+            self.assertTrue(np.all(x + y <= 1.))
+
+    def test_gauss_jacobi_rules(self) -> None:
+        for degree in range(21):
+            rule = get_gauss_jacobi_rule(degree=degree)
+            waip = rule.weights_and_integration_points
+            n = degree // 2 + 1
+            self.assertEqual(waip.weights.shape, (n**2,))
+            self.assertGreaterEqual(rule.degree_of_exactness, degree)
+            self.assertLess(get_max_moment_error(
+                weights=waip.weights,
+                integration_points=waip.integration_points,
+                degree=rule.degree_of_exactness), 1e-14)
+            self.assertTrue(np.all(waip.weights > 0.))
+            self.assertIs(rule, get_gauss_jacobi_rule(degree=degree))
+            with self.assertRaises(ValueError):
+                waip.weights[0] = 42.
+
+        with self.assertRaises(ValueError):
+            get_gauss_jacobi_rule(degree=-1)
+
+    def test_get_rule_by_degree(self) -> None:
+        def n_points(rule) -> int:
+            return rule.weights_and_integration_points.weights.shape[0]
+
+        for degree in range(21):
+            rule = get_rule_by_degree(degree=degree)
+            self.assertGreaterEqual(rule.degree_of_exactness, degree)
+            self.assertIs(rule, get_rule(degree))
+            self.assertIs(rule, get_rule(np.int64(degree)))
+
+            # no other candidate needs less integration points
+            candidates = [get_rule(r) for r in CubatureRuleEnum] + [
+                get_gauss_jacobi_rule(degree=degree)]
+            for candidate in candidates:
+                if candidate.degree_of_exactness >= degree:
+                    self.assertLessEqual(n_points(rule), n_points(candidate))
+
+        self.assertIs(get_rule_by_degree(degree=6),
+                      get_rule(CubatureRuleEnum.DAYTAYLOR))
+        with self.assertRaises(ValueError):
+            get_rule_by_degree(degree=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import numpy as np
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.integrate import integrate_on_mesh
+from triangle_cubature.streaming import integrate_on_mesh_in_chunks
+from triangle_cubature.streaming import integrate_on_element_blocks
+from triangle_cubature.streaming import iterate_element_blocks
+from dev_tools.polynomials import get_random_polynomial
+from test_integrate import get_random_mesh
+
+
+class TestStreaming(unittest.TestCase):
+    def test_iterate_element_blocks(self) -> None:
+        elements = np.arange(30).reshape(10, 3)
+        blocks = list(iterate_element_blocks(elements=elements, chunk_size=4))
+        self.assertEqual([block.shape[0] for block in blocks], [4, 4, 2])
+        for block in blocks:
+            self.assertTrue(np.shares_memory(block, elements))
+        self.assertTrue(np.array_equal(np.vstack(blocks), elements))
+
+        with self.assertRaises(ValueError):
+            list(iterate_element_blocks(elements=elements, chunk_size=0))
+
+    def test_integrate_on_mesh_in_chunks(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=50)
+
+        for cubature_rule in CubatureRuleEnum:
+            polynomial = get_random_polynomial(degree=3)
+            expected = integrate_on_mesh(
+                f=polynomial.eval_at,
+                coordinates=coordinates,
+                elements=elements,
+                cubature_rule=cubature_rule)
+            for chunk_size in [1, 7, 50, 1000]:
+                for batched in [False, True]:
+                    calculated = integrate_on_mesh_in_chunks(
+                        f=polynomial.eval_at,
+                        coordinates=coordinates,
+                        elements=elements,
+                        cubature_rule=cubature_rule,
+                        chunk_size=chunk_size,
+                        batched=batched)
+                    self.assertAlmostEqual(expected, calculated)
+
+    def test_integrate_on_element_blocks(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=50)
+        cubature_rule = CubatureRuleEnum.DAYTAYLOR
+        n_points_per_call = []
+
+        def f(points: np.ndarray) -> np.ndarray:
+            n_points_per_call.append(points.shape[0])
+            return np.column_stack([np.ones(points.shape[0]), points])
+
+        def generate_blocks():
+            yield elements[:20]
+            yield elements[20:45]
+            yield elements[45:]
+
+        calculated = integrate_on_element_blocks(
+            f=f,
+            coordinates=coordinates,
+            element_blocks=generate_blocks(),
+            cubature_rule=cubature_rule,
+            batched=True)
+        self.assertEqual(n_points_per_call, [11 * 20, 11 * 25, 11 * 5])
+        expected = integrate_on_mesh(
+            f=f,
+            coordinates=coordinates,
+            elements=elements,
+            cubature_rule=cubature_rule)
+        self.assertTrue(np.allclose(expected, calculated))
+
+        # an empty stream keeps the shape of the values of f
+        for batched in [False, True]:
+            calculated = integrate_on_element_blocks(
+                f=f,
+                coordinates=coordinates,
+                element_blocks=iter([]),
+                cubature_rule=cubature_rule,
+                batched=batched)
+            self.assertEqual(np.shape(calculated), (3,))
+            self.assertTrue(np.all(calculated == 0.))
+
+
+if __name__ == '__main__':
+    unittest.main()
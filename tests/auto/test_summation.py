@@ -0,0 +1,69 @@
+import unittest
+import math
+import numpy as np
+from triangle_cubature.summation import CompensatedSum
+from triangle_cubature.summation import compensated_sum
+
+
+class TestCompensatedSum(unittest.TestCase):
+    def test_scalar_summation(self) -> None:
+        np.random.seed(42)
+        values = np.random.uniform(-1., 1., 1000) * 10.**np.random.randint(
+            -8, 8, 1000)
+
+        total = CompensatedSum()
+        for value in values:
+            total.add(value)
+        self.assertEqual(total.value, math.fsum(values))
+        self.assertEqual(np.ndim(total.value), 0)
+
+    def test_ill_conditioned_summation(self) -> None:
+        total = CompensatedSum()
+        for value in [1., 1e100, 1., -1e100]:
+            total.add(value)
+        self.assertEqual(total.value, 2.)
+
+    def test_array_summation(self) -> None:
+        np.random.seed(42)
+        values = np.random.uniform(-1., 1., (100, 3))
+
+        total = CompensatedSum()
+        for value in values:
+            total.add(value)
+        self.assertEqual(total.value.shape, (3,))
+        for k in range(3):
+            self.assertEqual(total.value[k], math.fsum(values[:, k]))
+
+    def test_empty_summation(self) -> None:
+        self.assertEqual(CompensatedSum().value, 0.)
+
+    def test_single_precision(self) -> None:
+        total = CompensatedSum(dtype=np.float32)
+        for value in [1., 1e-8, 1e-8, -1.]:
+            total.add(value)
+        self.assertEqual(total.value.dtype, np.float32)
+        self.assertAlmostEqual(total.value, 2e-8, delta=1e-15)
+
+    def test_vectorized_compensated_sum(self) -> None:
+        np.random.seed(42)
+        for n in [0, 1, 7, 1000, 12345]:
+            values = np.random.uniform(-1., 1., n) * 10.**np.random.randint(
+                -8, 8, n)
+            self.assertEqual(compensated_sum(values), math.fsum(values))
+
+            values_32 = values.astype(np.float32)
+            total = compensated_sum(values_32)
+            self.assertEqual(total.dtype, np.float32)
+            self.assertLessEqual(
+                abs(total - math.fsum(values_32.astype(np.float64))),
+                np.finfo(np.float32).eps * np.sum(np.abs(values_32)))
+
+        values = np.random.uniform(-1., 1., (1000, 3))
+        total = compensated_sum(values)
+        self.assertEqual(total.shape, (3,))
+        for k in range(3):
+            self.assertEqual(total[k], math.fsum(values[:, k]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,17 @@
 import unittest
 from triangle_cubature.transformations \
     import transform_weights, transform_integration_points, get_jacobian, \
-    transform_weights_and_integration_points
+    transform_weights_and_integration_points, get_jacobians, \
+    get_jacobian_determinants, transform_weights_batched, \
+    transform_integration_points_batched, \
+    transform_weights_and_integration_points_batched, \
+    get_physical_triangles
 import numpy as np
 from triangle_cubature.cubature_rule \
     import WeightsAndIntegrationPoints
 from dev_tools.utils import generate_random_triangle
+from triangle_cubature.rule_factory import get_rule
+from triangle_cubature.cubature_rule import CubatureRuleEnum
 
 
 class TestTransformations(unittest.TestCase):
@@ -96,6 +102,66 @@ class TestTransformations(unittest.TestCase):
                 expected_jacobian, calculated_jacobian
             ))
 
+    def test_batched_transformations(self):
+        np.random.seed(42)
+        n_triangles = 50
+        physical_triangles = np.array([
+            generate_random_triangle() for _ in range(n_triangles)])
+        waip = get_rule(
+            CubatureRuleEnum.DAYTAYLOR).weights_and_integration_points
+
+        jacobians = get_jacobians(physical_triangles=physical_triangles)
+        determinants = get_jacobian_determinants(jacobians=jacobians)
+        weights = transform_weights_batched(
+            reference_weights=waip.weights, jacobians=jacobians)
+        points = transform_integration_points_batched(
+            reference_integration_points=waip.integration_points,
+            p1=physical_triangles[:, 0, :],
+            jacobians=jacobians)
+        transformed = transform_weights_and_integration_points_batched(
+            weights_and_integration_points=waip,
+            physical_triangles=physical_triangles)
+
+        self.assertEqual(jacobians.shape, (n_triangles, 2, 2))
+        self.assertEqual(determinants.shape, (n_triangles,))
+        self.assertEqual(weights.shape, (n_triangles, 11))
+        self.assertEqual(points.shape, (n_triangles, 11, 2))
+
+        for k, physical_triangle in enumerate(physical_triangles):
+            jacobian = get_jacobian(physical_triangle=physical_triangle)
+            expected = transform_weights_and_integration_points(
+                weights_and_integration_points=waip,
+                physical_triangle=physical_triangle)
+            self.assertTrue(np.allclose(jacobian, jacobians[k]))
+            self.assertAlmostEqual(np.linalg.det(jacobian), determinants[k])
+            self.assertTrue(np.allclose(expected.weights, weights[k]))
+            self.assertTrue(np.allclose(
+                expected.integration_points, points[k]))
+            self.assertTrue(np.allclose(
+                expected.weights, transformed.weights[k]))
+            self.assertTrue(np.allclose(
+                expected.integration_points,
+                transformed.integration_points[k]))
+
+    def test_get_physical_triangles(self):
+        coordinates = np.array([
+            [0., 0.],
+            [1., 0.],
+            [1., 1.],
+            [0., 1.]
+        ])
+        elements = np.array([
+            [0, 1, 2],
+            [0, 2, 3]
+        ])
+        physical_triangles = get_physical_triangles(
+            coordinates=coordinates, elements=elements)
+        self.assertTrue(np.allclose(
+            physical_triangles[1], coordinates[[0, 2, 3]]))
+        self.assertTrue(np.allclose(
+            get_jacobian_determinants(get_jacobians(physical_triangles)),
+            np.ones(2)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,148 @@
+import unittest
+import tracemalloc
+import numpy as np
+from triangle_cubature.cubature_rule import CubatureRuleEnum
+from triangle_cubature.integrate import integrate_on_mesh
+from triangle_cubature.workspace import IntegrationWorkspace
+from test_integrate import get_random_mesh
+
+
+def integrand(x: np.ndarray) -> np.ndarray:
+    return np.sin(x[:, 0]) * np.exp(x[:, 1])
+
+
+class TestIntegrationWorkspace(unittest.TestCase):
+    def test_buffer_reuse(self) -> None:
+        workspace = IntegrationWorkspace()
+        buffer = workspace.get_buffer('a', (10, 2), np.float64)
+        self.assertEqual(buffer.shape, (10, 2))
+        self.assertEqual(workspace.nbytes, 160)
+
+        # smaller arrays of the same type share the memory
+        smaller = workspace.get_buffer('a', (3, 2), np.float64)
+        self.assertTrue(np.shares_memory(buffer, smaller))
+        self.assertEqual(workspace.nbytes, 160)
+
+        # larger arrays or other types replace the buffer
+        larger = workspace.get_buffer('a', (20, 2), np.float64)
+        self.assertFalse(np.shares_memory(buffer, larger))
+        self.assertEqual(workspace.nbytes, 320)
+        single = workspace.get_buffer('a', (20, 2), np.float32)
+        self.assertEqual(single.dtype, np.float32)
+        self.assertEqual(workspace.nbytes, 160)
+
+        workspace.clear()
+        self.assertEqual(workspace.nbytes, 0)
+
+    def test_integrate_on_mesh(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=1000)
+        marked_elements = np.random.rand(1000) < 0.3
+        workspace = IntegrationWorkspace()
+
+        for rule in [CubatureRuleEnum.MIDPOINT, CubatureRuleEnum.DAYTAYLOR]:
+            for batched in [False, True]:
+                for marked in [None, marked_elements,
+                               np.flatnonzero(marked_elements)]:
+                    for accumulation in ['naive', 'pairwise']:
+                        kwargs = dict(
+                            f=integrand, coordinates=coordinates,
+                            elements=elements, cubature_rule=rule,
+                            batched=batched, marked_elements=marked,
+                            accumulation=accumulation)
+                        self.assertEqual(
+                            integrate_on_mesh(**kwargs, workspace=workspace),
+                            integrate_on_mesh(**kwargs))
+
+    def test_vector_valued_integrand(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=100)
+        workspace = IntegrationWorkspace()
+
+        for batched in [False, True]:
+            kwargs = dict(
+                f=lambda x: x**2, coordinates=coordinates,
+                elements=elements,
+                cubature_rule=CubatureRuleEnum.DAYTAYLOR,
+                batched=batched, batch_size=30)
+            np.testing.assert_array_equal(
+                integrate_on_mesh(**kwargs, workspace=workspace),
+                integrate_on_mesh(**kwargs))
+
+    def test_single_precision(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=100)
+        workspace = IntegrationWorkspace()
+
+        for batched in [False, True]:
+            kwargs = dict(
+                f=integrand, coordinates=coordinates, elements=elements,
+                cubature_rule=CubatureRuleEnum.DAYTAYLOR,
+                batched=batched, dtype=np.float32,
+                accumulation='pairwise')
+            integral = integrate_on_mesh(**kwargs, workspace=workspace)
+            reference = integrate_on_mesh(**kwargs)
+            self.assertEqual(integral.dtype, reference.dtype)
+            self.assertEqual(integral, reference)
+
+    def test_integer_coordinates(self) -> None:
+        coordinates = np.array([[0, 0], [1, 0], [0, 1]])
+        elements = np.array([[0, 1, 2]])
+
+        for batched in [False, True]:
+            kwargs = dict(
+                f=lambda x: np.ones(x.shape[0]), coordinates=coordinates,
+                elements=elements, cubature_rule=CubatureRuleEnum.DAYTAYLOR,
+                batched=batched)
+            self.assertAlmostEqual(
+                integrate_on_mesh(**kwargs, workspace=IntegrationWorkspace()),
+                integrate_on_mesh(**kwargs))
+            self.assertAlmostEqual(integrate_on_mesh(**kwargs), 0.5)
+
+    def test_invalid_indices(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=3)
+        invalid_vertex = elements.copy()
+        invalid_vertex[1, 2] = 12
+
+        for batched in [False, True]:
+            for workspace in [None, IntegrationWorkspace()]:
+                kwargs = dict(
+                    f=integrand, coordinates=coordinates,
+                    cubature_rule=CubatureRuleEnum.DAYTAYLOR,
+                    batched=batched, workspace=workspace)
+                with self.assertRaises(IndexError):
+                    integrate_on_mesh(
+                        elements=elements,
+                        marked_elements=np.array([0, 4]), **kwargs)
+                with self.assertRaises(IndexError):
+                    integrate_on_mesh(
+                        elements=elements,
+                        marked_elements=np.array([True, False]), **kwargs)
+                with self.assertRaises(IndexError):
+                    integrate_on_mesh(elements=invalid_vertex, **kwargs)
+
+    def test_no_large_allocations(self) -> None:
+        np.random.seed(42)
+        coordinates, elements = get_random_mesh(n_elements=10_000)
+        workspace = IntegrationWorkspace()
+
+        for batched in [False, True]:
+            kwargs = dict(
+                # returns a view, i.e. f does not allocate either
+                f=lambda x: x[:, 0], coordinates=coordinates,
+                elements=elements,
+                cubature_rule=CubatureRuleEnum.DAYTAYLOR,
+                batched=batched, workspace=workspace)
+            integrate_on_mesh(**kwargs)
+
+            tracemalloc.start()
+            integrate_on_mesh(**kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            # far less than a single array of 10^4 doubles
+            self.assertLess(peak, 10_000)
+
+
+if __name__ == '__main__':
+    unittest.main()